@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Batch File Processor
+Runs the file_handling_challenge transform over whole directories of small files:
+1. asyncio keeps a bounded number of files in flight at once
+2. Blocking file I/O runs in a thread pool so opens/reads overlap
+3. Outputs are written in batches to cut the per-file write overhead
+4. A sequential loop is kept as a baseline to measure the speedup against
+"""
+
+import argparse
+import asyncio
+import bz2
+import gzip
+import lzma
+import os
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from file_handling_challenge import (
+    SNIFF_SIZE,
+    BinaryFileError,
+    build_output_filename,
+    choose_decoding,
+    compression_from_signature,
+    modify_content,
+)
+
+DEFAULT_MAX_IN_FLIGHT = 64  # Files being read/transformed at the same time
+DEFAULT_WRITE_BATCH = 32  # Outputs written per thread-pool call
+DEFAULT_FILES_PER_TASK = 8  # Files read/transformed per thread-pool call
+
+DECOMPRESSORS = {"gzip": gzip.decompress, "bz2": bz2.decompress, "xz": lzma.decompress}
+COMPRESSORS = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+# Per-file problems that are recorded instead of stopping the batch
+FILE_ERRORS = (OSError, EOFError, zlib.error, lzma.LZMAError, UnicodeDecodeError, BinaryFileError)
+
+def find_input_files(directory):
+    """List every file below a directory, in a stable order"""
+    files = []
+    for root, dirs, names in os.walk(directory):
+        dirs.sort()
+        files.extend(os.path.join(root, name) for name in sorted(names))
+    return files
+
+def output_path_for(filename, input_dir, output_dir, codec=None, keep_compressed=False):
+    """Mirror an input file's place in the tree under the output directory"""
+    relative = Path(filename).relative_to(input_dir)
+    return str(Path(output_dir) / relative.parent / build_output_filename(relative.name, codec, keep_compressed))
+
+def transform_bytes(data, keep_compressed=False, mode="auto"):
+    """
+    Transform the raw bytes of one small file in memory
+    - Same rules as process_file(): compression and encoding are detected, output is UTF-8
+    - Returns (output bytes, compression codec, encoding)
+    """
+    codec = compression_from_signature(data[:8])
+    if codec:
+        data = DECOMPRESSORS[codec](data)
+    
+    encoding, errors = choose_decoding(data[:SNIFF_SIZE], mode)
+    text = data.decode(encoding, errors).replace('\r\n', '\n')
+    output = modify_content(text).encode('utf-8', errors)
+    
+    if codec and keep_compressed:
+        output = COMPRESSORS[codec](output)
+    return output, codec, encoding
+
+def read_and_transform(filename, keep_compressed=False, mode="auto"):
+    """Blocking part of a file's work: read it and transform it (runs in the thread pool)"""
+    with open(filename, 'rb') as file:
+        data = file.read()
+    output, codec, encoding = transform_bytes(data, keep_compressed, mode)
+    return output, codec, len(data)
+
+def read_and_transform_group(filenames, keep_compressed=False, mode="auto"):
+    """Read and transform a small group of files in one thread-pool call (errors are returned, not raised)"""
+    results = []
+    for filename in filenames:
+        try:
+            results.append((filename, read_and_transform(filename, keep_compressed, mode), None))
+        except FILE_ERRORS as e:
+            results.append((filename, None, str(e)))
+    return results
+
+def write_outputs(outputs):
+    """Write a batch of (path, bytes) pairs, returning the per-path errors"""
+    errors = {}
+    for path, data in outputs:
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, 'wb') as file:
+                file.write(data)
+        except OSError as e:
+            errors[path] = str(e)
+    return errors
+
+def new_results():
+    """Empty result counters shared by the async and sequential engines"""
+    return {"processed": 0, "failed": {}, "bytes_read": 0, "bytes_written": 0, "seconds": 0.0}
+
+async def process_files_async(filenames, input_dir, output_dir, max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+                              write_batch=DEFAULT_WRITE_BATCH, files_per_task=DEFAULT_FILES_PER_TASK,
+                              keep_compressed=False, mode="auto"):
+    """
+    Process many files concurrently
+    - A semaphore caps the files in flight so memory and open handles stay bounded
+    - Files are handed to the thread pool in small groups to cut the scheduling overhead
+    - Finished outputs are queued and written write_batch at a time; each write takes a
+      semaphore slot too, so finished outputs can't pile up in memory faster than they're written
+    - Files count as processed (and their bytes as read and written) once their output is written
+    """
+    loop = asyncio.get_running_loop()
+    results = new_results()
+    semaphore = asyncio.Semaphore(max(1, max_in_flight // files_per_task))
+    pending_outputs = []
+    write_tasks = []
+    start = time.perf_counter()
+    
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        
+        async def write(batch):
+            try:
+                write_errors = await loop.run_in_executor(
+                    pool, write_outputs, [(path, output) for path, output, _ in batch])
+            finally:
+                semaphore.release()
+            results["failed"].update(write_errors)
+            for path, output, size in batch:
+                if path not in write_errors:
+                    results["processed"] += 1
+                    results["bytes_read"] += size
+                    results["bytes_written"] += len(output)
+        
+        async def flush_outputs():
+            batch = pending_outputs[:]
+            pending_outputs.clear()
+            await semaphore.acquire()  # Released when the batch is written
+            write_tasks.append(asyncio.ensure_future(write(batch)))
+        
+        async def handle(group):
+            async with semaphore:
+                group_results = await loop.run_in_executor(
+                    pool, read_and_transform_group, group, keep_compressed, mode)
+            
+            for filename, result, error in group_results:
+                if error is not None:
+                    results["failed"][filename] = error
+                    continue
+                output, codec, size = result
+                path = output_path_for(filename, input_dir, output_dir, codec, keep_compressed)
+                pending_outputs.append((path, output, size))
+                if len(pending_outputs) >= write_batch:
+                    await flush_outputs()
+        
+        groups = [filenames[i:i + files_per_task] for i in range(0, len(filenames), files_per_task)]
+        await asyncio.gather(*(handle(group) for group in groups))
+        if pending_outputs:
+            await flush_outputs()
+        await asyncio.gather(*write_tasks)
+    
+    results["seconds"] = time.perf_counter() - start
+    return results
+
+def process_files_async_blocking(filenames, input_dir, output_dir, **options):
+    """Run process_files_async() from regular (non-async) code"""
+    return asyncio.run(process_files_async(filenames, input_dir, output_dir, **options))
+
+def process_files_sequential(filenames, input_dir, output_dir, keep_compressed=False, mode="auto"):
+    """Baseline: open, read, transform, write and close one file after another"""
+    results = new_results()
+    start = time.perf_counter()
+    
+    for filename in filenames:
+        try:
+            output, codec, size = read_and_transform(filename, keep_compressed, mode)
+        except FILE_ERRORS as e:
+            results["failed"][filename] = str(e)
+            continue
+        
+        path = output_path_for(filename, input_dir, output_dir, codec, keep_compressed)
+        write_errors = write_outputs([(path, output)])
+        if write_errors:
+            results["failed"].update(write_errors)
+            continue
+        results["processed"] += 1
+        results["bytes_read"] += size
+        results["bytes_written"] += len(output)
+    
+    results["seconds"] = time.perf_counter() - start
+    return results
+
+def print_results(label, results):
+    """Print throughput and failures for one run"""
+    seconds = max(results["seconds"], 1e-9)
+    print(f"📊 {label}: {results['processed']} files in {seconds:.2f}s "
+          f"({results['processed'] / seconds:,.0f} files/s, "
+          f"{results['bytes_read'] / seconds / 1024 / 1024:.2f} MB/s read)")
+    if results["failed"]:
+        print(f"⚠️ {len(results['failed'])} file(s) failed:")
+        for filename, error in list(results["failed"].items())[:10]:
+            print(f"   • {filename}: {error}")
+
+def compare_with_sequential(input_dir, output_dir, **options):
+    """Run the sequential loop and the async engine on the same files and report the speedup"""
+    filenames = find_input_files(input_dir)
+    sequential = process_files_sequential(filenames, input_dir, output_dir,
+                                          options.get("keep_compressed", False), options.get("mode", "auto"))
+    concurrent = process_files_async_blocking(filenames, input_dir, output_dir, **options)
+    
+    print_results("Sequential loop", sequential)
+    print_results("Async engine", concurrent)
+    if concurrent["seconds"] > 0:
+        print(f"🚀 Speedup: {sequential['seconds'] / concurrent['seconds']:.2f}x")
+    return sequential, concurrent
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Modify every file in a directory (uppercase + line numbers)")
+    parser.add_argument("input_dir", help="directory with the files to process")
+    parser.add_argument("output_dir", help="directory for the modified files")
+    parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT,
+                        help="files processed at the same time")
+    parser.add_argument("--write-batch", type=int, default=DEFAULT_WRITE_BATCH,
+                        help="outputs written per batch")
+    parser.add_argument("--files-per-task", type=int, default=DEFAULT_FILES_PER_TASK,
+                        help="files handed to a worker thread at a time")
+    parser.add_argument("--keep-compressed", action="store_true",
+                        help="compress outputs of compressed inputs with the same codec")
+    parser.add_argument("--mode", choices=["auto", "strict", "passthrough"], default="auto",
+                        help="how undecodable bytes are handled")
+    parser.add_argument("--compare", action="store_true",
+                        help="also run the sequential loop and report the speedup")
+    args = parser.parse_args()
+    
+    if not os.path.isdir(args.input_dir):
+        print(f"❌ Error: '{args.input_dir}' is not a directory.")
+        return
+    
+    options = {
+        "max_in_flight": args.max_in_flight,
+        "write_batch": args.write_batch,
+        "files_per_task": args.files_per_task,
+        "keep_compressed": args.keep_compressed,
+        "mode": args.mode,
+    }
+    if args.compare:
+        compare_with_sequential(args.input_dir, args.output_dir, **options)
+    else:
+        filenames = find_input_files(args.input_dir)
+        print(f"📁 Processing {len(filenames)} files from {args.input_dir}")
+        print_results("Async engine", process_files_async_blocking(filenames, args.input_dir, args.output_dir, **options))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Throughput Benchmark for the File Handling Challenge
+Measures how fast modify_content() and the read/write paths are:
+1. Generates synthetic inputs (1 KB, 1 MB, optionally 1 GB) with short lines,
+   long lines and Unicode-heavy text
+2. Runs every processing mode on every input in a fresh process
+3. Reports MB/s, lines/s and peak memory, and saves the results as a baseline
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False  # Windows: peak memory isn't reported
+
+from file_handling_challenge import ProgressReporter, modify_content, process_file
+
+SIZES = {"1KB": 1024, "1MB": 1024 * 1024, "1GB": 1024 * 1024 * 1024}
+DEFAULT_SIZES = ["1KB", "1MB"]
+IN_MEMORY_LIMIT = 256 * 1024 * 1024  # Larger inputs skip the modes that load the whole file
+BLOCK_SIZE = 256 * 1024  # Generated text is built from a repeated block of this size
+DEFAULT_BASELINE = "benchmark_baseline.json"
+
+# Characters used for each kind of synthetic text
+ASCII_WORDS = ["hello", "world", "python", "file", "handling", "is", "fun", "error", "stream", "text"]
+UNICODE_WORDS = ["straße", "naïve", "café", "東京", "привет", "γειά", "مرحبا", "🐍", "😀", "ñandú"]
+TEXT_KINDS = {
+    "short-lines": (ASCII_WORDS, 3, 6),  # (words, min words per line, max words per line)
+    "long-lines": (ASCII_WORDS, 600, 900),
+    "unicode-heavy": (UNICODE_WORDS, 4, 12),
+}
+
+MODES = ["transform-only", "in-memory", "streaming", "streaming-gzip", "passthrough", "streaming-progress"]
+IN_MEMORY_MODES = {"transform-only", "in-memory"}
+
+def generate_text_block(kind, seed=42):
+    """Build a block of roughly BLOCK_SIZE bytes of synthetic text"""
+    words, min_words, max_words = TEXT_KINDS[kind]
+    rng = random.Random(seed)
+    lines = []
+    size = 0
+    while size < BLOCK_SIZE:
+        line = " ".join(rng.choice(words) for _ in range(rng.randint(min_words, max_words)))
+        lines.append(line)
+        size += len(line.encode('utf-8')) + 1
+    return "\n".join(lines) + "\n"
+
+def generate_input(path, size, kind, seed=42):
+    """Write a synthetic text file of (about) the given size, returning its line count"""
+    block = generate_text_block(kind, seed).encode('utf-8')
+    block_lines = block.count(b"\n")
+    lines = 0
+    written = 0
+    
+    with open(path, 'wb') as file:
+        while written + len(block) <= size:
+            file.write(block)
+            written += len(block)
+            lines += block_lines
+        if written < size:
+            # Finish on a whole line so the text stays valid UTF-8
+            tail = block[:size - written]
+            tail = tail[:tail.rfind(b"\n") + 1] or block[:block.find(b"\n") + 1]
+            file.write(tail)
+            lines += tail.count(b"\n")
+    return lines
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB (None where it can't be measured)"""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+def run_mode(mode, input_path, output_path):
+    """Run one processing mode once"""
+    if mode == "transform-only":
+        with open(input_path, 'r', encoding='utf-8') as file:
+            content = file.read()
+        start = time.perf_counter()
+        modify_content(content)
+        return time.perf_counter() - start
+    
+    start = time.perf_counter()
+    if mode == "in-memory":
+        # The original approach: read everything, transform, write everything
+        with open(input_path, 'r', encoding='utf-8') as file:
+            content = file.read()
+        with open(output_path, 'w', encoding='utf-8') as file:
+            file.write(modify_content(content))
+    elif mode == "streaming":
+        process_file(input_path, output_path)
+    elif mode == "streaming-gzip":
+        process_file(input_path + ".gz", output_path + ".gz", codec="gzip", keep_compressed=True)
+    elif mode == "passthrough":
+        process_file(input_path, output_path, mode="passthrough")
+    elif mode == "streaming-progress":
+        with open(os.devnull, 'w') as devnull:
+            progress = ProgressReporter(os.path.getsize(input_path), stream=devnull)
+            process_file(input_path, output_path, progress=progress)
+    return time.perf_counter() - start
+
+def run_case(mode, input_path, output_path, repeats):
+    """Run a mode several times in this (fresh) process and keep the best time"""
+    best = min(run_mode(mode, input_path, output_path) for _ in range(repeats))
+    return {"seconds": best, "peak_rss_mb": peak_rss_mb()}
+
+def run_benchmarks(sizes, kinds, modes, workdir, repeats=3):
+    """Run every mode on every generated input, each case in its own process"""
+    results = []
+    spawn = get_context("spawn")
+    
+    for size_name in sizes:
+        size = SIZES[size_name]
+        for kind in kinds:
+            input_path = os.path.join(workdir, f"{kind}-{size_name}.txt")
+            output_path = os.path.join(workdir, f"out-{kind}-{size_name}.txt")
+            print(f"📝 Generating {size_name} of {kind} text...")
+            lines = generate_input(input_path, size, kind)
+            actual_size = os.path.getsize(input_path)
+            if "streaming-gzip" in modes:
+                with open(input_path, 'rb') as source, gzip.open(input_path + ".gz", 'wb', compresslevel=1) as target:
+                    shutil.copyfileobj(source, target, 1024 * 1024)
+            
+            for mode in modes:
+                if mode in IN_MEMORY_MODES and size > IN_MEMORY_LIMIT:
+                    print(f"   ⏭️ {mode:<20} skipped (input too large to load at once)")
+                    continue
+                case_repeats = repeats if size <= SIZES["1MB"] else 1
+                with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+                    measured = executor.submit(run_case, mode, input_path, output_path, case_repeats).result()
+                
+                seconds = max(measured["seconds"], 1e-9)
+                result = {
+                    "size": size_name,
+                    "kind": kind,
+                    "mode": mode,
+                    "bytes": actual_size,
+                    "lines": lines,
+                    "seconds": seconds,
+                    "mb_per_s": actual_size / seconds / 1024 / 1024,
+                    "lines_per_s": lines / seconds,
+                    "peak_rss_mb": measured["peak_rss_mb"],
+                }
+                results.append(result)
+                print_result(result)
+            
+            for path in (input_path, input_path + ".gz", output_path, output_path + ".gz"):
+                if os.path.exists(path):
+                    os.remove(path)
+    return results
+
+def print_result(result, baseline=None):
+    """Print one benchmark result, with the change against the baseline when there is one"""
+    rss = f"{result['peak_rss_mb']:.1f} MB" if result["peak_rss_mb"] is not None else "n/a"
+    line = (f"   ⏱️ {result['mode']:<20} {result['mb_per_s']:>9.2f} MB/s "
+            f"{result['lines_per_s']:>13,.0f} lines/s  peak RSS {rss}")
+    if baseline:
+        change = (result["mb_per_s"] / baseline["mb_per_s"] - 1) * 100
+        line += f"  ({change:+.1f}% vs baseline)"
+    print(line)
+
+def compare_with_baseline(results, baseline_path):
+    """Print how the new results compare with a saved baseline"""
+    try:
+        with open(baseline_path, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not read baseline {baseline_path}: {e}")
+        return
+    
+    previous = {(r["size"], r["kind"], r["mode"]): r for r in baseline.get("results", [])}
+    print(f"\n📈 Compared with {baseline_path}:")
+    for result in results:
+        old = previous.get((result["size"], result["kind"], result["mode"]))
+        if old:
+            print(f"{result['size']:>4} {result['kind']:<14}", end="")
+            print_result(result, old)
+
+def save_baseline(results, baseline_path):
+    """Save results so later runs can be compared against them"""
+    with open(baseline_path, 'w', encoding='utf-8') as file:
+        json.dump({"python": sys.version.split()[0], "platform": sys.platform, "results": results}, file, indent=2)
+    print(f"💾 Results saved to {baseline_path}")
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the file handling challenge")
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=DEFAULT_SIZES,
+                        help="input sizes to generate (1GB needs a few GB of free disk)")
+    parser.add_argument("--kinds", nargs="+", choices=list(TEXT_KINDS), default=list(TEXT_KINDS),
+                        help="kinds of synthetic text")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES, help="processing modes")
+    parser.add_argument("--repeats", type=int, default=3, help="runs per case for inputs up to 1 MB (best is kept)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline file to compare with and update")
+    parser.add_argument("--no-save", action="store_true", help="don't overwrite the baseline file")
+    args = parser.parse_args()
+    
+    workdir = tempfile.mkdtemp(prefix="file-benchmark-")
+    print("🐍 FILE HANDLING BENCHMARK")
+    print("="*55)
+    try:
+        results = run_benchmarks(args.sizes, args.kinds, args.modes, workdir, args.repeats)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    
+    compare_with_baseline(results, args.baseline)
+    if not args.no_save:
+        save_baseline(results, args.baseline)
+
+if __name__ == "__main__":
+    main()
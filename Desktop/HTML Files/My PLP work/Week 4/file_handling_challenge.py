@@ -4,11 +4,76 @@ File Read & Write Challenge with Error Handling
 This program demonstrates:
 1. Reading a file and writing a modified version to a new file
 2. Proper error handling for file operations
+3. Streaming through .gz/.bz2/.xz files without decompressing them to disk
+4. Detecting the text encoding and skipping binary files early
 """
 
+import bisect
+import bz2
+import codecs
+import gzip
+import itertools
+import json
+import lzma
 import os
+import queue
+import sys
+import threading
+import time
 from pathlib import Path
 
+CHUNK_SIZE = 1024 * 1024  # Bytes read or written per chunk
+QUEUE_DEPTH = 8  # Chunks buffered between the codec threads and the transform
+
+# Magic bytes identifying each supported compression format
+COMPRESSION_MAGIC = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+
+GZIP_LEVEL = 6  # gzip's own default of 9 is several times slower for little gain
+
+# File extension used for each compression format
+COMPRESSION_EXTENSIONS = {
+    "gzip": ".gz",
+    "bz2": ".bz2",
+    "xz": ".xz",
+}
+
+SNIFF_SIZE = 64 * 1024  # Bytes inspected to guess the encoding / spot binary files
+BINARY_CONTROL_RATIO = 0.30  # Share of control bytes above which a file counts as binary
+
+# Byte order marks, longest first (the UTF-32 LE mark starts with the UTF-16 LE one)
+BYTE_ORDER_MARKS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+# How undecodable bytes are handled
+# - auto: sniff the encoding, reject binary files, pass stray bad bytes through untouched
+# - strict: UTF-8 only, stop on the first bad byte (binary files are still rejected early)
+# - passthrough: UTF-8 with bad bytes passed through untouched, never reject
+DECODING_MODES = ("auto", "strict", "passthrough")
+
+# Control bytes that don't normally show up in text (tab, newlines, form feed and escape do)
+CONTROL_BYTES = bytes(b for b in range(32) if b not in b"\t\n\r\f\b\x1b") + b"\x7f"
+
+INDEX_SUFFIX = ".idx.json"  # Sidecar file holding the line-offset index
+INDEX_VERSION = 1
+DEFAULT_INDEX_INTERVAL = 1000  # Lines between two index entries
+INDEX_READ_SIZE = 64 * 1024  # Bytes read at a time when jumping into a file
+
+PROGRESS_INTERVAL = 0.5  # Seconds between two progress line refreshes
+PROGRESS_MIN_BYTES = 8 * 1024 * 1024  # Files smaller than this finish too fast to need progress
+
+MODIFIED_HEADER = ["=== MODIFIED FILE CONTENT ===", ""]
+MODIFIED_FOOTER = ["", "=== END OF MODIFIED CONTENT ==="]
+PREVIEW_LENGTH = 200
+
 def create_sample_file():
     """Create a sample file for testing if it doesn't exist"""
     sample_filename = "sample_text.txt"
@@ -26,6 +91,12 @@ This content will be modified and saved to a new file."""
         except IOError as e:
             print(f"❌ Error creating sample file: {e}")
 
+def modify_line(number, line):
+    """Modify a single line: uppercase it and add its line number (empty lines stay empty)"""
+    if line.strip():  # Only add line numbers to non-empty lines
+        return f"{number:2d}. {line.upper()}"
+    return ""
+
 def modify_content(content):
     """
     Modify the file content - you can customize this function
@@ -35,17 +106,530 @@ def modify_content(content):
     3. Add a header
     """
     lines = content.split('\n')
-    modified_lines = ["=== MODIFIED FILE CONTENT ===", ""]
+    modified_lines = list(MODIFIED_HEADER)
     
     for i, line in enumerate(lines, 1):
-        if line.strip():  # Only add line numbers to non-empty lines
-            modified_lines.append(f"{i:2d}. {line.upper()}")
-        else:
-            modified_lines.append("")
+        modified_lines.append(modify_line(i, line))
     
-    modified_lines.extend(["", "=== END OF MODIFIED CONTENT ==="])
+    modified_lines.extend(MODIFIED_FOOTER)
     return '\n'.join(modified_lines)
 
+def compression_from_signature(signature):
+    """Match the first bytes of a file against the known compression formats (None if uncompressed)"""
+    for codec, magic in COMPRESSION_MAGIC.items():
+        if signature.startswith(magic):
+            return codec
+    return None
+
+def detect_compression(filename):
+    """Detect the compression format of a file from its magic bytes (None if uncompressed)"""
+    with open(filename, 'rb') as file:
+        signature = file.read(max(len(magic) for magic in COMPRESSION_MAGIC.values()))
+    return compression_from_signature(signature)
+
+def open_compressed(raw_file, codec, mode):
+    """Wrap an open binary file so reads/writes go through the given codec"""
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=raw_file, mode=mode, compresslevel=GZIP_LEVEL)
+    if codec == "bz2":
+        return bz2.BZ2File(raw_file, mode)
+    if codec == "xz":
+        return lzma.LZMAFile(raw_file, mode)
+    return raw_file
+
+class BinaryFileError(ValueError):
+    """Raised when a file looks binary and can't be processed as text"""
+
+def looks_binary(prefix):
+    """Check whether the start of a file looks like binary data rather than text"""
+    if not prefix:
+        return False
+    if b"\x00" in prefix:
+        return True
+    control_count = len(prefix) - len(prefix.translate(None, CONTROL_BYTES))
+    return control_count / len(prefix) > BINARY_CONTROL_RATIO
+
+def detect_encoding(prefix):
+    """
+    Guess the text encoding from the first bytes of a file
+    - A byte order mark wins
+    - UTF-8 if most non-ASCII characters are valid UTF-8 (stray bad bytes are tolerated)
+    - Otherwise Windows-1252, then Latin-1
+    """
+    for bom, encoding in BYTE_ORDER_MARKS:
+        if prefix.startswith(bom):
+            return encoding
+    
+    # Not final: the prefix may end in the middle of a character
+    text = codecs.getincrementaldecoder("utf-8")("surrogateescape").decode(prefix)
+    if text.isascii():
+        return "utf-8"
+    escaped = sum(1 for char in text if '\udc80' <= char <= '\udcff')
+    non_ascii = sum(1 for char in text if char > '\x7f')
+    if non_ascii - escaped > escaped:
+        return "utf-8"
+    
+    try:
+        codecs.getincrementaldecoder("cp1252")().decode(prefix)
+        return "cp1252"
+    except UnicodeDecodeError:
+        return "latin-1"  # Every byte is valid Latin-1
+
+def choose_decoding(prefix, mode="auto"):
+    """Pick the (encoding, errors) pair used to decode a file, rejecting binary files early"""
+    if mode not in DECODING_MODES:
+        raise ValueError(f"Unknown decoding mode: {mode} (choose from {', '.join(DECODING_MODES)})")
+    
+    if mode == "passthrough":
+        return "utf-8", "surrogateescape"
+    
+    encoding = detect_encoding(prefix) if mode == "auto" else "utf-8"
+    if not encoding.startswith("utf-16") and not encoding.startswith("utf-32") and looks_binary(prefix):
+        raise BinaryFileError(f"looks like a binary file (checked the first {len(prefix)} bytes)")
+    
+    return encoding, "surrogateescape" if mode == "auto" else "strict"
+
+def build_output_filename(filename, codec=None, keep_compressed=False):
+    """Build the output filename, dropping or keeping the compression extension"""
+    input_path = Path(filename)
+    name = input_path.name
+    
+    if codec and input_path.suffix.lower() == COMPRESSION_EXTENSIONS[codec]:
+        name = input_path.stem  # data.txt.gz -> data.txt
+    
+    output_filename = f"modified_{name}"
+    if codec and keep_compressed:
+        output_filename += COMPRESSION_EXTENSIONS[codec]
+    return output_filename
+
+class ChunkReader:
+    """
+    Read a file in chunks, decompressing it in a background thread
+    - The file is opened in the caller's thread so open errors surface immediately
+    - Decompressed chunks are handed over through a bounded queue
+    - position is how far into the file on disk the consumer has got (for progress)
+    """
+    
+    def __init__(self, filename, codec=None, chunk_size=CHUNK_SIZE):
+        self.codec = codec
+        self.position = 0
+        self._chunk_size = chunk_size
+        self._raw = open(filename, 'rb')
+        try:
+            self._stream = open_compressed(self._raw, codec, 'rb')
+        except BaseException:
+            self._raw.close()  # Nothing else will close it if the codec refuses the file
+            raise
+        self._chunks = queue.Queue(maxsize=QUEUE_DEPTH)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _put(self, item):
+        """Hand an item to the consumer unless it has stopped listening"""
+        while not self._stop.is_set():
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def _run(self):
+        """Background thread: decompress chunks until the end of the file"""
+        try:
+            while not self._stop.is_set():
+                chunk = self._stream.read(self._chunk_size)
+                if not chunk:
+                    break
+                self._put((chunk, self._raw.tell()))
+            self._put(None)
+        except Exception as e:
+            self._put(e)
+    
+    def __iter__(self):
+        while True:
+            item = self._chunks.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            chunk, self.position = item
+            yield chunk
+    
+    def close(self):
+        """Stop the background thread and close the file"""
+        self._stop.set()
+        self._thread.join()
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class ChunkWriter:
+    """
+    Write chunks to a file, compressing them in a background thread
+    - Errors from the background thread are raised on the next write or on close
+    """
+    
+    def __init__(self, filename, codec=None):
+        self.codec = codec
+        self._raw = open(filename, 'wb')
+        try:
+            self._stream = open_compressed(self._raw, codec, 'wb')
+        except BaseException:
+            self._raw.close()  # Nothing else will close it if the codec refuses the file
+            raise
+        self._chunks = queue.Queue(maxsize=QUEUE_DEPTH)
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        """Background thread: compress and write chunks until told to stop"""
+        while True:
+            chunk = self._chunks.get()
+            if chunk is None:
+                break
+            if self._error is None:
+                try:
+                    self._stream.write(chunk)
+                except Exception as e:
+                    self._error = e  # Keep draining so the writer never blocks
+    
+    def write(self, data):
+        """Queue a chunk of bytes for writing"""
+        if self._error is not None:
+            raise self._error
+        self._chunks.put(data)
+    
+    def close(self):
+        """Flush the remaining chunks and close the file"""
+        if self._closed:
+            return
+        self._closed = True
+        self._chunks.put(None)
+        self._thread.join()
+        try:
+            if self._stream is not self._raw:
+                self._stream.close()
+        finally:
+            self._raw.close()
+        if self._error is not None:
+            raise self._error
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def iter_lines(chunks, encoding='utf-8', errors='strict', keep_carriage_returns=False):
+    """
+    Decode byte chunks and yield lines the way content.split('\\n') would
+    - Windows line endings are normalized like reading in text mode
+    - The last (possibly empty) line is always yielded
+    - With errors='surrogateescape' undecodable bytes survive a round trip
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors)
+    pending = ""
+    
+    for chunk in chunks:
+        lines = (pending + decoder.decode(chunk)).split('\n')
+        pending = lines.pop()
+        if keep_carriage_returns:
+            yield from lines
+        else:
+            for line in lines:
+                yield line[:-1] if line.endswith('\r') else line
+    
+    pending += decoder.decode(b"", final=True)
+    if keep_carriage_returns:
+        yield pending
+    else:
+        yield pending[:-1] if pending.endswith('\r') else pending
+
+def _offset_codec(encoding, prefix):
+    """
+    Return (encoding, BOM length) for measuring and seeking inside a file
+    - Once past the byte order mark, UTF-16/32 must be read with an explicit byte order
+    """
+    for bom, bom_encoding in BYTE_ORDER_MARKS:
+        if bom_encoding == encoding and prefix.startswith(bom):
+            if encoding == "utf-8-sig":
+                return "utf-8", len(bom)
+            byte_order = "le" if bom in (codecs.BOM_UTF16_LE, codecs.BOM_UTF32_LE) else "be"
+            return f"{encoding}-{byte_order}", len(bom)
+    return encoding, 0
+
+def index_filename(output_filename):
+    """Name of the line-offset index saved next to an output file"""
+    return f"{output_filename}{INDEX_SUFFIX}"
+
+def process_file(input_filename, output_filename, codec=None, keep_compressed=False, mode="auto",
+                 index_interval=None, progress=None):
+    """
+    Stream a file through modify_line() and write the modified version
+    - Compressed input is decompressed on the fly in a reader thread
+    - The encoding is sniffed from the first chunk (see DECODING_MODES)
+    - Output is UTF-8, written (and optionally compressed) in a writer thread
+    - With index_interval=K, every K-th line's input and output byte offsets
+      are saved to a sidecar index (see read_output_lines / retransform_lines)
+    - progress (a ProgressReporter) is updated once per chunk, so it costs next to nothing
+    - Returns statistics and a preview of the modified content
+    """
+    output_codec = codec if keep_compressed else None
+    stats = {"characters": 0, "lines": 0, "encoding": None, "preview": "", "index": None}
+    preview_parts = []
+    
+    with ChunkReader(input_filename, codec) as reader:
+        # Sniff the first chunk before creating any output
+        chunks = iter(reader) if progress is None else _report_progress(reader, progress)
+        first_chunk = next(chunks, b"")
+        encoding, errors = choose_decoding(first_chunk[:SNIFF_SIZE], mode)
+        stats["encoding"] = encoding
+        lines = iter_lines(itertools.chain([first_chunk], chunks), encoding, errors, keep_carriage_returns=True)
+        
+        index = None
+        if index_interval:
+            offset_encoding, bom_length = _offset_codec(encoding, first_chunk)
+            input_stat = os.stat(input_filename)
+            index = {
+                "version": INDEX_VERSION,
+                "source": os.path.abspath(input_filename),
+                "source_size": input_stat.st_size,
+                "source_mtime_ns": input_stat.st_mtime_ns,
+                "input_codec": codec,
+                "output_codec": output_codec,
+                "encoding": encoding,
+                "offset_encoding": offset_encoding,
+                "errors": errors,
+                "start_offset": bom_length,
+                "interval": index_interval,
+                "entries": [],  # [line number, input offset, output offset]
+            }
+        
+        try:
+            with ChunkWriter(output_filename, output_codec) as writer:
+                _write_modified_lines(lines, writer, errors, stats, preview_parts, index)
+        except BaseException:
+            # Don't leave a half-written output file behind
+            if os.path.exists(output_filename):
+                os.remove(output_filename)
+            raise
+    
+    if progress is not None:
+        progress.finish()
+    
+    if index is not None:
+        index["lines"] = stats["lines"]
+        save_line_index(index, output_filename)
+        stats["index"] = _with_entry_lines(index)
+    
+    stats["characters"] -= 1  # The last line has no newline after it
+    preview = ''.join(preview_parts)
+    stats["preview"] = preview[:PREVIEW_LENGTH] + "..." if len(preview) > PREVIEW_LENGTH else preview
+    return stats
+
+class ProgressReporter:
+    """
+    Show bytes processed, rate and ETA on a single refreshing line
+    - Redraws at most every PROGRESS_INTERVAL seconds, so frequent updates stay cheap
+    """
+    
+    def __init__(self, total_bytes, stream=None, interval=PROGRESS_INTERVAL):
+        self.total_bytes = total_bytes
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self.done_bytes = 0
+        self._start = time.perf_counter()
+        self._last_draw = 0.0
+    
+    def update(self, done_bytes):
+        """Record progress and redraw if enough time has passed"""
+        self.done_bytes = done_bytes
+        now = time.perf_counter()
+        if now - self._last_draw >= self.interval:
+            self._last_draw = now
+            self._draw(now)
+    
+    def finish(self):
+        """Draw the final state and end the progress line"""
+        self.done_bytes = max(self.done_bytes, self.total_bytes)
+        self._draw(time.perf_counter())
+        self.stream.write("\n")
+        self.stream.flush()
+    
+    def _draw(self, now):
+        elapsed = max(now - self._start, 1e-9)
+        rate = self.done_bytes / elapsed
+        percent = 100 * self.done_bytes / self.total_bytes if self.total_bytes else 100
+        remaining = (self.total_bytes - self.done_bytes) / rate if rate else 0
+        minutes, seconds = divmod(int(remaining), 60)
+        self.stream.write(f"\r⏳ {self.done_bytes / 1024 / 1024:,.1f} / {self.total_bytes / 1024 / 1024:,.1f} MB "
+                          f"({percent:.0f}%) • {rate / 1024 / 1024:,.1f} MB/s • ETA {minutes}:{seconds:02d}  ")
+        self.stream.flush()
+
+def _report_progress(reader, progress):
+    """Pass chunks through while telling the progress reporter how far into the file we are"""
+    for chunk in reader:
+        yield chunk
+        progress.update(reader.position)
+
+def _write_modified_lines(lines, writer, errors, stats, preview_parts, index=None):
+    """
+    Modify lines and hand them to the writer as UTF-8 in CHUNK_SIZE batches, collecting a preview
+    - When indexing, a batch also ends right before every sampled line so its output offset is known
+    """
+    batch = list(MODIFIED_HEADER)
+    batch_size = 0
+    bytes_written = 0
+    preview_length = 0
+    first_batch = True
+    
+    def flush():
+        nonlocal batch, batch_size, bytes_written, preview_length, first_batch
+        if not batch:
+            return
+        text = '\n'.join(batch) if first_batch else '\n' + '\n'.join(batch)
+        if preview_length <= PREVIEW_LENGTH:
+            preview_parts.append(text[:PREVIEW_LENGTH + 1])
+            preview_length += len(preview_parts[-1])
+        data = text.encode('utf-8', errors)
+        writer.write(data)
+        bytes_written += len(data)
+        batch = []
+        batch_size = 0
+        first_batch = False
+    
+    if index is not None:
+        interval = index["interval"]
+        entries = index["entries"]
+        offset_encoding = index["offset_encoding"]
+        newline_length = len('\n'.encode(offset_encoding))
+        input_offset = index["start_offset"]
+    
+    for number, line in enumerate(lines, 1):
+        if index is not None:
+            if (number - 1) % interval == 0:
+                flush()
+                entries.append([number, input_offset, bytes_written + 1])  # +1 for the newline before it
+            input_offset += len(line.encode(offset_encoding, errors)) + newline_length
+        
+        if line.endswith('\r'):
+            line = line[:-1]
+        stats["characters"] += len(line) + 1
+        modified = modify_line(number, line)
+        batch.append(modified)
+        batch_size += len(modified) + 1
+        
+        if batch_size >= CHUNK_SIZE:
+            flush()
+        stats["lines"] = number
+    
+    batch.extend(MODIFIED_FOOTER)
+    flush()
+
+def save_line_index(index, output_filename):
+    """Save a line-offset index next to its output file"""
+    with open(index_filename(output_filename), 'w', encoding='utf-8') as file:
+        json.dump(index, file)
+
+def load_line_index(output_filename):
+    """
+    Load the index saved for an output file
+    - Returns None if there is no index, or if the source file changed since it was built
+    """
+    try:
+        with open(index_filename(output_filename), 'r', encoding='utf-8') as file:
+            index = json.load(file)
+        source_stat = os.stat(index["source"])
+    except (OSError, ValueError, KeyError):
+        return None
+    
+    if (index.get("version") != INDEX_VERSION
+            or source_stat.st_size != index["source_size"]
+            or source_stat.st_mtime_ns != index["source_mtime_ns"]
+            or not os.path.exists(output_filename)):
+        return None
+    return _with_entry_lines(index)
+
+def _with_entry_lines(index):
+    """Add the entries' line numbers (what _nearest_entry() bisects); not saved with the index"""
+    index["entry_lines"] = [entry[0] for entry in index["entries"]]
+    return index
+
+def _seek_lines(filename, codec, offset, encoding, errors):
+    """Open a file, jump to a byte offset and yield lines from there"""
+    with open(filename, 'rb') as raw:
+        stream = open_compressed(raw, codec, 'rb')
+        stream.seek(offset)  # A real seek for plain files; compressed files decompress up to it
+        yield from iter_lines(iter(lambda: stream.read(INDEX_READ_SIZE), b""), encoding, errors)
+
+def _nearest_entry(index, line_number):
+    """Find the last sampled line at or before line_number"""
+    if line_number < 1 or line_number > index["lines"]:
+        raise ValueError(f"Line {line_number} is out of range (1-{index['lines']})")
+    position = bisect.bisect_right(index["entry_lines"], line_number) - 1
+    return index["entries"][position]
+
+def read_output_lines(output_filename, index, start, end):
+    """Return modified lines start..end (input line numbers) straight from the output file"""
+    end = min(end, index["lines"])
+    line_number, _, output_offset = _nearest_entry(index, start)
+    lines = _seek_lines(output_filename, index["output_codec"], output_offset, 'utf-8', index["errors"])
+    
+    selected = []
+    for number, line in enumerate(lines, line_number):
+        if number > end:
+            break
+        if number >= start:
+            selected.append(line)
+    lines.close()
+    return selected
+
+def retransform_lines(input_filename, index, start, end):
+    """Re-run modify_line() on input lines start..end without reading anything before them"""
+    end = min(end, index["lines"])
+    line_number, input_offset, _ = _nearest_entry(index, start)
+    lines = _seek_lines(input_filename, index["input_codec"], input_offset, index["offset_encoding"], index["errors"])
+    
+    modified = []
+    for number, line in enumerate(lines, line_number):
+        if number > end:
+            break
+        if number >= start:
+            modified.append(modify_line(number, line))
+    lines.close()
+    return modified
+
+def parse_line_range(text):
+    """Parse a line range like '10-20' or '15' into (start, end)"""
+    start, _, end = text.partition('-')
+    start = int(start)
+    end = int(end) if end.strip() else start
+    if end < start:
+        raise ValueError("The end of the range must not come before its start")
+    return start, end
+
+def show_lines(output_filename, index):
+    """Let the user look at line ranges of a processed file using its index"""
+    while True:
+        answer = input("🔍 Show lines (e.g. 10-20), or press Enter to skip: ").strip()
+        if not answer:
+            return
+        try:
+            start, end = parse_line_range(answer)
+            for line in read_output_lines(output_filename, index, start, end):
+                print(line)
+        except ValueError as e:
+            print(f"⚠️ {e}")
+
 def read_and_write_file():
     """Main function that handles file reading, modifying, and writing"""
     
@@ -66,33 +650,49 @@ def read_and_write_file():
                 print("⚠️ Please enter a valid filename.")
                 continue
             
-            # Attempt to read the file
-            print(f"📖 Attempting to read file: {filename}")
-            
-            with open(filename, 'r', encoding='utf-8') as input_file:
-                original_content = input_file.read()
-            
-            print(f"✅ Successfully read {len(original_content)} characters from {filename}")
-            
-            # Modify the content
-            modified_content = modify_content(original_content)
+            # Check whether the file needs to be decompressed on the fly
+            codec = detect_compression(filename)
+            keep_compressed = False
+            if codec:
+                print(f"🗜️ Detected {codec}-compressed input, streaming through it.")
+                answer = input(f"🗜️ Keep the output {codec}-compressed? (y/n): ").strip().lower()
+                keep_compressed = answer in ['y', 'yes']
             
             # Create output filename
-            input_path = Path(filename)
-            output_filename = f"modified_{input_path.stem}{input_path.suffix}"
+            output_filename = build_output_filename(filename, codec, keep_compressed)
             
-            # Write modified content to new file
-            with open(output_filename, 'w', encoding='utf-8') as output_file:
-                output_file.write(modified_content)
+            # An index from an earlier run means the output is already up to date
+            index = load_line_index(output_filename)
+            if index and index["source"] == os.path.abspath(filename):
+                answer = input(f"♻️ {output_filename} is up to date. Reuse it instead of reprocessing? (y/n): ")
+                if answer.strip().lower() not in ['y', 'yes']:
+                    index = None
+            else:
+                index = None
             
-            print(f"✅ Successfully wrote modified content to: {output_filename}")
+            if index is None:
+                # Read, modify and write the file in a single streaming pass
+                print(f"📖 Attempting to read file: {filename}")
+                file_size = os.path.getsize(filename)
+                progress = ProgressReporter(file_size) if file_size >= PROGRESS_MIN_BYTES else None
+                stats = process_file(filename, output_filename, codec, keep_compressed,
+                                     index_interval=DEFAULT_INDEX_INTERVAL, progress=progress)
+                index = stats["index"]
+                
+                print(f"🔤 Detected encoding: {stats['encoding']}")
+                print(f"✅ Successfully read {stats['characters']} characters from {filename}")
+                print(f"✅ Successfully wrote modified content to: {output_filename}")
+                
+                # Show preview of changes
+                print("\n" + "="*50)
+                print("📋 PREVIEW OF MODIFICATIONS:")
+                print("="*50)
+                print(stats["preview"])
+                print("="*50)
             
-            # Show preview of changes
-            print("\n" + "="*50)
-            print("📋 PREVIEW OF MODIFICATIONS:")
-            print("="*50)
-            print(modified_content[:200] + "..." if len(modified_content) > 200 else modified_content)
-            print("="*50)
+            # Jump straight to any lines of the output using the index
+            print(f"🗂️ {index['lines']} lines indexed in {index_filename(output_filename)}")
+            show_lines(output_filename, index)
             
             # Ask if user wants to continue with another file
             another = input("\n🔄 Would you like to process another file? (y/n): ").strip().lower()
@@ -113,10 +713,18 @@ def read_and_write_file():
             print(f"❌ Error: '{filename}' is a directory, not a file.")
             print("💡 Please specify a file name, not a directory.")
             
+        except BinaryFileError as e:
+            print(f"❌ Error: '{filename}' {e}.")
+            print("💡 This program works with text files only.")
+            
         except UnicodeDecodeError:
             print(f"❌ Error: Cannot decode '{filename}'. It might be a binary file.")
             print("💡 This program works with text files only.")
             
+        except (EOFError, gzip.BadGzipFile, lzma.LZMAError) as e:
+            print(f"❌ Error: '{filename}' looks compressed but is corrupt or truncated: {e}")
+            print("💡 Check that the file was fully downloaded.")
+            
         except IOError as e:
             print(f"❌ IO Error occurred: {e}")
             print("💡 There was a problem reading or writing the file.")
@@ -132,10 +740,11 @@ def display_menu():
     print("🐍 PYTHON FILE HANDLING & ERROR HANDLING CHALLENGE")
     print("="*55)
     print("This program will:")
-    print("• Ask you for a filename")
-    print("• Read the file content")
+    print("• Ask you for a filename (.gz, .bz2 and .xz files work too)")
+    print("• Read the file content (the encoding is detected automatically)")
     print("• Modify the content (uppercase + line numbers)")
     print("• Write the modified content to a new file")
+    print("• Let you jump to any lines of the result")
     print("• Handle various file-related errors gracefully")
     print("="*55)
     print()
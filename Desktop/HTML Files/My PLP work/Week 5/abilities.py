@@ -0,0 +1,78 @@
+"""
+Shared storage for power and gadget names
+- Names are interned so every hero refers to the same string objects
+- Heroes with the same abilities share one tuple instead of each owning a list
+- A registry gives every name a small integer id, so a hero's abilities are also
+  kept as a bitmask: membership and "has all of" checks are a single AND
+"""
+
+import sys
+
+_shared_name_tuples = {}  # Every distinct tuple of names handed out so far
+
+def share_names(names):
+    """Return the shared, interned tuple holding these names in this order"""
+    if type(names) is tuple:
+        shared = _shared_name_tuples.get(names)
+        if shared is not None:
+            return shared
+    key = tuple(sys.intern(name) if type(name) is str else name for name in names)
+    return _shared_name_tuples.setdefault(key, key)
+
+class AbilityRegistry:
+    """Maps ability names to small integer ids shared by every hero"""
+    
+    def __init__(self):
+        self.ids = {}  # Name -> id
+        self.names = []  # Id -> name
+        self._masks = {}  # Shared name tuple -> its bitmask
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def id_of(self, name):
+        """Id of a name, registering it the first time it is seen"""
+        ability_id = self.ids.get(name)
+        if ability_id is None:
+            ability_id = len(self.names)
+            self.ids[name] = ability_id
+            self.names.append(name)
+        return ability_id
+    
+    def bit(self, name):
+        """Bitmask of one name (0 for names no hero has had, without registering them)"""
+        ability_id = self.ids.get(name)
+        return 0 if ability_id is None else 1 << ability_id
+    
+    def known_mask(self, names):
+        """Bitmask of several names, or None if any of them has never been registered"""
+        mask = 0
+        for name in names:
+            ability_id = self.ids.get(name)
+            if ability_id is None:
+                return None
+            mask |= 1 << ability_id
+        return mask
+    
+    def share(self, names):
+        """
+        Shared storage for a hero's abilities
+        - Returns (shared name tuple in the given order, bitmask of the names)
+        - Heroes with the same abilities get the very same tuple and mask objects
+        """
+        names = share_names(names)
+        mask = self._masks.get(names)
+        if mask is None:
+            mask = 0
+            for name in names:
+                mask |= 1 << self.id_of(name)
+            self._masks[names] = mask
+        return names, mask
+    
+    def names_in(self, mask):
+        """Names whose bits are set in a mask, in id order"""
+        return [name for ability_id, name in enumerate(self.names) if mask >> ability_id & 1]
+
+# The registries every hero uses
+POWERS = AbilityRegistry()
+GADGETS = AbilityRegistry()
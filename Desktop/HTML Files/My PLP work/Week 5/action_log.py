@@ -0,0 +1,293 @@
+"""
+Event-sourced log of hero actions
+- Every mutation goes through ActionLog.apply(): the action runs on the hero and is
+  appended to the log as a compact binary event
+- Replay is deterministic: the hero classes have no randomness, so re-running the
+  same actions in the same order rebuilds exactly the same heroes
+- A full roster snapshot (see snapshot.py) is taken every snapshot_interval events,
+  so rebuilding the roster at event T only replays the events since the last snapshot
+
+Event encoding: one byte (opcode in the low 5 bits, argument count in the top 3),
+the hero id as a varint, then each argument by the action's schema:
+- i: signed integer as a zigzag varint
+- b: boolean as one byte
+- f: float as 8 bytes
+- s: string as a varint id into the log's string table; the first use of a string
+  is id == table size followed by its UTF-8 length and bytes
+"""
+
+import struct
+from bisect import bisect_right
+
+import events
+from snapshot import load_snapshot, save_snapshot
+
+# (method name, argument schema); the position in the list is the opcode
+ACTIONS = [
+    ("set_name", "s"), ("set_age", "i"), ("set_health", "i"), ("celebrate_birthday", ""),
+    ("take_damage", "i"), ("heal", "i"),
+    ("set_hero_name", "s"), ("add_power", "s"), ("set_energy", "i"), ("reveal_identity", ""),
+    ("use_power", "si"), ("rest", "i"), ("save_citizen", ""), ("fight_villain", "sb"),
+    ("take_off", ""), ("land", ""), ("fly_to_altitude", "i"), ("aerial_rescue", "i"), ("sky_patrol", "i"),
+    ("add_gadget", "s"), ("use_gadget", "si"), ("hack_system", "s"), ("activate_hacking_tools", ""),
+    ("scan_area", "s"), ("tech_rescue", "s"), ("recharge_suit", "i"), ("upgrade_intelligence", "i"),
+    ("set_position", "ff"),
+]
+OPCODES = {name: opcode for opcode, (name, _) in enumerate(ACTIONS)}
+ADD_HERO = 31  # Event carrying a new hero's full state (as a one-hero snapshot)
+
+DEFAULT_SNAPSHOT_INTERVAL = 1000
+FILE_MAGIC = b"HLOG"
+FILE_HEADER = struct.Struct("<4sIIQ")  # magic, snapshot interval, snapshots, log bytes
+FILE_SNAPSHOT = struct.Struct("<QQII")  # event index, log offset, strings known, snapshot bytes
+FLOAT = struct.Struct("<d")
+
+class ActionLogError(ValueError):
+    """Raised for actions that can't be logged and logs that can't be read"""
+
+def write_varint(buffer, value):
+    """Append an unsigned integer, 7 bits per byte"""
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+def read_varint(data, offset):
+    """Read an unsigned varint, returning (value, next offset)"""
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+class HeroHandle:
+    """A hero's actions, logged: log.hero(3).take_damage(10) is log.apply(3, "take_damage", 10)"""
+    __slots__ = ("log", "hero_id")
+    
+    def __init__(self, log, hero_id):
+        self.log = log
+        self.hero_id = hero_id
+    
+    def __getattr__(self, name):
+        if name not in OPCODES:
+            raise AttributeError(f"{name!r} is not a logged hero action")
+        log, hero_id = self.log, self.hero_id
+        return lambda *args: log.apply(hero_id, name, *args)
+
+class ActionLog:
+    """Append-only log of hero actions with periodic snapshots"""
+    
+    def __init__(self, heroes=(), snapshot_interval=DEFAULT_SNAPSHOT_INTERVAL):
+        self.heroes = []  # Live heroes, by hero id
+        self.data = bytearray()  # The encoded events
+        self.event_count = 0
+        self.strings = []  # String table (id -> string)
+        self._string_ids = {}
+        self.snapshot_interval = snapshot_interval
+        self.snapshots = []  # (event index, log offset, strings known, full snapshot bytes), in order
+        self.snapshot_events = []  # Event index of each snapshot (what replay() bisects)
+        for hero in heroes:
+            self.add_hero(hero)
+        self._snapshot()  # Replays never need to go back further than this
+    
+    # Recording
+    def add_hero(self, hero):
+        """Add a hero to the log, returning its hero id"""
+        record = save_snapshot([hero])
+        self.data.append(ADD_HERO)
+        write_varint(self.data, len(record))
+        self.data += record
+        self.heroes.append(hero)
+        self._count_event()
+        return len(self.heroes) - 1
+    
+    def apply(self, hero_id, action, *args):
+        """Run an action on a hero and log it, returning whatever the action returns"""
+        opcode = OPCODES.get(action)
+        if opcode is None:
+            raise ActionLogError(f"{action!r} is not a logged hero action")
+        schema = ACTIONS[opcode][1]
+        if len(args) > len(schema):
+            raise ActionLogError(f"{action} takes at most {len(schema)} argument(s)")
+        
+        string_count = len(self.strings)
+        try:
+            event = bytearray([opcode | len(args) << 5])
+            write_varint(event, hero_id)
+            for kind, value in zip(schema, args):
+                self._write_argument(event, kind, value)
+            result = getattr(self.heroes[hero_id], action)(*args)
+        except Exception:
+            # Nothing was logged, so forget the strings this event would have introduced
+            for text in self.strings[string_count:]:
+                del self._string_ids[text]
+            del self.strings[string_count:]
+            raise
+        self.data += event
+        self._count_event()
+        return result
+    
+    def hero(self, hero_id):
+        """Logged access to one hero's actions"""
+        return HeroHandle(self, hero_id)
+    
+    def _write_argument(self, event, kind, value):
+        if kind == "i":
+            if type(value) is not int:
+                raise ActionLogError(f"Expected a whole number, got {value!r}")
+            write_varint(event, value << 1 if value >= 0 else (-value << 1) - 1)
+        elif kind == "b":
+            event.append(1 if value else 0)
+        elif kind == "f":
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise ActionLogError(f"Expected a number, got {value!r}")
+            event += FLOAT.pack(value)
+        else:
+            if not isinstance(value, str):
+                raise ActionLogError(f"Expected text, got {value!r}")
+            string_id = self._string_ids.get(value)
+            if string_id is None:
+                string_id = len(self.strings)
+                encoded = value.encode('utf-8')
+                write_varint(event, string_id)
+                write_varint(event, len(encoded))
+                event += encoded
+                self._string_ids[value] = string_id
+                self.strings.append(str(value))
+            else:
+                write_varint(event, string_id)
+    
+    def _count_event(self):
+        self.event_count += 1
+        if self.snapshots and self.event_count - self.snapshots[-1][0] >= self.snapshot_interval:
+            self._snapshot()
+    
+    def _snapshot(self):
+        self.snapshots.append((self.event_count, len(self.data), len(self.strings), save_snapshot(self.heroes)))
+        self.snapshot_events.append(self.event_count)
+    
+    # Replaying
+    def _decode(self, offset, strings):
+        """Decode the event at offset: (opcode, hero id or snapshot bytes, arguments, next offset)"""
+        data = self.data
+        header = data[offset]
+        offset += 1
+        opcode, argument_count = header & 0x1F, header >> 5
+        if opcode == ADD_HERO:
+            length, offset = read_varint(data, offset)
+            return opcode, bytes(data[offset:offset + length]), (), offset + length
+        
+        hero_id, offset = read_varint(data, offset)
+        args = []
+        for kind in ACTIONS[opcode][1][:argument_count]:
+            if kind == "b":
+                args.append(bool(data[offset]))
+                offset += 1
+                continue
+            if kind == "f":
+                args.append(FLOAT.unpack_from(data, offset)[0])
+                offset += FLOAT.size
+                continue
+            value, offset = read_varint(data, offset)
+            if kind == "i":
+                args.append(value >> 1 if not value & 1 else -((value + 1) >> 1))
+            else:
+                if value == len(strings):  # First use: the text follows
+                    length, offset = read_varint(data, offset)
+                    strings.append(data[offset:offset + length].decode('utf-8'))
+                    offset += length
+                args.append(strings[value])
+        return opcode, hero_id, args, offset
+    
+    def replay(self, until=None, use_snapshots=True):
+        """
+        Rebuild every hero as it was after the first `until` events (all events by default)
+        - Starts from the latest snapshot at or before that point
+          (use_snapshots=False starts from the first one, to measure what snapshots save)
+        - Hero events are silenced while actions are replayed
+        """
+        until = self.event_count if until is None else until
+        if not self.snapshots[0][0] <= until <= self.event_count:
+            raise ActionLogError(f"Can only replay to events {self.snapshots[0][0]}-{self.event_count}, not {until}")
+        position = bisect_right(self.snapshot_events, until) - 1 if use_snapshots else 0
+        event_index, offset, string_count, snapshot = self.snapshots[position]
+        heroes = load_snapshot(snapshot)
+        # Strings first used before the snapshot are known; later ones are read as they come up
+        strings = self.strings[:string_count]
+        
+        with events.quiet():
+            while event_index < until:
+                opcode, hero, args, offset = self._decode(offset, strings)
+                if opcode == ADD_HERO:
+                    heroes.extend(load_snapshot(hero))
+                else:
+                    getattr(heroes[hero], ACTIONS[opcode][0])(*args)
+                event_index += 1
+        return heroes
+    
+    def hero_at(self, hero_id, until=None):
+        """One hero as it was after the first `until` events"""
+        heroes = self.replay(until)
+        if hero_id >= len(heroes):
+            raise ActionLogError(f"Hero {hero_id} didn't exist yet after {until} events")
+        return heroes[hero_id]
+    
+    def events(self, start=0, stop=None):
+        """(action name, hero id, arguments) of logged events, for analytics and debugging"""
+        stop = self.event_count if stop is None else stop
+        strings = []
+        offset = 0
+        for index in range(stop):
+            opcode, hero, args, offset = self._decode(offset, strings)
+            if index >= start:
+                name = "add_hero" if opcode == ADD_HERO else ACTIONS[opcode][0]
+                yield name, (None if opcode == ADD_HERO else hero), tuple(args)
+    
+    # Files
+    def save(self, path):
+        """Write the log and its snapshots to a file"""
+        with open(path, 'wb') as file:
+            file.write(FILE_HEADER.pack(FILE_MAGIC, self.snapshot_interval, len(self.snapshots), len(self.data)))
+            file.write(self.data)
+            for event_index, offset, string_count, snapshot in self.snapshots:
+                file.write(FILE_SNAPSHOT.pack(event_index, offset, string_count, len(snapshot)))
+                file.write(snapshot)
+    
+    @classmethod
+    def load(cls, path):
+        """Read a log written by save(); live heroes are rebuilt by replaying it"""
+        with open(path, 'rb') as file:
+            data = file.read()
+        try:
+            magic, interval, snapshot_count, size = FILE_HEADER.unpack_from(data, 0)
+        except struct.error:
+            raise ActionLogError(f"{path} is too short to be an action log") from None
+        if magic != FILE_MAGIC:
+            raise ActionLogError(f"{path} is not an action log")
+        
+        log = cls.__new__(cls)
+        log.snapshot_interval = interval
+        offset = FILE_HEADER.size
+        log.data = bytearray(data[offset:offset + size])
+        offset += size
+        log.snapshots = []
+        for _ in range(snapshot_count):
+            event_index, log_offset, string_count, length = FILE_SNAPSHOT.unpack_from(data, offset)
+            offset += FILE_SNAPSHOT.size
+            log.snapshots.append((event_index, log_offset, string_count, data[offset:offset + length]))
+            offset += length
+        log.snapshot_events = [snapshot[0] for snapshot in log.snapshots]
+        
+        # Walk the events once to count them and rebuild the string table
+        log.strings = []
+        log.event_count = 0
+        position = 0
+        while position < len(log.data):
+            _, _, _, position = log._decode(position, log.strings)
+            log.event_count += 1
+        log._string_ids = {text: string_id for string_id, text in enumerate(log.strings)}
+        log.heroes = log.replay()
+        return log
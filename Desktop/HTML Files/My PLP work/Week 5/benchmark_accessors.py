@@ -0,0 +1,120 @@
+"""
+Micro-benchmarks of the hero classes' methods
+- For each class: construction, a getter, a setter, use_power, fight_villain and __str__
+- Internal access: FlyingHero's flying actions with the protected _energy attribute
+  (the current code) against the old version that went through get_energy()/set_energy()
+  for every check and update; both must leave the heroes in the same state
+Hero events are silenced, so rendering and printing aren't part of the timings.
+"""
+
+import argparse
+import timeit
+
+import events
+from flying_hero import FlyingHero
+from person import Person
+from superhero import Superhero
+from tech_hero import TechHero
+
+class AccessorFlyingHero(FlyingHero):
+    """Replica of the old FlyingHero internals: public getters and setters for energy"""
+    __slots__ = ()
+    
+    def fly_to_altitude(self, target_altitude):
+        """Fly to a specific altitude (old version)"""
+        if not self.is_flying():
+            events.emit("not_flying", self.get_hero_name())
+            return False
+        if target_altitude > self.get_max_altitude():
+            events.emit("altitude_too_high", self.get_hero_name(), self.get_max_altitude())
+            return False
+        if target_altitude < 0:
+            events.emit("altitude_below_ground")
+            return False
+        energy_cost = abs(target_altitude - self.get_current_altitude()) // 100
+        if self.get_energy() >= energy_cost:
+            self.set_energy(self.get_energy() - energy_cost)
+            self._FlyingHero__current_altitude = target_altitude
+            events.emit("fly_to_altitude", self.get_hero_name(), target_altitude, self.get_energy())
+            return True
+        events.emit("altitude_no_energy", self.get_hero_name())
+        return False
+    
+    def sky_patrol(self, patrol_altitude=1000):
+        """Patrol the skies (old version)"""
+        if not self.is_flying():
+            if not self.take_off():
+                return False
+        if self.fly_to_altitude(patrol_altitude):
+            energy_cost = 15
+            if self.get_energy() >= energy_cost:
+                self.set_energy(self.get_energy() - energy_cost)
+                events.emit("sky_patrol", self.get_hero_name(), patrol_altitude)
+                return True
+            events.emit("too_tired_to_patrol", self.get_hero_name())
+        return False
+
+def make(cls):
+    """One hero of a class, with the same arguments every time"""
+    if cls is Person:
+        return Person("Clark Kent", 30, "Male")
+    if cls is TechHero:
+        return TechHero("Tony Stark", 45, "Male", "Iron Man", ["Genius Intellect"], "EMP")
+    return cls("Clark Kent", 30, "Male", "Superman", ["Super Strength", "rescue"], "Kryptonite")
+
+def operations(cls):
+    """(label, callable) pairs to time for a class"""
+    hero = make(cls)
+    ops = [("construct", lambda: make(cls)),
+           ("get_name", hero.get_name),
+           ("set_age", lambda: hero.set_age(30))]
+    if cls is not Person:
+        ops += [("get_energy", hero.get_energy),
+                ("set_energy", lambda: hero.set_energy(50)),
+                ("use_power", lambda: hero.use_power("Genius Intellect" if cls is TechHero else "rescue", 0))]
+        if cls is TechHero:
+            ops.append(("fight_villain", lambda: (hero.set_energy(100), hero.recharge_suit(100),
+                                                  hero.fight_villain("Cyber Skull"))))
+        else:
+            ops.append(("fight_villain", lambda: (hero.set_energy(100), hero.fight_villain("Lex Luthor"))))
+    ops.append(("__str__", hero.__str__))
+    return ops
+
+def flight_loop(hero):
+    """A round of flying actions that leaves the hero ready for the next round"""
+    hero.set_energy(100)
+    hero.take_off()
+    hero.fly_to_altitude(1500)
+    hero.sky_patrol(3000)
+    hero.land()
+
+def ns_per_call(function, number, repeat):
+    """Best time per call over several runs, in nanoseconds"""
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e9
+
+def main():
+    """Time every operation, then the flying actions old and new"""
+    parser = argparse.ArgumentParser(description="Micro-benchmark the hero classes' methods")
+    parser.add_argument("--number", type=int, default=20000, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs (the best one counts)")
+    args = parser.parse_args()
+    
+    print("🦸 HERO ACCESSOR BENCHMARK")
+    print("=" * 60)
+    with events.quiet():
+        for cls in [Person, Superhero, FlyingHero, TechHero]:
+            print(f"{cls.__name__}")
+            for label, function in operations(cls):
+                print(f"  {label:<14} {ns_per_call(function, args.number, args.repeat):>9.0f} ns")
+        
+        print("\nFlying actions (take off, fly, patrol, land)")
+        old, new = AccessorFlyingHero.__new__(AccessorFlyingHero), make(FlyingHero)
+        old._import_state(new._export_state())
+        old_ns = ns_per_call(lambda: flight_loop(old), args.number, args.repeat)
+        new_ns = ns_per_call(lambda: flight_loop(new), args.number, args.repeat)
+        print(f"  get/set_energy {old_ns:>9.0f} ns")
+        print(f"  _energy        {new_ns:>9.0f} ns  ({old_ns / new_ns:.2f}x faster)")
+    print("✅ Same hero state" if old._export_state() == new._export_state() else "❌ States differ!")
+
+if __name__ == "__main__":
+    main()
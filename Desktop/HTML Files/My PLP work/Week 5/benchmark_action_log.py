@@ -0,0 +1,86 @@
+"""
+Benchmark of the hero action log
+- Logs a long random run of hero actions, keeping the true state at some points
+- Replays to those points (from the nearest snapshot) and checks the heroes match
+- Reports bytes per event and replay time with and without snapshots
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import events
+from action_log import ActionLog
+from benchmark_simulation import make_heroes
+from flying_hero import FlyingHero
+from tech_hero import TechHero
+
+VILLAINS = ["Lex Luthor", "Kryptonite Man", "Cyber Skull", "Magic Mike"]
+
+def random_action(hero, rng):
+    """A (method name, arguments) pair suited to the hero"""
+    roll = rng.random()
+    if isinstance(hero, FlyingHero) and roll < 0.3:
+        return rng.choice([("take_off", ()), ("land", ()), ("fly_to_altitude", (rng.randrange(0, 5000, 100),))])
+    if isinstance(hero, TechHero) and roll < 0.3:
+        return rng.choice([("use_gadget", ("Scanner",)), ("recharge_suit", (rng.randint(5, 40),)),
+                           ("upgrade_intelligence", (rng.randint(1, 5),)), ("hack_system", ("Mainframe",))])
+    return rng.choice([("take_damage", (rng.randint(1, 30),)), ("heal", (rng.randint(1, 30),)),
+                       ("use_power", ("rescue", rng.randint(5, 20))), ("rest", (rng.randint(5, 40),)),
+                       ("fight_villain", (rng.choice(VILLAINS),)), ("add_power", (f"Power {rng.randint(1, 20)}",)),
+                       ("reveal_identity", ())])
+
+def states(heroes):
+    """Exported state of every hero"""
+    return [hero._export_state() for hero in heroes]
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark the hero action log")
+    parser.add_argument("--heroes", type=int, default=300, help="heroes in the log")
+    parser.add_argument("--events", type=int, default=200000, help="actions to log")
+    parser.add_argument("--interval", type=int, default=10000, help="events between snapshots")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    checkpoints = sorted(rng.sample(range(1, args.events), 5)) + [args.events]
+    expected = {}
+    
+    with events.quiet():
+        log = ActionLog(make_heroes(args.heroes), args.interval)
+        start = time.perf_counter()
+        for index in range(1, args.events + 1):
+            hero_id = rng.randrange(args.heroes)
+            action, action_args = random_action(log.heroes[hero_id], rng)
+            log.apply(hero_id, action, *action_args)
+            if index in checkpoints:
+                expected[log.event_count] = states(log.heroes)
+        record_seconds = time.perf_counter() - start
+    
+    print("🦸 HERO ACTION LOG BENCHMARK")
+    print("=" * 60)
+    print(f"logged {args.events:,} actions in {record_seconds:.2f}s, "
+          f"{len(log.data) / log.event_count:.1f} bytes/event, {len(log.snapshots)} snapshots")
+    
+    for until, expected_states in expected.items():
+        start = time.perf_counter()
+        matches = states(log.replay(until)) == expected_states
+        seconds = time.perf_counter() - start
+        print(f"replay to event {until:>9,}: {seconds * 1000:8.1f} ms  {'✅ matches' if matches else '❌ MISMATCH'}")
+    
+    start = time.perf_counter()
+    log.replay(use_snapshots=False)
+    print(f"replay everything without snapshots: {(time.perf_counter() - start) * 1000:8.1f} ms")
+    
+    path = os.path.join(tempfile.mkdtemp(prefix="action-log-"), "heroes.hlog")
+    log.save(path)
+    loaded = ActionLog.load(path)
+    print(f"saved {os.path.getsize(path) / 1024 / 1024:.2f} MB; reloaded log "
+          f"{'matches' if states(loaded.heroes) == states(log.heroes) else 'DIFFERS'}")
+    os.remove(path)
+    os.rmdir(os.path.dirname(path))
+
+if __name__ == "__main__":
+    main()
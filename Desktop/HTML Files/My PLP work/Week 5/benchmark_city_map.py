@@ -0,0 +1,109 @@
+"""
+Benchmark of city-scale threat queries on a CityMap
+- radius: within_radius() around random positions
+- nearest: the k nearest threats to random positions
+- batch: batch_within_radius() for many heroes at once
+- area: cached scan_area() calls, before and after a threat in the area moves
+Every query kind is checked against a brute-force scan of all threats on a sample.
+"""
+
+import argparse
+import heapq
+import random
+import time
+
+from city_map import DEFAULT_SCAN_RADIUS, CityMap
+from tech_hero import TechHero
+
+THREAT_NAMES = ["Security Camera", "Motion Sensor", "Hidden Door", "Laser Grid", "Drone", "Turret",
+                "Bomb", "Robot Guard", "Alarm", "Trap Door"]
+
+def brute_within_radius(city_map, x, y, radius):
+    """Ids within radius by checking every threat (nearest first, same order as the map)"""
+    limit = radius * radius
+    distances = (((tx - x) ** 2 + (ty - y) ** 2, threat) for threat, (tx, ty) in enumerate(zip(city_map.xs, city_map.ys)))
+    found = [(distance, threat) for distance, threat in distances if distance <= limit]
+    return [threat for _, threat in sorted(found)]
+
+def brute_nearest(city_map, x, y, k):
+    """The k nearest ids by checking every threat"""
+    found = (((tx - x) ** 2 + (ty - y) ** 2, threat) for threat, (tx, ty) in enumerate(zip(city_map.xs, city_map.ys)))
+    return [threat for _, threat in heapq.nsmallest(k, found)]
+
+def time_queries(label, queries, run):
+    """Run every query, print the time per query and return the results"""
+    start = time.perf_counter()
+    results = [run(query) for query in queries]
+    seconds = time.perf_counter() - start
+    found = sum(len(result) for result in results)
+    print(f"{label:<8} {seconds / len(queries) * 1e6:>9.1f} µs/query  {found / len(queries):>8.1f} threats/query")
+    return results
+
+def main():
+    """Build a city, time each kind of query and check the answers"""
+    parser = argparse.ArgumentParser(description="Benchmark spatial threat queries on a city map")
+    parser.add_argument("--threats", type=int, default=1_000_000, help="number of threats on the map")
+    parser.add_argument("--size", type=float, default=50_000.0, help="width and height of the city")
+    parser.add_argument("--queries", type=int, default=2000, help="queries per kind")
+    parser.add_argument("--radius", type=float, default=DEFAULT_SCAN_RADIUS, help="scan radius")
+    parser.add_argument("--k", type=int, default=10, help="threats per nearest query")
+    parser.add_argument("--check", type=int, default=20, help="queries per kind checked by brute force")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    size = args.size
+    
+    print("🦸 CITY MAP BENCHMARK")
+    print("=" * 60)
+    start = time.perf_counter()
+    city_map = CityMap()
+    city_map.add_threats((rng.choice(THREAT_NAMES), rng.uniform(0, size), rng.uniform(0, size))
+                         for _ in range(args.threats))
+    print(f"built    {time.perf_counter() - start:>9.3f} s  {len(city_map):,} threats in {len(city_map.cells):,} cells")
+    
+    positions = [(rng.uniform(0, size), rng.uniform(0, size)) for _ in range(args.queries)]
+    radius_results = time_queries("radius", positions, lambda p: city_map.within_radius(p[0], p[1], args.radius))
+    nearest_results = time_queries("nearest", positions, lambda p: city_map.nearest(p[0], p[1], args.k))
+    
+    # Heroes patrol in squads, so many of them share a cell
+    heroes = []
+    for _ in range(args.queries):
+        hero = TechHero("Tony Stark", 45, "Male", "Iron Man", ["Genius Intellect"])
+        base_x, base_y = positions[len(heroes) % 50]
+        hero.set_position(min(size, base_x + rng.uniform(0, 50)), min(size, base_y + rng.uniform(0, 50)))
+        heroes.append(hero)
+    start = time.perf_counter()
+    batch_results = city_map.batch_within_radius([hero.get_position() for hero in heroes], args.radius)
+    seconds = time.perf_counter() - start
+    print(f"batch    {seconds / len(heroes) * 1e6:>9.1f} µs/query  ({len(heroes):,} heroes in one call)")
+    
+    # Named areas: the first scan fills the cache, the rest are hits until a threat moves
+    area_names = [f"District {number}" for number in range(100)]
+    for area_name, (x, y) in zip(area_names, positions):
+        city_map.define_area(area_name, x, y, args.radius)
+    area_queries = [area_names[index % len(area_names)] for index in range(args.queries)]
+    area_results = time_queries("area", area_queries, city_map.scan_area)
+    print(f"         cache hits {city_map.cache_hits:,}, misses {city_map.cache_misses:,}")
+    
+    ok = True
+    for index in range(min(args.check, args.queries)):
+        x, y = positions[index]
+        ok &= radius_results[index] == brute_within_radius(city_map, x, y, args.radius)
+        expected = brute_nearest(city_map, x, y, args.k)
+        ok &= [city_map.xs[t] for t in nearest_results[index]] == [city_map.xs[t] for t in expected]
+        hero_x, hero_y = heroes[index].get_position()
+        ok &= batch_results[index] == brute_within_radius(city_map, hero_x, hero_y, args.radius)
+        names = [city_map.names[t] for t in brute_within_radius(city_map, x, y, args.radius)]
+        ok &= area_results[index] == names
+    
+    # Moving a threat into an area must drop that area's cached scan
+    x, y = positions[0]
+    threat = city_map.nearest(size - x, size - y)[0]
+    city_map.move_threat(threat, x, y)
+    misses = city_map.cache_misses
+    moved = city_map.scan_area(area_names[0])
+    ok &= city_map.cache_misses == misses + 1 and moved[0] == city_map.names[threat]
+    print("✅ Same threats as a brute-force scan" if ok else "❌ Results differ!")
+
+if __name__ == "__main__":
+    main()
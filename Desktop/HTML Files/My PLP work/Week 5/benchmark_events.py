@@ -0,0 +1,81 @@
+"""
+Benchmark of hero actions under each event sink
+- print: the original behaviour, every action formatted and written out (to os.devnull here)
+- collect: compact HeroEvent records, no text
+- count: only a counter per event kind
+- quiet: events dropped without being looked at
+"""
+
+import argparse
+import os
+import time
+
+import events
+from flying_hero import FlyingHero
+from superhero import Superhero
+from tech_hero import TechHero
+
+def make_heroes():
+    """One hero of each kind"""
+    return [
+        Superhero("Diana Prince", 30, "Female", "Wonder Woman", ["Super Strength", "rescue"], "Magic"),
+        FlyingHero("Clark Kent", 32, "Male", "Superman", ["Super Strength", "rescue"], "Kryptonite"),
+        TechHero("Tony Stark", 45, "Male", "Iron Man", ["Genius Intellect"], "EMP", intelligence_level=95),
+    ]
+
+def run_actions(rounds):
+    """Run a fixed mix of hero actions, returning how many actions were performed"""
+    heroes = make_heroes()
+    superhero, flyer, techie = heroes
+    actions = 0
+    
+    for round_number in range(rounds):
+        for hero in heroes:
+            hero.use_power("Super Strength")
+            hero.take_damage(5)
+            hero.heal(5)
+            hero.fight_villain("Kryptonite Man" if round_number % 2 else "Ares")
+            hero.rest(40)
+            actions += 5
+        superhero.save_citizen()
+        flyer.take_off()
+        flyer.fly_to_altitude(800)
+        flyer.land()
+        techie.use_gadget("Scanner")
+        techie.recharge_suit()
+        superhero.rest(40)
+        flyer.rest(40)
+        actions += 8
+    return actions
+
+def benchmark_sink(name, rounds):
+    """Time run_actions() with the named sink installed, returning actions per second"""
+    with open(os.devnull, 'w') as devnull:
+        sinks = {
+            "print": events.PrintSink(devnull),
+            "collect": events.CollectSink(),
+            "count": events.CountingSink(),
+            "quiet": None,
+        }
+        with events.use_sink(sinks[name]):
+            start = time.perf_counter()
+            actions = run_actions(rounds)
+            seconds = time.perf_counter() - start
+    return actions / seconds
+
+def main():
+    """Run the benchmark for every sink and print actions per second"""
+    parser = argparse.ArgumentParser(description="Benchmark hero actions under each event sink")
+    parser.add_argument("--rounds", type=int, default=20000, help="rounds of the action mix per sink")
+    args = parser.parse_args()
+    
+    print("🦸 HERO EVENT SINK BENCHMARK")
+    print("=" * 60)
+    baseline = None
+    for name in ["print", "collect", "count", "quiet"]:
+        rate = benchmark_sink(name, args.rounds)
+        baseline = baseline or rate
+        print(f"{name:<8} {rate:>12,.0f} actions/s  ({rate / baseline:.2f}x print)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Memory benchmark: bytes per hero object
+- slotted: the current classes (__slots__, shared interned power/gadget tuples)
+- dict: the old layout rebuilt for comparison (an instance __dict__ of name-mangled
+  keys and a private list of powers/gadgets per hero)
+"""
+
+import argparse
+import tracemalloc
+
+import events
+from flying_hero import FlyingHero
+from superhero import Superhero
+from tech_hero import TechHero
+
+# Which class prefix each exported state key was stored under in the old layout
+STATE_OWNERS = {
+    "name": "_Person__name", "age": "_Person__age", "gender": "_Person__gender", "health": "_health",
+    "hero_name": "_Superhero__hero_name", "powers": "_Superhero__powers",
+    "weakness": "_Superhero__weakness", "energy": "_energy",
+    "identity_revealed": "_Superhero__secret_identity_revealed",
+    "max_altitude": "_FlyingHero__max_altitude", "current_altitude": "_FlyingHero__current_altitude",
+    "is_flying": "_FlyingHero__is_flying",
+    "intelligence_level": "_TechHero__intelligence_level", "gadgets": "_TechHero__gadgets",
+    "suit_power": "_TechHero__suit_power", "hacking_tools_active": "_TechHero__hacking_tools_active",
+    "position": "_TechHero__position",
+}
+
+class DictLayoutHero:
+    """Replica of the pre-__slots__ layout: every attribute in the instance __dict__"""
+    
+    def __init__(self, state):
+        for key, value in state.items():
+            # Lists were built per hero, and names weren't shared between heroes
+            if isinstance(value, list):
+                value = [name.encode().decode() for name in value]
+            setattr(self, STATE_OWNERS[key], value)
+
+def make_hero(kind, number):
+    """Create one hero of the given kind"""
+    name = f"Citizen {number}"
+    if kind == "superhero":
+        return Superhero(name, 30, "Female", f"Hero {number}", ["Super Strength", "rescue"], "Magic")
+    if kind == "flying":
+        return FlyingHero(name, 32, "Male", f"Flyer {number}", ["Super Strength", "rescue"], "Kryptonite")
+    return TechHero(name, 45, "Male", f"Techie {number}", ["Genius Intellect"], "EMP", intelligence_level=95)
+
+def bytes_per_hero(kind, layout, count):
+    """Memory traced while creating count heroes, divided by count"""
+    with events.quiet():
+        # Both layouts are built from the same states, so per-hero names are counted for neither
+        heroes = [make_hero(kind, number) for number in range(count)]
+        states = [hero._export_state() for hero in heroes]
+        hero_class = type(heroes[0])
+        del heroes
+        
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        if layout == "dict":
+            heroes = [DictLayoutHero(state) for state in states]
+        else:
+            heroes = [hero_class._from_state(state) for state in states]
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+    del heroes
+    return used / count
+
+def main():
+    """Measure bytes per hero for each kind and layout"""
+    parser = argparse.ArgumentParser(description="Measure memory used per hero object")
+    parser.add_argument("--count", type=int, default=100000, help="heroes created per measurement")
+    args = parser.parse_args()
+    
+    print("🦸 HERO MEMORY BENCHMARK")
+    print("=" * 60)
+    for kind in ["superhero", "flying", "tech"]:
+        dict_bytes = bytes_per_hero(kind, "dict", args.count)
+        slotted_bytes = bytes_per_hero(kind, "slotted", args.count)
+        print(f"{kind:<10} dict {dict_bytes:>7.0f} B/hero   slotted {slotted_bytes:>7.0f} B/hero  "
+              f"({1 - slotted_bytes / dict_bytes:.0%} smaller)")
+
+if __name__ == "__main__":
+    main()
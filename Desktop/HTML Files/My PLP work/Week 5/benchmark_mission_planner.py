@@ -0,0 +1,77 @@
+"""
+Benchmark of the mission planner
+- Plans mission queues for thousands of flying and tech heroes in different states
+- Runs every plan on the real hero and checks each mission succeeds (the villain doesn't
+  exploit the flyers' Kryptonite weakness, so a lost fight means a bad plan too)
+- Exits with status 1 if any planned mission fails
+"""
+
+import argparse
+import random
+import sys
+import time
+
+import events
+from flying_hero import FlyingHero
+from mission_planner import execute_plan, plan_missions
+from tech_hero import TechHero
+
+MISSION_STEPS = {"aerial_rescue", "sky_patrol", "fight_villain", "tech_rescue", "hack_system", "use_gadget"}
+
+def make_queues(count, length, rng):
+    """A few shared mission queues of each kind"""
+    flying, tech = [], []
+    for _ in range(count):
+        flying.append([rng.choice([("rescue", rng.randrange(100, 3000, 100)), ("patrol", rng.randrange(500, 5000, 100)),
+                                   ("fight", "Doctor Chaos")]) for _ in range(length)])
+        tech.append([rng.choice([("rescue", "standard"), ("rescue", "building_collapse"), ("rescue", "cyber_attack"),
+                                 ("hack", "Mainframe"), ("gadget", "Scanner", 8)]) for _ in range(length)])
+    return flying, tech
+
+def make_hero(number, rng):
+    """A flying or tech hero with some energy already spent"""
+    if number % 2:
+        hero = FlyingHero(f"Citizen {number}", 30, "Male", f"Flyer {number}", ["rescue"], "Kryptonite")
+    else:
+        hero = TechHero(f"Citizen {number}", 40, "Female", f"Techie {number}", ["rescue"], "EMP")
+        hero.use_gadget("Scanner", rng.randrange(0, 60, 5))
+    hero.set_energy(rng.randrange(20, 101, 5))
+    return hero
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark the hero mission planner")
+    parser.add_argument("--heroes", type=int, default=2000, help="heroes to plan for")
+    parser.add_argument("--missions", type=int, default=200, help="missions per queue")
+    parser.add_argument("--queues", type=int, default=4, help="distinct mission queues of each kind")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    flying_queues, tech_queues = make_queues(args.queues, args.missions, rng)
+    with events.quiet():
+        heroes = [make_hero(number, rng) for number in range(args.heroes)]
+        queues = [rng.choice(flying_queues if isinstance(hero, FlyingHero) else tech_queues) for hero in heroes]
+        
+        start = time.perf_counter()
+        plans = [plan_missions(hero, queue) for hero, queue in zip(heroes, queues)]
+        seconds = time.perf_counter() - start
+        
+        failures = 0
+        for hero, planned in zip(heroes, plans):
+            if planned is None:
+                continue
+            results = execute_plan(hero, planned[0])
+            failures += sum(1 for (name, _), result in zip(planned[0], results)
+                            if name in MISSION_STEPS and not result)  # Some failures return None
+    
+    feasible = sum(planned is not None for planned in plans)
+    print("🦸 MISSION PLANNER BENCHMARK")
+    print("=" * 60)
+    print(f"{args.heroes:,} heroes x {args.missions} missions planned in {seconds:.2f}s "
+          f"({args.heroes / seconds:,.0f} heroes/s, {args.heroes * args.missions / seconds:,.0f} missions/s)")
+    print(f"{feasible:,} feasible plans, {failures} missions failed when the plans were run")
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark of the asyncio mission runner
+- direct: every mission run one at a time in a plain loop (with the same admission control)
+- runner: the same missions through MissionRunner; results and final hero states must match
+- Every admitted mission must finish (a fight may only be lost to the hero's weakness)
+- Exits with status 1 if any check fails
+- timed: missions take scaled real time, so the runner overlaps them; compared with how
+  long a one-at-a-time dispatcher would need for the same missions
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+
+import events
+from benchmark_simulation import VILLAINS, make_heroes
+from flying_hero import FlyingHero
+from mission_runner import MISSIONS, MissionRejected, MissionRunner, admission_problem
+from snapshot import load_snapshot, save_snapshot
+from tech_hero import TechHero
+from weakness_matcher import weakness_exploited
+
+def make_missions(heroes, count, rng):
+    """count random (hero index, mission, *args) tuples suited to each hero"""
+    missions = []
+    for _ in range(count):
+        hero = rng.randrange(len(heroes))
+        roll = rng.random()
+        if roll < 0.2:
+            missions.append((hero, "rest"))
+        elif roll < 0.45:
+            if isinstance(heroes[hero], FlyingHero):
+                missions.append((hero, "fight_villain", rng.choice(VILLAINS), rng.random() < 0.5))
+            else:
+                missions.append((hero, "fight_villain", rng.choice(VILLAINS)))
+        elif isinstance(heroes[hero], FlyingHero):
+            missions.append((hero, "aerial_rescue", rng.randrange(200, 1000, 100)))
+        elif isinstance(heroes[hero], TechHero):
+            missions.append((hero, "tech_rescue") if roll < 0.7 else (hero, "hack_system", "Villain Lair"))
+        else:
+            missions.append((hero, "save_citizen"))
+    return missions
+
+def run_direct(heroes, missions):
+    """Results of running every mission in order, one at a time"""
+    results = []
+    for hero, mission, *args in missions:
+        problem = admission_problem(heroes[hero], mission, args)
+        results.append(MissionRejected(problem) if problem else getattr(heroes[hero], mission)(*args))
+    return results
+
+async def run_runner(heroes, missions, workers, queue_size, time_scale):
+    """Results of the missions run by a MissionRunner, and the runner"""
+    async with MissionRunner(heroes, workers, queue_size, time_scale) as runner:
+        futures = [await runner.submit(*mission) for mission in missions]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+    return results, runner
+
+def failed_partway(heroes, missions, results):
+    """Admitted missions that didn't succeed for any reason other than a weakness"""
+    return sum(1 for (hero, mission, *args), result in zip(missions, results)
+               if not isinstance(result, Exception) and mission != "rest" and not result
+               and not (mission == "fight_villain" and weakness_exploited(heroes[hero].get_weakness(), args[0])))
+
+def same_results(expected, actual):
+    """Equal results, counting any two rejections as equal"""
+    return all(type(a) is type(b) if isinstance(a, Exception) else a == b for a, b in zip(expected, actual))
+
+def states(heroes):
+    """Every hero's exported state, for comparing rosters"""
+    return [hero._export_state() for hero in heroes]
+
+def main():
+    """Time the direct loop and the runner, then check they agree"""
+    parser = argparse.ArgumentParser(description="Benchmark concurrent hero missions")
+    parser.add_argument("--heroes", type=int, default=3000, help="number of heroes")
+    parser.add_argument("--missions", type=int, default=30000, help="number of missions")
+    parser.add_argument("--workers", type=int, default=2000, help="missions in flight at once")
+    parser.add_argument("--queue-size", type=int, default=4000, help="bounded queue size")
+    parser.add_argument("--time-scale", type=float, default=0.001, help="real seconds per simulated second")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    snapshot = save_snapshot(make_heroes(args.heroes))
+    missions = make_missions(load_snapshot(snapshot), args.missions, rng)
+    
+    print("🦸 MISSION RUNNER BENCHMARK")
+    print("=" * 60)
+    with events.quiet():
+        direct_heroes = load_snapshot(snapshot)
+        start = time.perf_counter()
+        expected = run_direct(direct_heroes, missions)
+        seconds = time.perf_counter() - start
+        print(f"direct   {seconds:>8.3f}s  {len(missions) / seconds:>10,.0f} missions/s  (no mission time)")
+        
+        runner_heroes = load_snapshot(snapshot)
+        start = time.perf_counter()
+        results, runner = asyncio.run(run_runner(runner_heroes, missions, args.workers, args.queue_size, 0.0))
+        seconds = time.perf_counter() - start
+        print(f"runner   {seconds:>8.3f}s  {len(missions) / seconds:>10,.0f} missions/s  (no mission time)")
+        ok = same_results(expected, results) and states(direct_heroes) == states(runner_heroes)
+        
+        timed_heroes = load_snapshot(snapshot)
+        start = time.perf_counter()
+        results, runner = asyncio.run(run_runner(timed_heroes, missions, args.workers, args.queue_size,
+                                                 args.time_scale))
+        seconds = time.perf_counter() - start
+        one_at_a_time = sum(MISSIONS[mission[1]][1] for mission, result in zip(missions, results)
+                            if not isinstance(result, Exception)) * args.time_scale
+        print(f"timed    {seconds:>8.3f}s  {len(missions) / seconds:>10,.0f} missions/s  "
+              f"(one at a time: {one_at_a_time:,.1f}s)")
+        print(f"         completed {runner.completed:,}, rejected {runner.rejected:,}, failed {runner.failed:,}, "
+              f"peak in flight {runner.peak_running:,}")
+        ok &= same_results(expected, results) and states(direct_heroes) == states(timed_heroes)
+        partway = failed_partway(direct_heroes, missions, expected)
+    print("✅ Same results and hero states as the direct loop" if ok else "❌ Results differ!")
+    print(f"{'✅' if not partway else '❌'} {partway} admitted missions failed partway")
+    if not ok or partway:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark of the discrete-event simulation kernel
+- Gives every hero a long random plan of timed actions and runs the timeline to the end
+- Reports events handled per second (hero events are silenced)
+"""
+
+import argparse
+import random
+import time
+
+import events
+from flying_hero import FlyingHero
+from simulation import FIGHT, FLY, LAND, POWER, RESCUE, REST, TAKE_OFF, Simulation
+from superhero import Superhero
+from tech_hero import TechHero
+
+VILLAINS = ["Lex Luthor", "Kryptonite Man", "Cyber Skull", "Magic Mike"]
+
+def make_heroes(count):
+    """count heroes, a third of each kind"""
+    heroes = []
+    for number in range(count):
+        if number % 3 == 0:
+            heroes.append(Superhero(f"Citizen {number}", 30, "Female", f"Hero {number}", ["Super Strength", "rescue"], "Magic"))
+        elif number % 3 == 1:
+            heroes.append(FlyingHero(f"Citizen {number}", 32, "Male", f"Flyer {number}", ["rescue"], "Kryptonite"))
+        else:
+            heroes.append(TechHero(f"Citizen {number}", 45, "Male", f"Techie {number}", ["rescue"], "EMP"))
+    return heroes
+
+def make_plan(hero, actions, rng):
+    """A random list of (action, argument) pairs suited to the hero"""
+    plan = []
+    for _ in range(actions):
+        roll = rng.random()
+        if isinstance(hero, FlyingHero) and roll < 0.4:
+            plan.extend([(TAKE_OFF, None), (FLY, rng.randrange(200, 5000, 100)), (LAND, None)])
+        elif roll < 0.55:
+            plan.append((FIGHT, rng.choice(VILLAINS)))
+        elif roll < 0.7:
+            plan.append((RESCUE, None))
+        elif roll < 0.85:
+            plan.append((POWER, "rescue"))
+        else:
+            plan.append((REST, rng.uniform(2, 20)))
+    return plan
+
+def main():
+    """Run the benchmark and print events per second"""
+    parser = argparse.ArgumentParser(description="Benchmark the hero discrete-event simulation")
+    parser.add_argument("--heroes", type=int, default=1000, help="number of heroes")
+    parser.add_argument("--actions", type=int, default=500, help="planned actions per hero")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    with events.quiet():
+        simulation = Simulation(make_heroes(args.heroes))
+        plans = {index: make_plan(hero, args.actions, rng) for index, hero in enumerate(simulation.heroes)}
+        simulation.submit_many(plans)
+        
+        start = time.perf_counter()
+        handled = simulation.run()
+        seconds = time.perf_counter() - start
+    
+    print("🦸 HERO SIMULATION BENCHMARK")
+    print("=" * 60)
+    print(f"{handled:,} events in {seconds:.2f}s ({handled / seconds:,.0f} events/s), "
+          f"{simulation.now:,.0f} simulated seconds")
+
+if __name__ == "__main__":
+    main()
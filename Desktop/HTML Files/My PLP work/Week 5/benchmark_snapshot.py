@@ -0,0 +1,90 @@
+"""
+Benchmark of roster snapshots
+- Full snapshot and restore of a large roster, in MB/s both ways
+- A delta snapshot after changing a small share of the heroes
+- Checks that every restored hero has exactly the state of the original, and that a
+  delta that fails to pack leaves the writer able to send the next one
+- Exits with status 1 if any check fails
+"""
+
+import argparse
+import random
+import sys
+import time
+
+import events
+from benchmark_simulation import make_heroes
+from person import Person
+from snapshot import SnapshotError, SnapshotReader, SnapshotWriter
+
+def mutate(heroes, share, rng):
+    """Change a random share of the heroes"""
+    for hero in rng.sample(heroes, int(len(heroes) * share)):
+        hero.take_damage(rng.randint(1, 20))
+        hero.use_power("rescue")
+        if rng.random() < 0.1:
+            hero.add_power(f"Power {rng.randint(1, 50)}")
+
+def same_state(originals, restored):
+    """Check restored heroes against the originals, field by field"""
+    return (len(originals) == len(restored)
+            and all(type(a) is type(b) and a._export_state() == b._export_state() for a, b in zip(originals, restored)))
+
+def failed_delta_recovers(heroes):
+    """A delta that can't be packed (a float health) must not change what the writer sends next"""
+    writer, reader = SnapshotWriter(), SnapshotReader()
+    reader.apply(writer.full(heroes))
+    heroes[0].add_power("Power that was never sent")
+    heroes[-1].take_damage(0.5)
+    try:
+        writer.delta(heroes)
+        return False
+    except SnapshotError:
+        pass
+    heroes[-1]._health = int(heroes[-1]._health)
+    return same_state(heroes, reader.apply(writer.delta(heroes)))
+
+def timed(function, *args):
+    """Result of a call and the seconds it took"""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    """Run the snapshot benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark binary hero roster snapshots")
+    parser.add_argument("--heroes", type=int, default=200000, help="heroes in the roster")
+    parser.add_argument("--changed", type=float, default=0.01, help="share of heroes changed before the delta")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    with events.quiet():
+        heroes = make_heroes(args.heroes) + [Person("Alice Johnson", 28, "Female")]
+        writer, reader = SnapshotWriter(), SnapshotReader()
+        
+        full, write_seconds = timed(writer.full, heroes)
+        restored, read_seconds = timed(reader.apply, full)
+        megabytes = len(full) / 1024 / 1024
+        ok = same_state(heroes, restored)
+        
+        print("🦸 HERO SNAPSHOT BENCHMARK")
+        print("=" * 60)
+        print(f"full    {megabytes:8.2f} MB  write {megabytes / write_seconds:7.1f} MB/s  "
+              f"read {megabytes / read_seconds:7.1f} MB/s  "
+              f"({'round-trips' if ok else 'MISMATCH'})")
+        
+        mutate(heroes, args.changed, rng)
+        delta, write_seconds = timed(writer.delta, heroes)
+        restored, read_seconds = timed(reader.apply, delta)
+        ok &= same_state(heroes, restored)
+        print(f"delta   {len(delta) / 1024:8.1f} KB  write {write_seconds * 1000:7.1f} ms     "
+              f"read {read_seconds * 1000:7.1f} ms     "
+              f"({'round-trips' if ok else 'MISMATCH'})")
+        
+        recovers = failed_delta_recovers(make_heroes(100) + [Person("Bob Smith", 35, "Male")])
+        print(f"failed delta: {'writer recovers' if recovers else 'writer is LEFT OUT OF STEP'}")
+    if not (ok and recovers):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark of weakness checks for many heroes against many villains
+- naive: lowercase the weakness and the villain name for every pair, then search
+- matcher: one WeaknessMatcher pass per villain name
+Both must find exactly the same (villain, hero) pairs.
+"""
+
+import argparse
+import random
+import time
+
+from weakness_matcher import WeaknessMatcher
+
+WEAKNESSES = ["Kryptonite", "Magic", "EMP", "Water", "Fire", "Wood", "Yellow", "Lead", "Sonic", "Mind Control",
+              "Iron", "Silver", "Salt", "Sunlight", "Cold", "Gamma", "Vibranium", "Chaos", "Light", "Shadow"]
+NAME_PARTS = ["Doctor", "Captain", "Lord", "Baron", "Cyber", "Tech", "Mega", "Dark", "Man", "Queen", "Beast"]
+
+class NamedHero:
+    """Just enough of a hero for the matcher: a weakness"""
+    __slots__ = ("weakness",)
+    
+    def __init__(self, weakness):
+        self.weakness = weakness
+    
+    def get_weakness(self):
+        """Same accessor as Superhero.get_weakness()"""
+        return self.weakness
+
+def make_villains(count, rng):
+    """Villain names, some of them containing a weakness"""
+    villains = []
+    for _ in range(count):
+        parts = rng.sample(NAME_PARTS, 2)
+        if rng.random() < 0.3:
+            parts.insert(1, rng.choice(WEAKNESSES).lower() if rng.random() < 0.5 else rng.choice(WEAKNESSES))
+        villains.append(" ".join(parts))
+    return villains
+
+def naive_pairs(heroes, villains):
+    """(villain index, hero index) pairs found the way fight_villain() used to"""
+    return {(v, h) for v, villain in enumerate(villains) for h, hero in enumerate(heroes)
+            if hero.weakness and hero.weakness.lower() in villain.lower()}
+
+def matcher_pairs(heroes, villains):
+    """(villain index, hero index) pairs found with one matcher pass per villain"""
+    matcher = WeaknessMatcher.from_heroes(heroes)
+    index = {id(hero): h for h, hero in enumerate(heroes)}
+    return {(v, index[id(hero)]) for v, villain in enumerate(matcher.prepare_all(villains))
+            for hero in matcher.heroes_exploited_by(villain)}
+
+def main():
+    """Time both approaches and check they agree"""
+    parser = argparse.ArgumentParser(description="Benchmark weakness matching for many heroes and villains")
+    parser.add_argument("--heroes", type=int, default=2000, help="number of heroes")
+    parser.add_argument("--villains", type=int, default=2000, help="number of villains")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    heroes = [NamedHero(rng.choice(WEAKNESSES + [None])) for _ in range(args.heroes)]
+    villains = make_villains(args.villains, rng)
+    
+    print("🦸 WEAKNESS MATCHING BENCHMARK")
+    print("=" * 60)
+    results = {}
+    for name, find_pairs in [("naive", naive_pairs), ("matcher", matcher_pairs)]:
+        start = time.perf_counter()
+        results[name] = find_pairs(heroes, villains)
+        seconds = time.perf_counter() - start
+        print(f"{name:<8} {seconds:>8.3f}s  {len(results[name]):,} exploited pairs")
+    print("✅ Same pairs found" if results["naive"] == results["matcher"] else "❌ Results differ!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+City map: a uniform grid spatial index of threats and points of interest
+- Space is cut into square cells; each cell lists the threats inside it, so a query
+  only looks at the few cells that can hold an answer
+- Radius queries and k-nearest queries from any position
+- Named areas (a centre and a radius) cache their scan results; adding, moving or
+  removing a threat drops only the cached areas that cover its cell
+- Batch queries for many heroes share the candidate lists of heroes in the same cell
+"""
+
+import math
+
+DEFAULT_CELL_SIZE = 100.0  # Metres per grid cell
+DEFAULT_SCAN_RADIUS = 250.0  # Radius of a TechHero scan without a named area
+
+class CityMap:
+    """Threats and points of interest held in a grid"""
+    
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell x, cell y) -> threat ids in the cell
+        self.xs = []  # Threat id -> x
+        self.ys = []  # Threat id -> y
+        self.names = []  # Threat id -> name (None once removed)
+        self.count = 0  # Threats currently on the map
+        self.bounds = None  # (min cell x, min cell y, max cell x, max cell y) ever used
+        self.areas = {}  # Area name -> (x, y, radius)
+        self._area_cache = {}  # Area name -> threat names found by the last scan
+        self._cell_areas = {}  # Cell -> names of cached areas that cover it
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def cell_of(self, x, y):
+        """Grid cell holding a position"""
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+    
+    # Changing the map
+    def _grow_bounds(self, cell):
+        if self.bounds is None:
+            self.bounds = (cell[0], cell[1], cell[0], cell[1])
+        else:
+            min_x, min_y, max_x, max_y = self.bounds
+            self.bounds = (min(min_x, cell[0]), min(min_y, cell[1]), max(max_x, cell[0]), max(max_y, cell[1]))
+    
+    def _invalidate(self, cell):
+        """Forget the cached scans of every area covering a cell"""
+        for area in self._cell_areas.pop(cell, ()):
+            self._area_cache.pop(area, None)
+    
+    def add_threat(self, name, x, y):
+        """Put a threat on the map, returning its id"""
+        threat = len(self.names)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.names.append(name)
+        cell = self.cell_of(x, y)
+        self.cells.setdefault(cell, []).append(threat)
+        self._grow_bounds(cell)
+        self._invalidate(cell)
+        self.count += 1
+        return threat
+    
+    def add_threats(self, threats):
+        """Put many (name, x, y) threats on the map at once (clears every cached scan)"""
+        cells = self.cells
+        size = self.cell_size
+        floor = math.floor
+        first = len(self.names)
+        for threat, (name, x, y) in enumerate(threats, first):
+            self.xs.append(x)
+            self.ys.append(y)
+            self.names.append(name)
+            cell = (floor(x / size), floor(y / size))
+            bucket = cells.get(cell)
+            if bucket is None:
+                cells[cell] = [threat]
+                self._grow_bounds(cell)
+            else:
+                bucket.append(threat)
+        self.count += len(self.names) - first
+        self._area_cache.clear()
+        self._cell_areas.clear()
+        return range(first, len(self.names))
+    
+    def move_threat(self, threat, x, y):
+        """Move a threat to a new position"""
+        old_cell = self.cell_of(self.xs[threat], self.ys[threat])
+        new_cell = self.cell_of(x, y)
+        self.xs[threat] = x
+        self.ys[threat] = y
+        if new_cell != old_cell:
+            self.cells[old_cell].remove(threat)
+            self.cells.setdefault(new_cell, []).append(threat)
+            self._grow_bounds(new_cell)
+        self._invalidate(old_cell)
+        self._invalidate(new_cell)
+    
+    def remove_threat(self, threat):
+        """Take a threat off the map"""
+        cell = self.cell_of(self.xs[threat], self.ys[threat])
+        self.cells[cell].remove(threat)
+        self.names[threat] = None
+        self.count -= 1
+        self._invalidate(cell)
+    
+    def define_area(self, area_name, x, y, radius):
+        """Name a circular area so scans of it can be cached"""
+        self.areas[area_name] = (x, y, radius)
+        self._area_cache.pop(area_name, None)
+    
+    # Queries
+    def _cells_around(self, x, y, radius):
+        """Cells overlapping the square around a circle"""
+        size = self.cell_size
+        floor = math.floor
+        return [(cell_x, cell_y)
+                for cell_x in range(floor((x - radius) / size), floor((x + radius) / size) + 1)
+                for cell_y in range(floor((y - radius) / size), floor((y + radius) / size) + 1)]
+    
+    def within_radius(self, x, y, radius):
+        """Ids of the threats within radius of a position, nearest first"""
+        xs, ys, cells = self.xs, self.ys, self.cells
+        limit = radius * radius
+        found = []
+        for cell in self._cells_around(x, y, radius):
+            for threat in cells.get(cell, ()):
+                dx = xs[threat] - x
+                dy = ys[threat] - y
+                distance = dx * dx + dy * dy
+                if distance <= limit:
+                    found.append((distance, threat))
+        found.sort()
+        return [threat for _, threat in found]
+    
+    def nearest(self, x, y, k=1):
+        """Ids of the k threats nearest a position, nearest first"""
+        if k <= 0 or not self.count:
+            return []
+        xs, ys, cells = self.xs, self.ys, self.cells
+        center_x, center_y = self.cell_of(x, y)
+        min_x, min_y, max_x, max_y = self.bounds
+        max_ring = max(center_x - min_x, max_x - center_x, center_y - min_y, max_y - center_y, 0)
+        found = []
+        ring = 0
+        while ring <= max_ring:
+            if ring == 0:
+                ring_cells = [(center_x, center_y)]
+            else:
+                low_x, high_x, low_y, high_y = center_x - ring, center_x + ring, center_y - ring, center_y + ring
+                ring_cells = [(cell_x, low_y) for cell_x in range(low_x, high_x + 1)]
+                ring_cells += [(cell_x, high_y) for cell_x in range(low_x, high_x + 1)]
+                ring_cells += [(low_x, cell_y) for cell_y in range(low_y + 1, high_y)]
+                ring_cells += [(high_x, cell_y) for cell_y in range(low_y + 1, high_y)]
+            for cell in ring_cells:
+                for threat in cells.get(cell, ()):
+                    dx = xs[threat] - x
+                    dy = ys[threat] - y
+                    found.append((dx * dx + dy * dy, threat))
+            if len(found) >= k:
+                found.sort()
+                del found[k:]
+                # Anything beyond this ring is at least ring cells away
+                reach = ring * self.cell_size
+                if found[-1][0] <= reach * reach:
+                    break
+            ring += 1
+        found.sort()
+        return [threat for _, threat in found[:k]]
+    
+    def scan(self, x, y, radius=DEFAULT_SCAN_RADIUS):
+        """Names of the threats within radius of a position, nearest first"""
+        names = self.names
+        return [names[threat] for threat in self.within_radius(x, y, radius)]
+    
+    def scan_area(self, area_name):
+        """Names of the threats in a named area (cached until a threat in it changes)"""
+        cached = self._area_cache.get(area_name)
+        if cached is not None:
+            self.cache_hits += 1
+            return list(cached)  # A copy, so callers can't change the cache
+        self.cache_misses += 1
+        x, y, radius = self.areas[area_name]
+        result = self.scan(x, y, radius)
+        self._area_cache[area_name] = result
+        for cell in self._cells_around(x, y, radius):
+            self._cell_areas.setdefault(cell, set()).add(area_name)
+        return list(result)
+    
+    def batch_within_radius(self, positions, radius):
+        """
+        within_radius() for many (x, y) positions
+        - Positions in the same cell share one list of candidate threats
+        """
+        xs, ys, cells = self.xs, self.ys, self.cells
+        limit = radius * radius
+        reach = math.ceil(radius / self.cell_size)
+        candidates_by_cell = {}
+        results = []
+        for x, y in positions:
+            cell = self.cell_of(x, y)
+            candidates = candidates_by_cell.get(cell)
+            if candidates is None:
+                candidates = [threat
+                              for cell_x in range(cell[0] - reach, cell[0] + reach + 1)
+                              for cell_y in range(cell[1] - reach, cell[1] + reach + 1)
+                              for threat in cells.get((cell_x, cell_y), ())]
+                candidates_by_cell[cell] = candidates
+            found = []
+            for threat in candidates:
+                dx = xs[threat] - x
+                dy = ys[threat] - y
+                distance = dx * dx + dy * dy
+                if distance <= limit:
+                    found.append((distance, threat))
+            found.sort()
+            results.append([threat for _, threat in found])
+        return results
+    
+    def batch_scan(self, heroes, radius=DEFAULT_SCAN_RADIUS):
+        """Threat names around each hero's position (heroes need get_position())"""
+        names = self.names
+        return [[names[threat] for threat in found]
+                for found in self.batch_within_radius([hero.get_position() for hero in heroes], radius)]
@@ -0,0 +1,162 @@
+"""
+Event sinks for hero actions
+- Every state change in the hero classes is reported as an event instead of a print()
+- The default PrintSink renders and prints each event, so the demos look exactly the same
+- Quiet sinks keep compact event records (or nothing) and only render text when asked
+"""
+
+import sys
+from contextlib import contextmanager
+
+# Message template for each kind of event (positional arguments, rendered only on demand)
+EVENT_TEMPLATES = {
+    # Person
+    "invalid_name": "Invalid name!",
+    "invalid_age": "Invalid age!",
+    "invalid_health": "Health must be between 0 and 100!",
+    "birthday": "Happy birthday! {0} is now {1} years old.",
+    "take_damage": "{0} took {1} damage. Health: {2}",
+    "heal": "{0} healed for {1}. Health: {2}",
+    # Superhero
+    "invalid_hero_name": "Invalid hero name!",
+    "add_power": "{0} gained new power: {1}",
+    "power_exists": "{0} already has the power: {1}",
+    "invalid_energy": "Energy must be between 0 and 100!",
+    "reveal_identity": "BREAKING NEWS: {0} is actually {1}!",
+    "use_power": "{0} uses {1}! Energy remaining: {2}",
+    "power_no_energy": "{0} doesn't have enough energy to use {1}!",
+    "power_missing": "{0} doesn't have the power: {1}",
+    "rest": "{0} rests and regains energy. Energy: {1}",
+    "save_citizen": "{0} heroically saves a citizen!",
+    "fight": "{0} fights {1}! Energy remaining: {2}",
+    "weakness_exploited": "Oh no! {1} exploited {0}'s weakness: {2}!",
+    "villain_defeated": "{0} defeats {1}!",
+    "too_tired_to_fight": "{0} is too tired to fight!",
+    # FlyingHero
+    "take_off": "{0} takes off and starts flying at {1} feet!",
+    "already_flying": "{0} is already flying!",
+    "land": "{0} lands safely on the ground.",
+    "already_landed": "{0} is already on the ground!",
+    "not_flying": "{0} must take off first!",
+    "altitude_too_high": "{0} cannot fly above {1} feet!",
+    "altitude_below_ground": "Cannot fly below ground level!",
+    "fly_to_altitude": "{0} flies to {1} feet. Energy: {2}",
+    "altitude_no_energy": "{0} doesn't have enough energy to change altitude!",
+    "aerial_rescue": "{0} performs a daring aerial rescue at {1} feet!",
+    "sky_patrol": "{0} patrols the skies at {1} feet, watching for trouble.",
+    "too_tired_to_patrol": "{0} is too tired to patrol!",
+    "aerial_combat_takeoff": "{0} takes to the skies for aerial combat!",
+    "aerial_combat": "{0} engages {1} in aerial combat!",
+    "aerial_advantage": "Aerial advantage! {0} has the upper hand!",
+    "too_tired_for_aerial_combat": "{0} is too tired for aerial combat!",
+    "land_to_rest": "{0} lands to rest properly.",
+    # TechHero
+    "add_gadget": "{0} acquires new gadget: {1}",
+    "gadget_exists": "{0} already has: {1}",
+    "use_gadget": "{0} uses {1}! Suit power: {2}%",
+    "gadget_no_power": "{0}'s suit doesn't have enough power for {1}!",
+    "gadget_missing": "{0} doesn't have gadget: {1}",
+    "hack_success": "{0} successfully hacks into {1}!",
+    "hack_failed": "{0} failed to hack {1}. Need higher intelligence or better tools.",
+    "hacking_tools_active": "{0} activates advanced hacking tools!",
+    "scan_area": lambda hero, area, found: f"{hero} scans {area} and finds: {', '.join(found)}",
+    "thermal_scan": "{0} uses thermal scanning to locate survivors!",
+    "coordinate_rescue": "Coordinating rescue with emergency services via communication device!",
+    "cyber_attack_stopped": "{0} stops the cyber attack and restores systems!",
+    "recharge_suit": "{0}'s suit recharges. Power level: {1}%",
+    "upgrade_intelligence": "{0}'s intelligence increased from {1} to {2}!",
+    "max_intelligence": "{0} has reached maximum intelligence level!",
+    "analyze_villain": "{0} analyzes {1} with advanced scanners...",
+    "tech_battle": "Tech battle detected! {0} initiates cyber warfare!",
+    "tech_disabled": "{0} disables {1}'s technology!",
+    "tactical_analysis": "{0} uses tactical analysis and coordination!",
+}
+
+def render(kind, args):
+    """Turn an event into the message the hero classes used to print"""
+    template = EVENT_TEMPLATES[kind]
+    if callable(template):
+        return template(*args)
+    return template.format(*args)
+
+class HeroEvent:
+    """A compact record of one hero action: its kind and the values needed to describe it"""
+    __slots__ = ("kind", "args")
+    
+    def __init__(self, kind, args):
+        self.kind = kind
+        self.args = args
+    
+    def render(self):
+        """Render the event as text"""
+        return render(self.kind, self.args)
+    
+    def __repr__(self):
+        return f"HeroEvent({self.kind!r}, {self.args!r})"
+
+class PrintSink:
+    """Default sink: render and print every event right away (the original behaviour)"""
+    
+    def __init__(self, stream=None):
+        self.stream = stream  # None means whatever sys.stdout is at the time
+    
+    def emit(self, kind, args):
+        print(render(kind, args), file=self.stream or sys.stdout)
+
+class CollectSink:
+    """Quiet sink that keeps every event as a record, rendering text only when asked"""
+    
+    def __init__(self):
+        self.events = []
+    
+    def emit(self, kind, args):
+        self.events.append(HeroEvent(kind, args))
+    
+    def render_all(self):
+        """Render every collected event as text"""
+        return [event.render() for event in self.events]
+    
+    def clear(self):
+        """Forget the collected events"""
+        self.events.clear()
+
+class CountingSink:
+    """Quiet sink that only counts events of each kind"""
+    
+    def __init__(self):
+        self.counts = {}
+    
+    def emit(self, kind, args):
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+
+# The sink every hero reports to; None drops events without looking at them
+_sink = PrintSink()
+
+def get_sink():
+    """Return the current event sink"""
+    return _sink
+
+def set_sink(sink):
+    """Replace the event sink (None silences heroes completely) and return the previous one"""
+    global _sink
+    previous = _sink
+    _sink = sink
+    return previous
+
+@contextmanager
+def use_sink(sink):
+    """Temporarily send hero events to another sink"""
+    previous = set_sink(sink)
+    try:
+        yield sink
+    finally:
+        set_sink(previous)
+
+def quiet():
+    """Temporarily drop all hero events"""
+    return use_sink(None)
+
+def emit(kind, *args):
+    """Report a hero event to the current sink"""
+    if _sink is not None:
+        _sink.emit(kind, args)
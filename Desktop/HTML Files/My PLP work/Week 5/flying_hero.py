@@ -3,11 +3,17 @@ FlyingHero class demonstrating further inheritance and polymorphism
 - Inherits from Superhero class
 - Adds flying-specific abilities and attributes
 - Demonstrates method overriding for specialized behavior
+- Internally uses the protected _energy attribute directly (like Superhero does):
+  the costs are checked first, so set_energy()'s validation could never fail here,
+  and skipping the getter/setter calls makes flying actions noticeably faster
 """
 
+from events import emit
 from superhero import Superhero
 
 class FlyingHero(Superhero):
+    __slots__ = ("__max_altitude", "__current_altitude", "__is_flying")
+    
     def __init__(self, name, age, gender, hero_name, powers, weakness=None, max_altitude=10000):
         """Constructor for flying superhero"""
         # Ensure flight is in powers
@@ -42,10 +48,10 @@ class FlyingHero(Superhero):
             if self.use_power("flight", 5):
                 self.__is_flying = True
                 self.__current_altitude = 100  # Start at 100 feet
-                print(f"{self.get_hero_name()} takes off and starts flying at {self.__current_altitude} feet!")
+                emit("take_off", self.get_hero_name(), self.__current_altitude)
                 return True
         else:
-            print(f"{self.get_hero_name()} is already flying!")
+            emit("already_flying", self.get_hero_name())
         return False
     
     def land(self):
@@ -53,34 +59,34 @@ class FlyingHero(Superhero):
         if self.__is_flying:
             self.__is_flying = False
             self.__current_altitude = 0
-            print(f"{self.get_hero_name()} lands safely on the ground.")
+            emit("land", self.get_hero_name())
             return True
         else:
-            print(f"{self.get_hero_name()} is already on the ground!")
+            emit("already_landed", self.get_hero_name())
             return False
     
     def fly_to_altitude(self, target_altitude):
         """Fly to a specific altitude"""
         if not self.__is_flying:
-            print(f"{self.get_hero_name()} must take off first!")
+            emit("not_flying", self.get_hero_name())
             return False
         
         if target_altitude > self.__max_altitude:
-            print(f"{self.get_hero_name()} cannot fly above {self.__max_altitude} feet!")
+            emit("altitude_too_high", self.get_hero_name(), self.__max_altitude)
             return False
         
         if target_altitude < 0:
-            print("Cannot fly below ground level!")
+            emit("altitude_below_ground")
             return False
         
         energy_cost = abs(target_altitude - self.__current_altitude) // 100  # 1 energy per 100 feet
-        if self.get_energy() >= energy_cost:
-            self.set_energy(self.get_energy() - energy_cost)
+        if self._energy >= energy_cost:
+            self._energy -= energy_cost
             self.__current_altitude = target_altitude
-            print(f"{self.get_hero_name()} flies to {target_altitude} feet. Energy: {self.get_energy()}")
+            emit("fly_to_altitude", self.get_hero_name(), target_altitude, self._energy)
             return True
         else:
-            print(f"{self.get_hero_name()} doesn't have enough energy to change altitude!")
+            emit("altitude_no_energy", self.get_hero_name())
             return False
     
     def aerial_rescue(self, rescue_altitude=500):
@@ -91,7 +97,7 @@ class FlyingHero(Superhero):
         
         if self.fly_to_altitude(rescue_altitude):
             if self.use_power("rescue", 20):
-                print(f"{self.get_hero_name()} performs a daring aerial rescue at {rescue_altitude} feet!")
+                emit("aerial_rescue", self.get_hero_name(), rescue_altitude)
                 return True
         return False
     
@@ -103,12 +109,12 @@ class FlyingHero(Superhero):
         
         if self.fly_to_altitude(patrol_altitude):
             energy_cost = 15
-            if self.get_energy() >= energy_cost:
-                self.set_energy(self.get_energy() - energy_cost)
-                print(f"{self.get_hero_name()} patrols the skies at {patrol_altitude} feet, watching for trouble.")
+            if self._energy >= energy_cost:
+                self._energy -= energy_cost
+                emit("sky_patrol", self.get_hero_name(), patrol_altitude)
                 return True
             else:
-                print(f"{self.get_hero_name()} is too tired to patrol!")
+                emit("too_tired_to_patrol", self.get_hero_name())
         return False
     
     # Override fight_villain to include aerial combat
@@ -116,19 +122,19 @@ class FlyingHero(Superhero):
         """Fight a villain with option for aerial combat"""
         if aerial_combat:
             if not self.__is_flying:
-                print(f"{self.get_hero_name()} takes to the skies for aerial combat!")
+                emit("aerial_combat_takeoff", self.get_hero_name())
                 if not self.take_off():
                     return False
             
             if self.fly_to_altitude(500):  # Fight at 500 feet
-                print(f"{self.get_hero_name()} engages {villain_name} in aerial combat!")
+                emit("aerial_combat", self.get_hero_name(), villain_name)
                 # Aerial combat uses more energy but is more effective
-                if self.get_energy() >= 30:
-                    self.set_energy(self.get_energy() - 30)
-                    print(f"Aerial advantage! {self.get_hero_name()} has the upper hand!")
+                if self._energy >= 30:
+                    self._energy -= 30
+                    emit("aerial_advantage", self.get_hero_name())
                     return super().fight_villain(villain_name)
                 else:
-                    print(f"{self.get_hero_name()} is too tired for aerial combat!")
+                    emit("too_tired_for_aerial_combat", self.get_hero_name())
                     return False
         else:
             # Regular ground combat
@@ -138,10 +144,28 @@ class FlyingHero(Superhero):
     def rest(self, energy_gain=20):
         """Rest and regain energy (lands if flying)"""
         if self.__is_flying:
-            print(f"{self.get_hero_name()} lands to rest properly.")
+            emit("land_to_rest", self.get_hero_name())
             self.land()
         super().rest(energy_gain)
     
+    # Extend state export/import with flying attributes
+    def _export_state(self):
+        """Return every attribute, private ones included, as a dict"""
+        state = super()._export_state()
+        state.update({
+            "max_altitude": self.__max_altitude,
+            "current_altitude": self.__current_altitude,
+            "is_flying": self.__is_flying,
+        })
+        return state
+    
+    def _import_state(self, state):
+        """Restore the attributes saved by _export_state()"""
+        super()._import_state(state)
+        self.__max_altitude = state["max_altitude"]
+        self.__current_altitude = state["current_altitude"]
+        self.__is_flying = state["is_flying"]
+    
     # Override string representation
     def __str__(self):
         """String representation of the flying hero"""
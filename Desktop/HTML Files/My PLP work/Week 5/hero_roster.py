@@ -0,0 +1,267 @@
+"""
+HeroRoster: a struct-of-arrays view of many heroes for bulk simulation
+- Numeric state (health, energy, altitude, suit power, ...) lives in NumPy arrays
+- Batch versions of the hero actions update every selected hero at once
+- Each batch action clamps and checks exactly like the scalar classes
+- Rows convert to Superhero/FlyingHero/TechHero objects and back
+- Power/gadget flags are columns indexed by the POWERS/GADGETS registry ids
+"""
+
+import numpy as np
+
+from abilities import GADGETS, POWERS
+
+from flying_hero import FlyingHero
+from superhero import Superhero
+from tech_hero import TechHero
+
+# Hero kind codes stored in HeroRoster.kind
+SUPERHERO, FLYING_HERO, TECH_HERO = 0, 1, 2
+KIND_CLASSES = {SUPERHERO: Superhero, FLYING_HERO: FlyingHero, TECH_HERO: TechHero}
+
+# Numeric fields: (exported state key, dtype, value for kinds that don't have the field)
+NUMERIC_FIELDS = {
+    "age": ("age", np.int64, 0),
+    "health": ("health", np.int64, 0),
+    "energy": ("energy", np.int64, 0),
+    "identity_revealed": ("identity_revealed", np.bool_, False),
+    "max_altitude": ("max_altitude", np.int64, 0),
+    "altitude": ("current_altitude", np.int64, 0),
+    "flying": ("is_flying", np.bool_, False),
+    "intelligence": ("intelligence_level", np.int64, 0),
+    "suit_power": ("suit_power", np.int64, 0),
+    "hacking_active": ("hacking_tools_active", np.bool_, False),
+}
+
+# Text fields kept as plain Python lists
+TEXT_FIELDS = ["name", "gender", "hero_name", "weakness"]
+
+def kind_of(hero):
+    """Kind code for a hero object"""
+    if isinstance(hero, FlyingHero):
+        return FLYING_HERO
+    if isinstance(hero, TechHero):
+        return TECH_HERO
+    if isinstance(hero, Superhero):
+        return SUPERHERO
+    raise TypeError(f"HeroRoster only holds superheroes, not {type(hero).__name__}")
+
+class HeroRoster:
+    """Many heroes held column by column"""
+    
+    def __init__(self):
+        self.kind = np.zeros(0, dtype=np.int8)
+        for field, (_, dtype, _) in NUMERIC_FIELDS.items():
+            setattr(self, field, np.zeros(0, dtype=dtype))
+        for field in TEXT_FIELDS:
+            setattr(self, field, [])
+        self.powers = []  # Per-hero power lists, in the order the hero gained them
+        self.gadgets = []  # Per-hero gadget lists (empty for non-tech heroes)
+        self.positions = []  # Per-hero (x, y) city map positions (None for non-tech heroes)
+        self.has_power = np.zeros((0, 0), dtype=np.bool_)  # Row x POWERS id
+        self.has_gadget = np.zeros((0, 0), dtype=np.bool_)  # Row x GADGETS id
+    
+    @classmethod
+    def from_heroes(cls, heroes):
+        """Build a roster from hero objects"""
+        roster = cls()
+        roster.extend(heroes)
+        return roster
+    
+    def __len__(self):
+        return len(self.kind)
+    
+    # Building the roster
+    def extend(self, heroes):
+        """Append hero objects as new rows"""
+        heroes = list(heroes)
+        states = [hero._export_state() for hero in heroes]
+        kinds = [kind_of(hero) for hero in heroes]
+        
+        self.kind = np.concatenate([self.kind, np.array(kinds, dtype=np.int8)])
+        for field, (key, dtype, default) in NUMERIC_FIELDS.items():
+            values = np.array([state.get(key, default) for state in states], dtype=dtype)
+            setattr(self, field, np.concatenate([getattr(self, field), values]))
+        for field in TEXT_FIELDS:
+            getattr(self, field).extend(state[field] for state in states)
+        self.powers.extend(list(state["powers"]) for state in states)
+        self.gadgets.extend(list(state.get("gadgets", [])) for state in states)
+        self.positions.extend(state.get("position") for state in states)
+        
+        start = len(self.has_power)
+        self.has_power = np.concatenate(
+            [self.has_power, np.zeros((len(states), self.has_power.shape[1]), dtype=np.bool_)])
+        self.has_gadget = np.concatenate(
+            [self.has_gadget, np.zeros((len(states), self.has_gadget.shape[1]), dtype=np.bool_)])
+        for row, state in enumerate(states, start):
+            self._mark_abilities(row, state)
+    
+    def _flag_columns(self, flags, registry, names):
+        """Registry ids of the names, widening a flag matrix to cover every registered id"""
+        columns = [registry.id_of(name) for name in names]
+        if flags.shape[1] < len(registry):
+            flags = np.concatenate(
+                [flags, np.zeros((len(flags), len(registry) - flags.shape[1]), dtype=np.bool_)], axis=1)
+        return flags, columns
+    
+    def _mark_abilities(self, row, state):
+        """Set a row's has_power and has_gadget flags"""
+        self.has_power, columns = self._flag_columns(self.has_power, POWERS, state["powers"])
+        self.has_power[row, columns] = True
+        self.has_gadget, columns = self._flag_columns(self.has_gadget, GADGETS, state.get("gadgets", []))
+        self.has_gadget[row, columns] = True
+    
+    # Converting rows back into objects
+    def row_state(self, row):
+        """Exported-state dict for one row (the same shape as hero._export_state())"""
+        kind = int(self.kind[row])
+        state = {field: getattr(self, field)[row] for field in TEXT_FIELDS}
+        state.update({
+            "age": int(self.age[row]),
+            "health": int(self.health[row]),
+            "powers": list(self.powers[row]),
+            "energy": int(self.energy[row]),
+            "identity_revealed": bool(self.identity_revealed[row]),
+        })
+        if kind == FLYING_HERO:
+            state.update({
+                "max_altitude": int(self.max_altitude[row]),
+                "current_altitude": int(self.altitude[row]),
+                "is_flying": bool(self.flying[row]),
+            })
+        elif kind == TECH_HERO:
+            state.update({
+                "intelligence_level": int(self.intelligence[row]),
+                "gadgets": list(self.gadgets[row]),
+                "suit_power": int(self.suit_power[row]),
+                "hacking_tools_active": bool(self.hacking_active[row]),
+                "position": self.positions[row],
+            })
+        return state
+    
+    def to_hero(self, row):
+        """Create the hero object for one row"""
+        return KIND_CLASSES[int(self.kind[row])]._from_state(self.row_state(row))
+    
+    def to_heroes(self):
+        """Create hero objects for every row"""
+        return [self.to_hero(row) for row in range(len(self))]
+    
+    def update_row(self, row, hero):
+        """Copy a hero object's current state back into its row"""
+        if kind_of(hero) != self.kind[row]:
+            raise TypeError(f"Row {row} holds a different kind of hero than {type(hero).__name__}")
+        state = hero._export_state()
+        for field, (key, _, default) in NUMERIC_FIELDS.items():
+            getattr(self, field)[row] = state.get(key, default)
+        for field in TEXT_FIELDS:
+            getattr(self, field)[row] = state[field]
+        self.powers[row] = list(state["powers"])
+        self.gadgets[row] = list(state.get("gadgets", []))
+        self.positions[row] = state.get("position")
+        self.has_power[row] = False
+        self.has_gadget[row] = False
+        self._mark_abilities(row, state)
+    
+    # Selection helpers
+    def _select(self, mask, kinds=None):
+        """Rows an action applies to: the optional mask, limited to the given kinds"""
+        selected = np.ones(len(self), dtype=np.bool_) if mask is None else np.asarray(mask, dtype=np.bool_)
+        if kinds is not None:
+            selected = selected & np.isin(self.kind, kinds)
+        return selected
+    
+    @staticmethod
+    def _with_all(flags, registry, names):
+        """Mask of rows whose flags include every one of the names"""
+        columns = [registry.ids.get(name) for name in names]
+        if any(column is None or column >= flags.shape[1] for column in columns):
+            return np.zeros(len(flags), dtype=np.bool_)  # Nobody in the roster has it
+        return flags[:, columns].all(axis=1)
+    
+    def with_power(self, power):
+        """Mask of heroes that have a power"""
+        return self._with_all(self.has_power, POWERS, [power])
+    
+    def with_all_powers(self, powers):
+        """Mask of heroes that have every one of the given powers"""
+        return self._with_all(self.has_power, POWERS, powers)
+    
+    def with_gadget(self, gadget_name):
+        """Mask of tech heroes that carry a gadget"""
+        return self._with_all(self.has_gadget, GADGETS, [gadget_name])
+    
+    def with_all_gadgets(self, gadget_names):
+        """Mask of tech heroes that carry every one of the given gadgets"""
+        return self._with_all(self.has_gadget, GADGETS, gadget_names)
+    
+    # Batch versions of the hero actions (each returns a mask of the heroes it succeeded for)
+    def take_damage(self, damage, mask=None):
+        """Person.take_damage for every selected hero"""
+        selected = self._select(mask)
+        self.health = np.where(selected, np.maximum(0, self.health - damage), self.health)
+        return selected
+    
+    def heal(self, amount, mask=None):
+        """Person.heal for every selected hero"""
+        selected = self._select(mask)
+        self.health = np.where(selected, np.minimum(100, self.health + amount), self.health)
+        return selected
+    
+    def use_power(self, power_name, energy_cost=10, mask=None):
+        """Superhero.use_power: needs the power and enough energy"""
+        success = self._select(mask) & self.with_power(power_name) & (self.energy >= energy_cost)
+        self.energy = np.where(success, self.energy - energy_cost, self.energy)
+        return success
+    
+    def rest(self, energy_gain=20, mask=None):
+        """
+        rest() with each class's own behaviour
+        - Everyone regains energy (capped at 100)
+        - Flying heroes land first, tech heroes also recharge their suit by 25 and reset hacking tools
+        """
+        selected = self._select(mask)
+        landing = selected & (self.kind == FLYING_HERO)
+        self.flying = np.where(landing, False, self.flying)
+        self.altitude = np.where(landing, 0, self.altitude)
+        
+        self.energy = np.where(selected, np.minimum(100, self.energy + energy_gain), self.energy)
+        
+        techs = selected & (self.kind == TECH_HERO)
+        self.suit_power = np.where(techs, np.minimum(100, self.suit_power + 25), self.suit_power)
+        self.hacking_active = np.where(techs, False, self.hacking_active)
+        return selected
+    
+    def take_off(self, mask=None):
+        """FlyingHero.take_off: grounded flyers spend 5 energy on flight and rise to 100 feet"""
+        grounded = self._select(mask, [FLYING_HERO]) & ~self.flying
+        success = self.use_power("flight", 5, grounded)
+        self.flying = self.flying | success
+        self.altitude = np.where(success, 100, self.altitude)
+        return success
+    
+    def land(self, mask=None):
+        """FlyingHero.land for every selected flyer that is in the air"""
+        success = self._select(mask, [FLYING_HERO]) & self.flying
+        self.flying = self.flying & ~success
+        self.altitude = np.where(success, 0, self.altitude)
+        return success
+    
+    def fly_to_altitude(self, target_altitude, mask=None):
+        """
+        FlyingHero.fly_to_altitude: 1 energy per 100 feet climbed or descended
+        - Fails for heroes on the ground, above their max altitude, below 0 or short of energy
+        """
+        target = np.broadcast_to(np.asarray(target_altitude, dtype=np.int64), self.altitude.shape)
+        energy_cost = np.abs(target - self.altitude) // 100
+        success = (self._select(mask, [FLYING_HERO]) & self.flying
+                   & (target <= self.max_altitude) & (target >= 0) & (self.energy >= energy_cost))
+        self.energy = np.where(success, self.energy - energy_cost, self.energy)
+        self.altitude = np.where(success, target, self.altitude)
+        return success
+    
+    def recharge_suit(self, recharge_amount=30, mask=None):
+        """TechHero.recharge_suit for every selected tech hero"""
+        selected = self._select(mask, [TECH_HERO])
+        self.suit_power = np.where(selected, np.minimum(100, self.suit_power + recharge_amount), self.suit_power)
+        return selected
@@ -0,0 +1,180 @@
+"""
+Opt-in profiling of the hero class hierarchy
+- enable() swaps every public method of Person, Superhero, FlyingHero and TechHero
+  for a recording wrapper; disable() puts the original functions back, so nothing
+  is left behind and turned-off profiling costs nothing
+- Methods are recorded under the class that defines them, so polymorphic paths show up:
+  TechHero.fight_villain -> TechHero.scan_area -> TechHero.use_gadget -> Superhero.fight_villain
+- Records per-method call counts, cumulative time (including callees), own time,
+  caller -> callee edges, and own time per call stack for a flamegraph
+- folded() is the "a;b;c value" format read by flamegraph.pl and speedscope
+
+Run this file to profile a simulation and write its folded stacks:
+    python instrumentation.py --heroes 300 --folded heroes.folded
+"""
+
+import argparse
+import functools
+import time
+from contextlib import contextmanager
+
+from flying_hero import FlyingHero
+from person import Person
+from superhero import Superhero
+from tech_hero import TechHero
+
+HERO_CLASSES = [Person, Superhero, FlyingHero, TechHero]
+
+class Profiler:
+    """Call statistics collected while instrumentation is enabled"""
+    
+    def __init__(self):
+        self.calls = {}  # Method -> number of calls
+        self.total_time = {}  # Method -> seconds including callees (recursion counted once)
+        self.own_time = {}  # Method -> seconds excluding callees
+        self.edges = {}  # (caller, callee) -> number of calls (caller None for calls from outside)
+        self.stacks = {}  # Tuple of methods from the outermost call -> own seconds
+        self._stack = []  # [method, seconds spent in callees] per active call
+        self._active = {}  # Method -> active calls (to skip recursive double counting)
+    
+    def clear(self):
+        """Forget everything recorded so far (wrappers keep recording into the same tables)"""
+        for table in (self.calls, self.total_time, self.own_time, self.edges, self.stacks, self._active):
+            table.clear()
+        del self._stack[:]
+    
+    def _wrap(self, name, function):
+        """A wrapper recording every call of function under name"""
+        stack = self._stack
+        active = self._active
+        calls, total_time, own_time, edges, stacks = self.calls, self.total_time, self.own_time, self.edges, self.stacks
+        clock = time.perf_counter
+        
+        @functools.wraps(function)
+        def recorded(*args, **kwargs):
+            edge = (stack[-1][0] if stack else None, name)
+            edges[edge] = edges.get(edge, 0) + 1
+            calls[name] = calls.get(name, 0) + 1
+            active[name] = active.get(name, 0) + 1
+            frame = [name, 0.0]
+            stack.append(frame)
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                path = tuple(entry[0] for entry in stack)
+                stack.pop()
+                own = elapsed - frame[1]
+                own_time[name] = own_time.get(name, 0.0) + own
+                stacks[path] = stacks.get(path, 0.0) + own
+                active[name] -= 1
+                if not active[name]:
+                    total_time[name] = total_time.get(name, 0.0) + elapsed
+                if stack:
+                    stack[-1][1] += elapsed
+        
+        return recorded
+    
+    def folded(self, root=None):
+        """Folded-stack lines ("a;b;c microseconds"), optionally under a root frame"""
+        lines = []
+        for path, seconds in sorted(self.stacks.items()):
+            microseconds = round(seconds * 1e6)
+            if microseconds > 0:
+                frames = ((root,) if root else ()) + path
+                lines.append(f"{';'.join(frames)} {microseconds}")
+        return lines
+    
+    def write_folded(self, path, root=None):
+        """Write folded stacks to a file for flamegraph.pl or speedscope"""
+        with open(path, 'w', encoding='utf-8') as file:
+            for line in self.folded(root):
+                file.write(line + "\n")
+    
+    def report(self, top=15):
+        """Print the methods with the most cumulative time"""
+        print(f"{'method':<36} {'calls':>10} {'total ms':>10} {'own ms':>10}")
+        for name in sorted(self.calls, key=lambda name: -self.total_time.get(name, 0.0))[:top]:
+            print(f"{name:<36} {self.calls[name]:>10,} {self.total_time.get(name, 0.0) * 1e3:>10.1f} "
+                  f"{self.own_time.get(name, 0.0) * 1e3:>10.1f}")
+    
+    def callees(self, caller):
+        """{callee: calls} for one method"""
+        return {callee: count for (source, callee), count in self.edges.items() if source == caller}
+
+# (class, attribute name) -> original function while instrumentation is enabled
+_originals = {}
+_profiler = None
+
+def is_enabled():
+    """Check if the hero classes are instrumented"""
+    return _profiler is not None
+
+def enable(profiler=None, classes=HERO_CLASSES):
+    """Instrument the public methods of the hero classes and return the profiler recording them"""
+    global _profiler
+    if _profiler is not None:
+        disable()
+    _profiler = profiler or Profiler()
+    for cls in classes:
+        for attribute, value in list(vars(cls).items()):
+            if attribute.startswith("_") or not callable(value) or isinstance(value, (staticmethod, classmethod)):
+                continue
+            _originals[(cls, attribute)] = value
+            setattr(cls, attribute, _profiler._wrap(f"{cls.__name__}.{attribute}", value))
+    return _profiler
+
+def disable():
+    """Put every original method back and return the profiler that was recording"""
+    global _profiler
+    for (cls, attribute), function in _originals.items():
+        setattr(cls, attribute, function)
+    _originals.clear()
+    profiler, _profiler = _profiler, None
+    return profiler
+
+@contextmanager
+def profile(profiler=None, classes=HERO_CLASSES):
+    """Instrument the hero classes for the duration of a with block"""
+    profiler = enable(profiler, classes)
+    try:
+        yield profiler
+    finally:
+        disable()
+
+def main():
+    """Profile a simulation run and write its folded stacks"""
+    import random
+    
+    import events
+    from benchmark_simulation import make_heroes, make_plan
+    from simulation import Simulation
+    
+    parser = argparse.ArgumentParser(description="Profile the hero classes during a simulation run")
+    parser.add_argument("--heroes", type=int, default=300, help="number of heroes")
+    parser.add_argument("--actions", type=int, default=30, help="planned actions per hero")
+    parser.add_argument("--folded", default="heroes.folded", help="folded-stack output file")
+    parser.add_argument("--top", type=int, default=15, help="methods in the report")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    heroes = make_heroes(args.heroes)
+    simulation = Simulation(heroes)
+    simulation.submit_many({index: make_plan(hero, args.actions, rng) for index, hero in enumerate(heroes)})
+    
+    print("🦸 HERO PROFILE")
+    print("=" * 60)
+    with events.quiet(), profile() as profiler:
+        start = time.perf_counter()
+        simulation.run()
+        seconds = time.perf_counter() - start
+    print(f"{simulation.processed:,} events in {seconds:.3f}s (instrumented)\n")
+    profiler.report(args.top)
+    print("\nTechHero.fight_villain calls:", ", ".join(
+        f"{callee} x{count:,}" for callee, count in sorted(profiler.callees("TechHero.fight_villain").items())))
+    profiler.write_folded(args.folded, root="simulation")
+    print(f"\nFolded stacks written to {args.folded}")
+
+if __name__ == "__main__":
+    main()
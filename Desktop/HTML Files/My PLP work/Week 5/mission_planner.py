@@ -0,0 +1,372 @@
+"""
+Mission planner for FlyingHero and TechHero energy budgets
+- Takes a hero's current state and a queue of missions, and plans the rests, landings
+  and suit recharges that let every mission succeed in the least simulated time
+- The costs of every step are exactly those of the hero classes (take_off() costs
+  5 energy, fly_to_altitude() 1 energy per 100 feet, aerial_rescue() 20, ...)
+- Memoized dynamic programming over exact integer states (mission index, energy,
+  altitude or suit power): energy and suit power are whole numbers from 0 to 100 and
+  altitudes only ever take the missions' values. That is still a lot of states for a
+  long queue (a tech chunk of MAX_CHUNK missions can reach 400 x 101 x 101 x 2, about
+  8 million), so the memo is never trimmed while a plan is being worked out
+- Planners are cached per (mission queue, hero abilities), so heroes flying the same
+  queue share one memo table. Once a memo holds MAX_MEMO states it starts over before
+  the next plan (never during one), and at most PLANNER_CACHE_SIZE planners are kept
+- Tech heroes only rest or recharge before a mission they couldn't do otherwise: a rest
+  or recharge moved to later never leaves less energy or suit power (both are capped at
+  100, so earlier gains are the ones that get wasted). The exception is a hacking mission
+  while the hacking tools are off: there, a rest or recharge first can pay for turning the
+  tools on (and a rest after it turns them off again), so every choice is tried
+- A plan is a list of (method name, arguments) steps that execute_plan() runs on the hero
+"""
+
+from functools import lru_cache
+
+from flying_hero import FlyingHero
+from simulation import CLIMB_RATE
+from tech_hero import TechHero
+
+REST_GAIN = 20  # Energy per rest() in a plan (the default of rest())
+REST_TIME = 10.0  # Simulated seconds per rest
+RECHARGE_GAIN = 30  # Suit power per recharge_suit() in a plan
+RECHARGE_TIME = 5.0  # Simulated seconds per suit recharge
+TAKE_OFF_TIME = 100 / CLIMB_RATE  # Climbing to the take-off altitude of 100 feet
+MAX_RESTS = 5  # Five rests refill any energy level
+MAX_RECHARGES = 4  # Four recharges refill any suit
+MAX_CHUNK = 400  # Longer queues are planned in chunks (keeps the recursion shallow)
+GROUNDED = -1  # Altitude state of a hero on the ground
+MAX_MEMO = 200000  # States a planner's memo keeps between plans before it starts over
+PLANNER_CACHE_SIZE = 128  # Planners (mission queue + abilities) kept between calls
+
+# Flying missions: (kind, altitude); tech missions: ("rescue", type), ("hack", system) or ("gadget", name, cost)
+FLYING_MISSIONS = {"rescue", "patrol", "fight"}
+TECH_MISSIONS = {"rescue", "hack", "gadget"}
+AERIAL_FIGHT_ALTITUDE = 500
+
+class PlanError(ValueError):
+    """Raised for missions the planner doesn't know"""
+
+class FlyingPlanner:
+    """Plans a mission queue for flying heroes with the same abilities"""
+    
+    def __init__(self, missions, max_altitude, has_rescue):
+        for mission in missions:
+            if mission[0] not in FLYING_MISSIONS:
+                raise PlanError(f"Unknown flying mission: {mission!r}")
+        self.missions = missions
+        self.max_altitude = max_altitude
+        self.has_rescue = has_rescue
+        self.memo = {}  # (index, energy, altitude) -> (time, rests, land first) or None
+        self.plans = {}  # Start state -> finished plan (heroes often start from the same state)
+    
+    def _mission(self, mission, energy, altitude):
+        """Run one mission on the numbers: (energy, altitude, time) after it, or None if it fails"""
+        kind = mission[0]
+        target = AERIAL_FIGHT_ALTITUDE if kind == "fight" else mission[1]
+        time = 0.0
+        if altitude == GROUNDED:
+            if energy < 5:
+                return None
+            energy, altitude, time = energy - 5, 100, TAKE_OFF_TIME
+        if not 0 <= target <= self.max_altitude:
+            return None
+        cost = abs(target - altitude) // 100
+        if energy < cost:
+            return None
+        energy -= cost
+        time += abs(target - altitude) / CLIMB_RATE
+        if kind == "rescue":
+            if not self.has_rescue or energy < 20:
+                return None
+            energy -= 20
+        elif kind == "patrol":
+            if energy < 15:
+                return None
+            energy -= 15
+        else:  # Aerial fight: 30 for the aerial advantage, then 25 for the fight itself
+            if energy < 55:
+                return None
+            energy -= 55
+        return energy, target, time
+    
+    def best(self, index, energy, altitude):
+        """Least time to finish missions[index:] from this state: (time, rests, land first), or None"""
+        key = (index, energy, altitude)
+        if key in self.memo:
+            return self.memo[key]
+        if index == len(self.missions):
+            self.memo[key] = result = (0.0, 0, False)
+            return result
+        
+        result = None
+        mission = self.missions[index]
+        options = [(0, False, energy, altitude)]
+        if altitude != GROUNDED:
+            options.append((0, True, energy, GROUNDED))
+        for rests in range(1, MAX_RESTS + 1):
+            options.append((rests, False, min(100, energy + rests * REST_GAIN), GROUNDED))  # rest() lands first
+        for rests, land, start_energy, start_altitude in options:
+            outcome = self._mission(mission, start_energy, start_altitude)
+            if outcome is None:
+                continue
+            rest_of_plan = self.best(index + 1, outcome[0], outcome[1])
+            if rest_of_plan is None:
+                continue
+            time = rests * REST_TIME + outcome[2] + rest_of_plan[0]
+            if result is None or time < result[0]:
+                result = (time, rests, land)
+            if rests and start_energy >= 100:
+                break  # More rests can't help
+        self.memo[key] = result
+        return result
+    
+    def plan(self, energy, altitude):
+        """Steps for the whole queue and the end state, or None if it can't be done"""
+        key = (energy, altitude)
+        if key not in self.plans:
+            if len(self.plans) >= MAX_MEMO:
+                self.plans.clear()
+            if len(self.memo) >= MAX_MEMO:
+                self.memo.clear()  # Between plans: best() needs every state it has just worked out
+            self.plans[key] = self._plan(energy, altitude)
+        return self.plans[key]
+    
+    def _plan(self, energy, altitude):
+        steps = []
+        time = 0.0
+        for index, mission in enumerate(self.missions):
+            choice = self.best(index, energy, altitude)
+            if choice is None:
+                return None
+            _, rests, land = choice
+            if land:
+                steps.append(("land", ()))
+                altitude = GROUNDED
+            if rests:
+                steps.extend([("rest", (REST_GAIN,))] * rests)
+                energy, altitude = min(100, energy + rests * REST_GAIN), GROUNDED
+                time += rests * REST_TIME
+            steps.append(flying_step(mission))
+            energy, altitude, mission_time = self._mission(mission, energy, altitude)
+            time += mission_time
+        return steps, time, (energy, altitude)
+
+class TechPlanner:
+    """Plans a mission queue for tech heroes with the same abilities"""
+    
+    def __init__(self, missions, hack_succeeds, gadgets, has_rescue):
+        for mission in missions:
+            if mission[0] not in TECH_MISSIONS:
+                raise PlanError(f"Unknown tech mission: {mission!r}")
+        self.missions = missions
+        self.hack_succeeds = hack_succeeds  # Intelligence (+ Hacking Device) beats the difficulty
+        self.gadgets = gadgets  # Frozenset of the gadgets the hero carries
+        self.has_rescue = has_rescue
+        self.memo = {}  # (index, energy, suit power, hacking active) -> (time, rests, recharges) or None
+        self.plans = {}  # Start state -> finished plan
+    
+    def _use_gadget(self, name, cost, suit):
+        """Suit power left after using a gadget, or None if it can't be used"""
+        if name not in self.gadgets or suit < cost:
+            return None
+        return suit - cost
+    
+    def _hack(self, energy, suit, hacking):
+        if not hacking:
+            after = self._use_gadget("Scanner", 10, suit)  # activate_hacking_tools(); hacking goes on if it fails
+            if after is not None:
+                suit, hacking = after, True
+        if energy < 15 or not self.hack_succeeds:
+            return None
+        return energy - 15, suit, hacking
+    
+    def _mission(self, mission, energy, suit, hacking):
+        """Run one mission on the numbers: (energy, suit power, hacking active) after it, or None if it fails"""
+        kind = mission[0]
+        if kind == "hack" or (kind == "rescue" and mission[1] == "cyber_attack"):
+            return self._hack(energy, suit, hacking)
+        if kind == "gadget":
+            suit = self._use_gadget(mission[1], mission[2], suit)
+            return None if suit is None else (energy, suit, hacking)
+        if mission[1] == "building_collapse":
+            if "Communication Device" not in self.gadgets:
+                return None
+            suit = self._use_gadget("Scanner", 15, suit)
+            if suit is None or energy < 20:
+                return None
+            return energy - 20, suit, hacking
+        suit = self._use_gadget("Emergency Beacon", 10, suit)  # Standard rescue, then save_citizen()
+        if suit is None or not self.has_rescue or energy < 15:
+            return None
+        return energy - 15, suit, hacking
+    
+    def best(self, index, energy, suit, hacking):
+        """Least time to finish missions[index:] from this state: (time, rests, recharges), or None"""
+        key = (index, energy, suit, hacking)
+        if key in self.memo:
+            return self.memo[key]
+        if index == len(self.missions):
+            self.memo[key] = result = (0.0, 0, 0)
+            return result
+        
+        result = None
+        mission = self.missions[index]
+        activates = not hacking and (mission[0] == "hack" or mission[1] == "cyber_attack")
+        outcome = None if activates else self._mission(mission, energy, suit, hacking)
+        if outcome is not None:
+            # Doable as is: resting or recharging now could only be moved after it
+            rest_of_plan = self.best(index + 1, *outcome)
+            result = None if rest_of_plan is None else (rest_of_plan[0], 0, 0)
+        else:
+            for rests in range(MAX_RESTS + 1):
+                rested_energy = min(100, energy + rests * REST_GAIN)
+                rested_suit = min(100, suit + rests * 25) if rests else suit  # TechHero.rest() recharges by 25
+                rested_hacking = hacking and not rests
+                for recharges in range(MAX_RECHARGES + 1):
+                    start_suit = min(100, rested_suit + recharges * RECHARGE_GAIN)
+                    outcome = self._mission(mission, rested_energy, start_suit, rested_hacking)
+                    if outcome is not None:
+                        rest_of_plan = self.best(index + 1, *outcome)
+                        if rest_of_plan is not None:
+                            time = rests * REST_TIME + recharges * RECHARGE_TIME + rest_of_plan[0]
+                            if result is None or time < result[0]:
+                                result = (time, rests, recharges)
+                        if not activates:
+                            break  # More recharges with as many rests could only be moved later
+                    if start_suit >= 100:
+                        break
+                if rested_energy >= 100 and rested_suit >= 100:
+                    break
+        self.memo[key] = result
+        return result
+    
+    def plan(self, energy, suit, hacking):
+        """Steps for the whole queue and the end state, or None if it can't be done"""
+        key = (energy, suit, hacking)
+        if key not in self.plans:
+            if len(self.plans) >= MAX_MEMO:
+                self.plans.clear()
+            if len(self.memo) >= MAX_MEMO:
+                self.memo.clear()  # Between plans: best() needs every state it has just worked out
+            self.plans[key] = self._plan(energy, suit, hacking)
+        return self.plans[key]
+    
+    def _plan(self, energy, suit, hacking):
+        steps = []
+        time = 0.0
+        for index, mission in enumerate(self.missions):
+            choice = self.best(index, energy, suit, hacking)
+            if choice is None:
+                return None
+            _, rests, recharges = choice
+            if rests:
+                steps.extend([("rest", (REST_GAIN,))] * rests)
+                energy, suit, hacking = min(100, energy + rests * REST_GAIN), min(100, suit + rests * 25), False
+            if recharges:
+                steps.extend([("recharge_suit", (RECHARGE_GAIN,))] * recharges)
+                suit = min(100, suit + recharges * RECHARGE_GAIN)
+            time += rests * REST_TIME + recharges * RECHARGE_TIME
+            steps.append(tech_step(mission))
+            energy, suit, hacking = self._mission(mission, energy, suit, hacking)
+        return steps, time, (energy, suit, hacking)
+
+def flying_step(mission):
+    """The FlyingHero call that performs a flying mission"""
+    if mission[0] == "rescue":
+        return ("aerial_rescue", (mission[1],))
+    if mission[0] == "patrol":
+        return ("sky_patrol", (mission[1],))
+    return ("fight_villain", (mission[1] if len(mission) > 1 else "a villain", True))
+
+def tech_step(mission):
+    """The TechHero call that performs a tech mission"""
+    if mission[0] == "rescue":
+        return ("tech_rescue", (mission[1],))
+    if mission[0] == "hack":
+        return ("hack_system", (mission[1],))
+    return ("use_gadget", (mission[1], mission[2]))
+
+@lru_cache(maxsize=PLANNER_CACHE_SIZE)
+def flying_planner(missions, max_altitude, has_rescue):
+    """Shared planner (and memo table) for a mission queue and a flyer's abilities"""
+    return FlyingPlanner(missions, max_altitude, has_rescue)
+
+@lru_cache(maxsize=PLANNER_CACHE_SIZE)
+def tech_planner(missions, hack_succeeds, gadgets, has_rescue):
+    """Shared planner (and memo table) for a mission queue and a tech hero's abilities"""
+    return TechPlanner(missions, hack_succeeds, gadgets, has_rescue)
+
+def hack_succeeds(hero):
+    """Whether hack_system() succeeds for a tech hero (intelligence + Hacking Device beat the difficulty)"""
+    bonus = 10 if hero.has_gadget("Hacking Device") else 0
+    return hero.get_intelligence_level() + bonus >= 20
+
+def mission_outcome(hero, mission):
+    """
+    A flying or tech hero's state after one mission, or None if it would fail partway
+    - Same missions and costs as plan_missions(), worked out from the hero's current state:
+      (energy, altitude, time) for flyers, (energy, suit power, hacking active) for tech heroes
+    """
+    mission = tuple(mission)
+    if isinstance(hero, FlyingHero):
+        altitude = hero.get_current_altitude() if hero.is_flying() else GROUNDED
+        return FlyingPlanner((mission,), hero.get_max_altitude(), hero.has_power("rescue"))._mission(
+            mission, hero.get_energy(), altitude)
+    if isinstance(hero, TechHero):
+        planner = TechPlanner((mission,), hack_succeeds(hero), frozenset(hero.get_gadgets()), hero.has_power("rescue"))
+        return planner._mission(mission, hero.get_energy(), hero.get_suit_power(), hero.is_hacking_tools_active())
+    raise PlanError(f"Only flying and tech heroes have missions to plan, not {type(hero).__name__}")
+
+def plan_missions(hero, missions):
+    """
+    Plan a mission queue for a FlyingHero or TechHero
+    - Returns (steps, simulated time) or None if the missions can't all succeed
+    - Flying missions: ("rescue", altitude), ("patrol", altitude), ("fight", villain name)
+      (note that a fight can still be lost to the hero's weakness: only energy is planned)
+    - Tech missions: ("rescue", rescue type), ("hack", system name), ("gadget", name, suit power cost)
+    """
+    missions = tuple(tuple(mission) for mission in missions)
+    chunks = [missions[start:start + MAX_CHUNK] for start in range(0, len(missions), MAX_CHUNK)] or [()]
+    steps, total_time = [], 0.0
+    
+    if isinstance(hero, FlyingHero):
+        # A fight's villain name doesn't change the costs, so it is left out of the planner key
+        state = (hero.get_energy(), hero.get_current_altitude() if hero.is_flying() else GROUNDED)
+        for chunk in chunks:
+            planner = flying_planner(tuple(m[:1] if m[0] == "fight" else m for m in chunk),
+                                     hero.get_max_altitude(), hero.has_power("rescue"))
+            planned = planner.plan(*state)
+            if planned is None:
+                return None
+            # Put the villain names back into the fight steps
+            chunk_steps = [flying_step(mission) if step[0] == "fight_villain" else step
+                           for step, mission in _pair_steps(planned[0], chunk)]
+            steps.extend(chunk_steps)
+            total_time += planned[1]
+            state = planned[2]
+        return steps, total_time
+    
+    if isinstance(hero, TechHero):
+        planner_key = (hack_succeeds(hero), frozenset(hero.get_gadgets()), hero.has_power("rescue"))
+        state = (hero.get_energy(), hero.get_suit_power(), hero.is_hacking_tools_active())
+        for chunk in chunks:
+            planned = tech_planner(chunk, *planner_key).plan(*state)
+            if planned is None:
+                return None
+            steps.extend(planned[0])  # Copied: the planner keeps its cached plan
+            total_time += planned[1]
+            state = planned[2]
+        return steps, total_time
+    
+    raise PlanError(f"Only flying and tech heroes have missions to plan, not {type(hero).__name__}")
+
+def _pair_steps(steps, missions):
+    """(step, mission it performs or None) for each step of a plan"""
+    missions = iter(missions)
+    for step in steps:
+        mission = next(missions) if step[0] in ("aerial_rescue", "sky_patrol", "fight_villain") else None
+        yield step, mission
+
+def execute_plan(hero, steps):
+    """Run a plan's steps on the hero, returning the result of each step"""
+    return [getattr(hero, name)(*args) for name, args in steps]
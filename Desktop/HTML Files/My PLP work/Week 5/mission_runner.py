@@ -0,0 +1,202 @@
+"""
+Asyncio mission runner: many heroes working at the same time
+- Rescues, hacks and fights become awaitable missions that take (scaled) time,
+  so a dispatcher can keep thousands of them in flight at once
+- A bounded queue gives backpressure: submit() waits while the queue is full
+- Each hero has its own lock, so a hero never runs two missions at once
+  (missions for one hero still run in the order they were submitted)
+- A worker waits on the hero's lock while holding its slot, so a long line of missions
+  for one busy hero can tie up every worker (head-of-line blocking): spread missions
+  across heroes, or keep a hero's backlog shorter than the worker count
+- Admission control: a mission only starts if the hero has the energy and suit power
+  for all of it, otherwise it is rejected with MissionRejected instead of failing halfway.
+  The cost comes from the hero's state and the mission's arguments (take-off and climb
+  included), using the mission planner's cost model for flying and tech missions.
+  A fight can still be lost to the hero's weakness: that is its result, not a failure
+"""
+
+import asyncio
+
+from flying_hero import FlyingHero
+from mission_planner import hack_succeeds, mission_outcome
+from superhero import Superhero
+from tech_hero import TechHero
+from weakness_matcher import is_tech_name
+
+# Mission -> (hero class, duration in simulated seconds)
+MISSIONS = {
+    "save_citizen": (Superhero, 8.0),
+    "aerial_rescue": (FlyingHero, 10.0),
+    "tech_rescue": (TechHero, 8.0),
+    "hack_system": (TechHero, 3.0),
+    "fight_villain": (Superhero, 5.0),
+    "rest": (Superhero, 10.0),  # So a dispatcher can get tired heroes back to work
+}
+SAVE_CITIZEN_ENERGY = 15
+FIGHT_ENERGY = 25  # Superhero.fight_villain()
+TECH_SCAN_SUIT_POWER = 8  # Tech heroes scan the villain's location before a fight
+
+DEFAULT_WORKERS = 256  # Missions that can be in flight at once
+DEFAULT_QUEUE_SIZE = 1024  # Submitted missions waiting for a worker
+DEFAULT_TIME_SCALE = 0.0  # Real seconds per simulated second (0: missions take no real time)
+
+class MissionRejected(Exception):
+    """Raised for a mission the hero isn't able to start"""
+
+def planned_mission(hero, mission, args):
+    """The mission planner's version of a flying or tech mission (None if it has none)"""
+    if isinstance(hero, FlyingHero):
+        if mission == "aerial_rescue":
+            return ("rescue", args[0] if args else 500)
+        if mission == "fight_villain" and len(args) > 1 and args[1]:
+            return ("fight",)
+    elif isinstance(hero, TechHero):
+        if mission == "tech_rescue":
+            return ("rescue", args[0] if args else "standard")
+        if mission == "hack_system":
+            return ("hack", args[0] if args else "")
+    return None
+
+def energy_needed(hero, mission, args):
+    """Energy the missions the planner doesn't cover need from start to end"""
+    if mission == "save_citizen":
+        return SAVE_CITIZEN_ENERGY
+    if mission == "fight_villain" and isinstance(hero, TechHero):
+        # The scan leads to a hack against tech villains: 15 energy, then the fight if it fails
+        scans = hero.has_gadget("Scanner") and hero.get_suit_power() >= TECH_SCAN_SUIT_POWER
+        if scans and args and is_tech_name(args[0]):
+            return 15 if hack_succeeds(hero) else 15 + FIGHT_ENERGY
+    if mission == "fight_villain":
+        return FIGHT_ENERGY
+    return 0
+
+def admission_problem(hero, mission, args=()):
+    """Why a hero can't start a mission with these arguments right now (None if it can)"""
+    if mission not in MISSIONS:
+        return f"{mission!r} is not a mission"
+    hero_class, _ = MISSIONS[mission]
+    if not isinstance(hero, hero_class):
+        return f"{hero.get_name()} is not a {hero_class.__name__}"
+    if mission == "save_citizen" and not hero.has_power("rescue"):
+        return f"{hero.get_hero_name()} has no rescue power"
+    planned = planned_mission(hero, mission, args)
+    if planned is not None:
+        if mission_outcome(hero, planned) is None:
+            return f"{hero.get_hero_name()} can't finish {mission}{args!r} with the energy and suit power left"
+    elif hero.get_energy() < energy_needed(hero, mission, args):
+        return f"{hero.get_hero_name()} needs {energy_needed(hero, mission, args)} energy for {mission}"
+    return None
+
+class MissionRunner:
+    """Runs submitted missions with a pool of worker tasks"""
+    
+    def __init__(self, heroes, workers=DEFAULT_WORKERS, queue_size=DEFAULT_QUEUE_SIZE,
+                 time_scale=DEFAULT_TIME_SCALE):
+        self.heroes = list(heroes)
+        self.worker_count = workers
+        self.time_scale = time_scale
+        self.queue_size = queue_size
+        self.locks = [asyncio.Lock() for _ in self.heroes]
+        self.completed = 0  # Missions that ran (whatever the hero method returned)
+        self.rejected = 0  # Missions refused by admission control
+        self.failed = 0  # Missions whose hero method raised
+        self.running = 0
+        self.peak_running = 0  # Most missions in flight at the same moment
+        self._queue = None
+        self._workers = []
+    
+    async def __aenter__(self):
+        self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    def start(self):
+        """Start the worker tasks (needs a running event loop)"""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(self.queue_size)
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.worker_count)]
+    
+    async def close(self):
+        """Wait for every submitted mission to finish, then stop the workers"""
+        if not self._workers:
+            return
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+    
+    async def submit(self, hero, mission, *args):
+        """
+        Queue a mission for a hero (by index) and return a future for its result
+        - Waits while the queue is full (backpressure)
+        - The future raises MissionRejected if admission control refuses the mission
+        """
+        if mission not in MISSIONS:
+            raise MissionRejected(f"{mission!r} is not a mission")
+        if not 0 <= hero < len(self.heroes):
+            raise MissionRejected(f"No hero number {hero} (there are {len(self.heroes)})")
+        if not self._workers:
+            self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((future, hero, mission, args))
+        return future
+    
+    async def run(self, hero, mission, *args):
+        """Submit a mission and wait for its result"""
+        return await (await self.submit(hero, mission, *args))
+    
+    async def _work(self):
+        queue = self._queue
+        while True:
+            future, hero, mission, args = await queue.get()
+            try:
+                # Taking the lock right after the item (no await in between) keeps each hero's missions in order
+                async with self.locks[hero]:
+                    await self._run_mission(future, hero, mission, args)
+            except Exception as e:
+                # Keep the worker alive and never leave a future unresolved
+                self.failed += 1
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                queue.task_done()
+    
+    async def _run_mission(self, future, hero, mission, args):
+        if future.cancelled():
+            return
+        person = self.heroes[hero]
+        problem = admission_problem(person, mission, args)
+        if problem is not None:
+            self.rejected += 1
+            future.set_exception(MissionRejected(problem))
+            return
+        self.running += 1
+        self.peak_running = max(self.peak_running, self.running)
+        try:
+            result = getattr(person, mission)(*args)
+            # The hero stays busy (and locked) for as long as the mission takes
+            await asyncio.sleep(MISSIONS[mission][1] * self.time_scale)
+        except Exception as e:
+            self.failed += 1
+            if not future.cancelled():
+                future.set_exception(e)
+        else:
+            self.completed += 1
+            if not future.cancelled():
+                future.set_result(result)
+        finally:
+            self.running -= 1
+
+async def run_missions_async(heroes, missions, **options):
+    """Run (hero index, mission, *args) tuples; returns each result or exception, in order"""
+    async with MissionRunner(heroes, **options) as runner:
+        futures = [await runner.submit(*mission) for mission in missions]
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+def run_missions(heroes, missions, **options):
+    """run_missions_async() from synchronous code"""
+    return asyncio.run(run_missions_async(heroes, missions, **options))
@@ -2,9 +2,15 @@
 Base Person class demonstrating basic OOP concepts
 - Encapsulation: Private attributes with getters/setters
 - Constructor: Initialize objects with unique values
+- Actions are reported through events.emit() so they can be printed, collected or silenced
+- __slots__ keeps each object small: no per-instance __dict__
 """
 
+from events import emit
+
 class Person:
+    __slots__ = ("__name", "__age", "__gender", "_health")
+    
     def __init__(self, name, age, gender):
         """Constructor to initialize each Person object with unique values"""
         self.__name = name  # Private attribute (encapsulation)
@@ -35,21 +41,21 @@ class Person:
         if isinstance(name, str) and len(name) > 0:
             self.__name = name
         else:
-            print("Invalid name!")
+            emit("invalid_name")
     
     def set_age(self, age):
         """Set the person's age"""
         if isinstance(age, int) and age > 0:
             self.__age = age
         else:
-            print("Invalid age!")
+            emit("invalid_age")
     
     def set_health(self, health):
         """Set the person's health"""
         if 0 <= health <= 100:
             self._health = health
         else:
-            print("Health must be between 0 and 100!")
+            emit("invalid_health")
     
     # Methods
     def introduce(self):
@@ -59,17 +65,36 @@ class Person:
     def celebrate_birthday(self):
         """Increase age by 1"""
         self.__age += 1
-        print(f"Happy birthday! {self.__name} is now {self.__age} years old.")
+        emit("birthday", self.__name, self.__age)
     
     def take_damage(self, damage):
         """Reduce health by damage amount"""
         self._health = max(0, self._health - damage)
-        print(f"{self.__name} took {damage} damage. Health: {self._health}")
+        emit("take_damage", self.__name, damage, self._health)
     
     def heal(self, amount):
         """Increase health by heal amount"""
         self._health = min(100, self._health + amount)
-        print(f"{self.__name} healed for {amount}. Health: {self._health}")
+        emit("heal", self.__name, amount, self._health)
+    
+    # State export/import (used by rosters and snapshots, not part of the public API)
+    def _export_state(self):
+        """Return every attribute, private ones included, as a dict"""
+        return {"name": self.__name, "age": self.__age, "gender": self.__gender, "health": self._health}
+    
+    def _import_state(self, state):
+        """Restore the attributes saved by _export_state()"""
+        self.__name = state["name"]
+        self.__age = state["age"]
+        self.__gender = state["gender"]
+        self._health = state["health"]
+    
+    @classmethod
+    def _from_state(cls, state):
+        """Create an object straight from exported state, without running the constructor"""
+        obj = cls.__new__(cls)
+        obj._import_state(state)
+        return obj
     
     def __str__(self):
         """String representation of the person"""
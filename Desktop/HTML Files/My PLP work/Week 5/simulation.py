@@ -0,0 +1,230 @@
+"""
+Discrete-event simulation of timed hero actions
+- A heap-based timeline: actions take simulated seconds instead of happening instantly
+- Energy regenerates over simulated time (faster while resting), computed lazily
+  only when a hero is touched, so idle heroes cost nothing
+- FlyingHero altitude changes take time proportional to the distance flown
+- Each hero works through its own queue of actions, one at a time
+- Events are plain (time, sequence, opcode, hero, argument) tuples dispatched
+  through a table of handlers: no per-event objects or closures
+"""
+
+import heapq
+from collections import deque
+from itertools import count
+
+from flying_hero import FlyingHero
+
+# Actions a hero can be given (these are also the opcodes of their start events)
+POWER, FIGHT, RESCUE, TAKE_OFF, FLY, LAND, REST = range(7)
+# Opcodes of the events that end timed actions
+FLY_DONE, LAND_DONE, REST_DONE, DONE = range(7, 11)
+
+ACTION_NAMES = {POWER: "power", FIGHT: "fight", RESCUE: "rescue", TAKE_OFF: "take_off",
+                FLY: "fly", LAND: "land", REST: "rest"}
+ACTION_DURATIONS = {POWER: 1.0, FIGHT: 5.0, RESCUE: 8.0}  # Simulated seconds
+CLIMB_RATE = 50.0  # Feet per simulated second, up or down
+BASE_REGEN = 0.5  # Energy per simulated second
+REST_REGEN = 4.0  # Energy per simulated second while resting
+DEFAULT_REST = 10.0  # Simulated seconds of a rest without a given duration
+
+class Simulation:
+    """The timeline, the heroes and their pending actions"""
+    
+    def __init__(self, heroes):
+        self.heroes = list(heroes)
+        self.now = 0.0
+        self.processed = 0  # Events handled so far
+        self._heap = []
+        self._sequence = count()  # Keeps events at the same time in scheduling order
+        
+        size = len(self.heroes)
+        self.queues = [deque() for _ in range(size)]  # Pending (action, argument) pairs per hero
+        self.busy = [False] * size
+        self.regen_rate = [BASE_REGEN] * size
+        self.energy_clock = [0.0] * size  # Time up to which regenerated energy has been added
+        self.flights = [None] * size  # (start time, from altitude, end time, to altitude) while moving
+        
+        # Opcode -> handler, built once
+        self._handlers = [self._start_power, self._start_fight, self._start_rescue, self._start_take_off,
+                          self._start_fly, self._start_land, self._start_rest,
+                          self._fly_done, self._land_done, self._rest_done, self._done]
+    
+    # Scheduling
+    def _schedule(self, time, opcode, hero, argument=None):
+        heapq.heappush(self._heap, (time, next(self._sequence), opcode, hero, argument))
+    
+    def submit(self, hero, action, argument=None):
+        """Queue an action for a hero (by index); it starts as soon as the hero is free"""
+        self.queues[hero].append((action, argument))
+        if not self.busy[hero]:
+            self._start_next(hero)
+    
+    def submit_many(self, plans):
+        """
+        Queue many actions at once: plans maps hero index -> list of (action, argument)
+        - Idle heroes' first actions are added to the timeline in one heapify
+        """
+        starting = []
+        for hero, actions in plans.items():
+            self.queues[hero].extend(actions)
+            if not self.busy[hero] and self.queues[hero]:
+                action, argument = self.queues[hero].popleft()
+                self.busy[hero] = True
+                starting.append((self.now, next(self._sequence), action, hero, argument))
+        self._heap.extend(starting)
+        heapq.heapify(self._heap)
+    
+    def _start_next(self, hero):
+        """Start a hero's next queued action now, or mark the hero idle"""
+        queue = self.queues[hero]
+        if queue:
+            action, argument = queue.popleft()
+            self.busy[hero] = True
+            self._schedule(self.now, action, hero, argument)
+        else:
+            self.busy[hero] = False
+    
+    def run(self, until=None):
+        """Handle events in time order (up to the given time), returning how many were handled"""
+        heap = self._heap
+        handlers = self._handlers
+        pop = heapq.heappop
+        handled = 0
+        while heap and (until is None or heap[0][0] <= until):
+            self.now, _, opcode, hero, argument = pop(heap)
+            handlers[opcode](hero, argument)
+            handled += 1
+        if until is not None and until > self.now:
+            self.now = until
+        self.processed += handled
+        return handled
+    
+    def pending(self):
+        """Number of events waiting on the timeline"""
+        return len(self._heap)
+    
+    # Lazily computed state
+    def sync_energy(self, hero):
+        """Add the energy a hero regenerated since it was last touched"""
+        person = self.heroes[hero]
+        energy = person.get_energy()
+        if energy >= 100:
+            self.energy_clock[hero] = self.now  # Nothing is banked while full
+            return energy
+        rate = self.regen_rate[hero]
+        gained = int((self.now - self.energy_clock[hero]) * rate)
+        if gained > 0:
+            self.energy_clock[hero] += gained / rate  # Keep the fraction towards the next point
+            energy = min(100, energy + gained)
+            person.set_energy(energy)
+        return energy
+    
+    def _set_regen_rate(self, hero, rate):
+        """Change a hero's regeneration rate, carrying the unpaid fraction over at the new rate"""
+        self.sync_energy(hero)
+        banked = self.now - self.energy_clock[hero]  # Time towards the next point at the old rate
+        self.energy_clock[hero] = self.now - banked * self.regen_rate[hero] / rate
+        self.regen_rate[hero] = rate
+    
+    def energy_of(self, hero):
+        """A hero's energy at the current simulated time"""
+        return self.sync_energy(hero)
+    
+    def altitude_of(self, hero):
+        """A hero's altitude at the current simulated time (moving flyers are between two altitudes)"""
+        flight = self.flights[hero]
+        if flight is not None:
+            start, start_altitude, end, end_altitude = flight
+            if end <= start:
+                return end_altitude
+            progress = min(1.0, (self.now - start) / (end - start))
+            return start_altitude + (end_altitude - start_altitude) * progress
+        person = self.heroes[hero]
+        return person.get_current_altitude() if isinstance(person, FlyingHero) else 0
+    
+    def _move(self, hero, start_altitude, end_altitude):
+        """Record a flight and return when it ends"""
+        end = self.now + abs(end_altitude - start_altitude) / CLIMB_RATE
+        self.flights[hero] = (self.now, start_altitude, end, end_altitude)
+        return end
+    
+    # Handlers (opcode order)
+    def _start_power(self, hero, power_name):
+        self.sync_energy(hero)
+        self.heroes[hero].use_power(power_name)
+        self._schedule(self.now + ACTION_DURATIONS[POWER], DONE, hero)
+    
+    def _start_fight(self, hero, villain_name):
+        self.sync_energy(hero)
+        self.heroes[hero].fight_villain(villain_name)
+        self._schedule(self.now + ACTION_DURATIONS[FIGHT], DONE, hero)
+    
+    def _start_rescue(self, hero, _):
+        self.sync_energy(hero)
+        self.heroes[hero].save_citizen()
+        self._schedule(self.now + ACTION_DURATIONS[RESCUE], DONE, hero)
+    
+    def _start_take_off(self, hero, _):
+        """Take off: the hero climbs to its starting altitude before the action ends"""
+        self.sync_energy(hero)
+        person = self.heroes[hero]
+        if isinstance(person, FlyingHero) and person.take_off():
+            self._schedule(self._move(hero, 0, person.get_current_altitude()), DONE, hero)
+        else:
+            self._schedule(self.now, DONE, hero)
+    
+    def _start_fly(self, hero, target_altitude):
+        """Fly to an altitude: the hero gets there (and pays for it) when the flight ends"""
+        person = self.heroes[hero]
+        if (not isinstance(person, FlyingHero) or not person.is_flying()
+                or not 0 <= target_altitude <= person.get_max_altitude()):
+            if isinstance(person, FlyingHero):
+                person.fly_to_altitude(target_altitude)  # Reports why it can't fly there
+            self._schedule(self.now, DONE, hero)
+            return
+        end = self._move(hero, person.get_current_altitude(), target_altitude)
+        self._schedule(end, FLY_DONE, hero, target_altitude)
+    
+    def _fly_done(self, hero, target_altitude):
+        self.flights[hero] = None
+        self.sync_energy(hero)
+        self.heroes[hero].fly_to_altitude(target_altitude)
+        self._start_next(hero)
+    
+    def _start_land(self, hero, _):
+        """Land: the hero descends at the climb rate and touches down when the action ends"""
+        person = self.heroes[hero]
+        if isinstance(person, FlyingHero) and person.is_flying():
+            self._schedule(self._move(hero, person.get_current_altitude(), 0), LAND_DONE, hero)
+        else:
+            if isinstance(person, FlyingHero):
+                person.land()  # Reports that it is already on the ground
+            self._schedule(self.now, DONE, hero)
+    
+    def _land_done(self, hero, _):
+        self.flights[hero] = None
+        self.heroes[hero].land()
+        self._start_next(hero)
+    
+    def _start_rest(self, hero, duration):
+        """Rest: flying heroes land first, then energy regenerates faster for the duration and rest() ends it"""
+        person = self.heroes[hero]
+        if isinstance(person, FlyingHero) and person.is_flying():
+            self.queues[hero].appendleft((REST, duration))  # Rest again once on the ground
+            self._start_land(hero, None)
+            return
+        self._set_regen_rate(hero, REST_REGEN)
+        self._schedule(self.now + (DEFAULT_REST if duration is None else duration), REST_DONE, hero)
+    
+    def _rest_done(self, hero, _):
+        """End of a rest: the regenerated energy is in, then the hero's own rest() does the rest"""
+        self._set_regen_rate(hero, BASE_REGEN)
+        # No extra energy (the timeline already gave it), but each class's side effects:
+        # the "rest" event, TechHero's suit recharge and hacking tools reset
+        self.heroes[hero].rest(0)
+        self._start_next(hero)
+    
+    def _done(self, hero, _):
+        self.flights[hero] = None
+        self._start_next(hero)
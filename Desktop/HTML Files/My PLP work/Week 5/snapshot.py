@@ -0,0 +1,294 @@
+"""
+Binary snapshots of whole hero rosters
+- Every private field of Person, Superhero, FlyingHero and TechHero round-trips
+  (taken from _export_state(), restored with _from_state())
+- Layout: a header, a table of new strings, a table of new power/gadget name lists,
+  then one fixed-size struct record per hero that refers to both tables by index
+- SnapshotWriter keeps its tables between snapshots, so a delta snapshot only carries
+  the strings, lists and hero records that changed since the previous one
+- SnapshotReader applies a full snapshot followed by any number of deltas; a snapshot
+  that is cut short or inconsistent raises SnapshotError and leaves the reader as it was
+"""
+
+import struct
+
+from abilities import share_names
+from flying_hero import FlyingHero
+from person import Person
+from superhero import Superhero
+from tech_hero import TechHero
+
+MAGIC = b"HSNP"
+VERSION = 2  # 2: TechHero positions
+FULL, DELTA = 0, 1
+
+# Kind codes in the records (most derived classes are checked first)
+KIND_CLASSES = [Person, Superhero, FlyingHero, TechHero]
+KIND_CODES = {cls: kind for kind, cls in enumerate(KIND_CLASSES)}
+NO_STRING = 0xFFFFFFFF  # String index standing for None (e.g. a hero without a weakness)
+
+# header: magic, version, snapshot type, hero count, first new string id, new strings,
+#         first new list id, new lists, records that follow
+HEADER = struct.Struct("<4sBBIIIIII")
+LENGTH = struct.Struct("<I")
+# record: kind, name, gender, hero name, weakness, powers, gadgets (table indexes),
+#         age, health, energy, max altitude, altitude, intelligence, suit power, flags,
+#         position x, position y
+RECORD = struct.Struct("<BIIIIIIqqqqqqqBdd")
+INDEXED_RECORD = struct.Struct("<I" + RECORD.format[1:])  # Delta records also carry the roster index
+
+# Flag bits
+IDENTITY_REVEALED, IS_FLYING, HACKING_ACTIVE = 1, 2, 4
+
+class SnapshotError(ValueError):
+    """Raised for data that isn't a snapshot this reader can apply"""
+
+def kind_of(hero):
+    """Kind code of a hero object"""
+    kind = KIND_CODES.get(type(hero))
+    if kind is not None:
+        return kind
+    for kind in range(len(KIND_CLASSES) - 1, -1, -1):
+        if isinstance(hero, KIND_CLASSES[kind]):
+            return kind
+    raise TypeError(f"Cannot snapshot a {type(hero).__name__}")
+
+class SnapshotWriter:
+    """Writes a full snapshot, then deltas against the previous snapshot"""
+    
+    def __init__(self):
+        self._reset()
+    
+    def _reset(self):
+        self.strings = {}  # String -> id
+        self.lists = {}  # Tuple of string ids -> id
+        self.list_names = {}  # Tuple of names -> id (skips the per-name lookups for lists seen before)
+        self.records = []  # Packed record of every hero in the previous snapshot
+    
+    def _string_id(self, text, new_strings):
+        if text is None:
+            return NO_STRING
+        string_id = self.strings.get(text)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings[text] = string_id
+            new_strings.append(text)
+        return string_id
+    
+    def _list_id(self, names, new_strings, new_lists):
+        names = tuple(names)
+        list_id = self.list_names.get(names)
+        if list_id is not None:
+            return list_id
+        key = tuple(self._string_id(name, new_strings) for name in names)
+        list_id = self.lists.get(key)
+        if list_id is None:
+            list_id = len(self.lists)
+            self.lists[key] = list_id
+            new_lists.append(key)
+        self.list_names[names] = list_id
+        return list_id
+    
+    def _pack(self, hero, new_strings, new_lists):
+        """Packed record of one hero"""
+        kind = kind_of(hero)
+        state = hero._export_state()
+        string_id = self._string_id
+        flags = ((IDENTITY_REVEALED if state.get("identity_revealed") else 0)
+                 | (IS_FLYING if state.get("is_flying") else 0)
+                 | (HACKING_ACTIVE if state.get("hacking_tools_active") else 0))
+        try:
+            return RECORD.pack(
+                kind,
+                string_id(state["name"], new_strings),
+                string_id(state["gender"], new_strings),
+                string_id(state.get("hero_name"), new_strings),
+                string_id(state.get("weakness"), new_strings),
+                self._list_id(state.get("powers", ()), new_strings, new_lists),
+                self._list_id(state.get("gadgets", ()), new_strings, new_lists),
+                state["age"], state["health"], state.get("energy", 0),
+                state.get("max_altitude", 0), state.get("current_altitude", 0),
+                state.get("intelligence_level", 0), state.get("suit_power", 0),
+                flags,
+                *state.get("position", (0.0, 0.0)),
+            )
+        except struct.error as e:
+            raise SnapshotError(f"{state['name']!r} has a field a snapshot can't store: {e}") from None
+    
+    def _encode(self, snapshot_type, hero_count, first_string, new_strings, first_list, new_lists, body, records):
+        """Header, then the new strings and lists, then the records"""
+        parts = [HEADER.pack(MAGIC, VERSION, snapshot_type, hero_count, first_string, len(new_strings),
+                             first_list, len(new_lists), records)]
+        for text in new_strings:
+            encoded = text.encode('utf-8')
+            parts.append(LENGTH.pack(len(encoded)))
+            parts.append(encoded)
+        for key in new_lists:
+            parts.append(struct.pack(f"<I{len(key)}I", len(key), *key))
+        parts.append(body)
+        return b"".join(parts)
+    
+    def _forget(self, new_strings, new_lists, known_list_names):
+        """Take back the table entries of a snapshot that failed to pack"""
+        for text in new_strings:
+            del self.strings[text]
+        for key in new_lists:
+            del self.lists[key]
+        while len(self.list_names) > known_list_names:
+            self.list_names.popitem()  # The newest entries go first
+    
+    def full(self, heroes):
+        """A self-contained snapshot of the whole roster"""
+        previous = self.strings, self.lists, self.list_names, self.records
+        self._reset()
+        new_strings, new_lists = [], []
+        try:
+            records = [self._pack(hero, new_strings, new_lists) for hero in heroes]
+        except BaseException:
+            # The writer stays on the snapshot it last wrote
+            self.strings, self.lists, self.list_names, self.records = previous
+            raise
+        self.records = records
+        return self._encode(FULL, len(records), 0, new_strings, 0, new_lists, b"".join(records), len(records))
+    
+    def delta(self, heroes):
+        """
+        Only what changed since the previous snapshot (heroes can be added but not removed)
+        - A delta that fails to pack leaves the writer as it was, so the next one still follows
+          the snapshot the reader last applied
+        """
+        heroes = list(heroes)
+        records = self.records
+        if len(heroes) < len(records):
+            raise SnapshotError("Heroes were removed since the previous snapshot: take a full snapshot")
+        first_string, first_list = len(self.strings), len(self.lists)
+        known_list_names = len(self.list_names)
+        new_strings, new_lists = [], []
+        updates = []  # (roster index, record) of the heroes that changed
+        try:
+            for index, hero in enumerate(heroes):
+                record = self._pack(hero, new_strings, new_lists)
+                if index >= len(records) or record != records[index]:
+                    updates.append((index, record))
+        except BaseException:
+            self._forget(new_strings, new_lists, known_list_names)
+            raise
+        
+        for index, record in updates:
+            if index < len(records):
+                records[index] = record
+            else:
+                records.append(record)  # Added heroes come last, in order
+        return self._encode(DELTA, len(heroes), first_string, new_strings, first_list, new_lists,
+                            b"".join([LENGTH.pack(index) + record for index, record in updates]), len(updates))
+
+def _length(data, offset, table):
+    """A table entry's length prefix and the offset after it"""
+    if offset + LENGTH.size > len(data):
+        raise SnapshotError(f"Snapshot is truncated in its {table} table")
+    return LENGTH.unpack_from(data, offset)[0], offset + LENGTH.size
+
+class SnapshotReader:
+    """Rebuilds a roster from a full snapshot and the deltas that followed it"""
+    
+    def __init__(self):
+        self.strings = []
+        self.lists = []  # Shared tuples of names
+        self.heroes = []
+    
+    def _hero(self, fields, strings, lists):
+        """Create the hero object for one unpacked record"""
+        (kind, name, gender, hero_name, weakness, powers, gadgets, age, health, energy,
+         max_altitude, altitude, intelligence, suit_power, flags, x, y) = fields
+        state = {"name": strings[name], "gender": strings[gender], "age": age, "health": health}
+        if kind >= 1:
+            state.update({
+                "hero_name": strings[hero_name],
+                "powers": lists[powers],
+                "weakness": None if weakness == NO_STRING else strings[weakness],
+                "energy": energy,
+                "identity_revealed": bool(flags & IDENTITY_REVEALED),
+            })
+        if kind == 2:
+            state.update({"max_altitude": max_altitude, "current_altitude": altitude,
+                          "is_flying": bool(flags & IS_FLYING)})
+        elif kind == 3:
+            state.update({"intelligence_level": intelligence, "gadgets": lists[gadgets],
+                          "suit_power": suit_power, "hacking_tools_active": bool(flags & HACKING_ACTIVE),
+                          "position": (x, y)})
+        return KIND_CLASSES[kind]._from_state(state)
+    
+    def apply(self, data):
+        """Apply a full or delta snapshot and return the current heroes"""
+        try:
+            (magic, version, snapshot_type, hero_count, first_string, string_count,
+             first_list, list_count, record_count) = HEADER.unpack_from(data, 0)
+        except struct.error:
+            raise SnapshotError("Data is too short to be a snapshot") from None
+        if magic != MAGIC or version != VERSION:
+            raise SnapshotError("Not a hero snapshot (or written by another version)")
+        full = snapshot_type == FULL
+        # A full snapshot fills new tables; a delta's additions are taken back if it fails
+        strings, lists = ([], []) if full else (self.strings, self.lists)
+        if not full and (first_string != len(strings) or first_list != len(lists)):
+            raise SnapshotError("Delta doesn't follow the snapshot this reader last applied")
+        known_strings, known_lists = len(strings), len(lists)
+        try:
+            heroes, updates = self._read(data, full, hero_count, string_count, list_count, record_count,
+                                         strings, lists)
+        except SnapshotError:
+            del strings[known_strings:], lists[known_lists:]
+            raise
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            del strings[known_strings:], lists[known_lists:]
+            raise SnapshotError(f"Snapshot is corrupt: {e}") from None
+        # Nothing has failed: only now does the reader's state change
+        self.strings, self.lists = strings, lists
+        if full:
+            self.heroes = heroes
+        else:
+            self.heroes.extend([None] * (hero_count - len(self.heroes)))
+            for index, hero in updates:
+                self.heroes[index] = hero
+        return self.heroes
+    
+    def _read(self, data, full, hero_count, string_count, list_count, record_count, strings, lists):
+        """Read the tables into strings and lists, then the records: (full roster, delta updates)"""
+        view = memoryview(data)
+        offset = HEADER.size
+        for _ in range(string_count):
+            length, offset = _length(data, offset, "string")
+            if offset + length > len(data):
+                raise SnapshotError("Snapshot is truncated in its string table")
+            strings.append(str(view[offset:offset + length], 'utf-8'))
+            offset += length
+        for _ in range(list_count):
+            length, offset = _length(data, offset, "list")
+            if offset + 4 * length > len(data):
+                raise SnapshotError("Snapshot is truncated in its list table")
+            ids = struct.unpack_from(f"<{length}I", data, offset)
+            lists.append(share_names(strings[i] for i in ids))
+            offset += 4 * length
+        
+        record = RECORD if full else INDEXED_RECORD
+        body = view[offset:offset + record.size * record_count]
+        if len(body) != record.size * record_count:
+            raise SnapshotError("Snapshot is truncated")
+        if full:
+            return [self._hero(fields, strings, lists) for fields in record.iter_unpack(body)], None
+        if hero_count < len(self.heroes):
+            raise SnapshotError("Delta has fewer heroes than the snapshot it follows")
+        updates = []
+        for fields in record.iter_unpack(body):
+            if fields[0] >= hero_count:
+                raise SnapshotError(f"Delta record for hero {fields[0]} of {hero_count}")
+            updates.append((fields[0], self._hero(fields[1:], strings, lists)))
+        return None, updates
+
+def save_snapshot(heroes):
+    """Full snapshot of a list of heroes"""
+    return SnapshotWriter().full(heroes)
+
+def load_snapshot(data):
+    """Heroes from a full snapshot"""
+    return SnapshotReader().apply(data)
@@ -3,16 +3,24 @@ Superhero class demonstrating inheritance from Person class
 - Inheritance: Inherits all attributes and methods from Person
 - Method overriding: Overrides some methods for superhero-specific behavior
 - Additional attributes and methods specific to superheroes
+- Powers are kept in a shared, interned tuple (see abilities.py) to save memory,
+  plus a bitmask from the POWERS registry for fast membership checks
 """
 
+from abilities import POWERS
+from events import emit
 from person import Person
+from weakness_matcher import weakness_exploited
 
 class Superhero(Person):
+    __slots__ = ("__hero_name", "__powers", "__power_mask", "__weakness", "_energy", "__secret_identity_revealed")
+    
     def __init__(self, name, age, gender, hero_name, powers, weakness=None):
         """Constructor that calls parent constructor and adds superhero-specific attributes"""
         super().__init__(name, age, gender)  # Call parent constructor
         self.__hero_name = hero_name  # Private superhero name
-        self.__powers = powers if isinstance(powers, list) else [powers]  # Private powers list
+        # Private powers tuple (in the order they were gained) and its bitmask
+        self.__powers, self.__power_mask = POWERS.share(powers if isinstance(powers, list) else [powers])
         self.__weakness = weakness  # Private weakness
         self._energy = 100  # Protected energy attribute
         self.__secret_identity_revealed = False  # Private attribute
@@ -24,7 +32,16 @@ class Superhero(Person):
     
     def get_powers(self):
         """Get the list of powers"""
-        return self.__powers.copy()  # Return copy to prevent external modification
+        return list(self.__powers)  # Return a list copy to prevent external modification
+    
+    def has_power(self, power):
+        """Check if the superhero has a power"""
+        return bool(self.__power_mask & POWERS.bit(power))
+    
+    def has_all_powers(self, powers):
+        """Check if the superhero has every one of the given powers"""
+        required = POWERS.known_mask(powers)
+        return required is not None and self.__power_mask & required == required
     
     def get_weakness(self):
         """Get the superhero's weakness"""
@@ -44,27 +61,27 @@ class Superhero(Person):
         if isinstance(hero_name, str) and len(hero_name) > 0:
             self.__hero_name = hero_name
         else:
-            print("Invalid hero name!")
+            emit("invalid_hero_name")
     
     def add_power(self, power):
         """Add a new power to the superhero"""
-        if power not in self.__powers:
-            self.__powers.append(power)
-            print(f"{self.__hero_name} gained new power: {power}")
+        if not self.has_power(power):
+            self.__powers, self.__power_mask = POWERS.share(self.__powers + (power,))
+            emit("add_power", self.__hero_name, power)
         else:
-            print(f"{self.__hero_name} already has the power: {power}")
+            emit("power_exists", self.__hero_name, power)
     
     def set_energy(self, energy):
         """Set the superhero's energy level"""
         if 0 <= energy <= 100:
             self._energy = energy
         else:
-            print("Energy must be between 0 and 100!")
+            emit("invalid_energy")
     
     def reveal_identity(self):
         """Reveal the secret identity"""
         self.__secret_identity_revealed = True
-        print(f"BREAKING NEWS: {self.__hero_name} is actually {self.get_name()}!")
+        emit("reveal_identity", self.__hero_name, self.get_name())
     
     # Method overriding - Polymorphism
     def introduce(self):
@@ -77,27 +94,27 @@ class Superhero(Person):
     # New methods specific to superheroes
     def use_power(self, power_name, energy_cost=10):
         """Use a specific power"""
-        if power_name in self.__powers:
+        if self.__power_mask & POWERS.bit(power_name):
             if self._energy >= energy_cost:
                 self._energy -= energy_cost
-                print(f"{self.__hero_name} uses {power_name}! Energy remaining: {self._energy}")
+                emit("use_power", self.__hero_name, power_name, self._energy)
                 return True
             else:
-                print(f"{self.__hero_name} doesn't have enough energy to use {power_name}!")
+                emit("power_no_energy", self.__hero_name, power_name)
                 return False
         else:
-            print(f"{self.__hero_name} doesn't have the power: {power_name}")
+            emit("power_missing", self.__hero_name, power_name)
             return False
     
     def rest(self, energy_gain=20):
         """Rest to regain energy"""
         self._energy = min(100, self._energy + energy_gain)
-        print(f"{self.__hero_name} rests and regains energy. Energy: {self._energy}")
+        emit("rest", self.__hero_name, self._energy)
     
     def save_citizen(self):
         """Save a citizen - uses energy"""
         if self.use_power("rescue", 15):
-            print(f"{self.__hero_name} heroically saves a citizen!")
+            emit("save_citizen", self.__hero_name)
             return True
         return False
     
@@ -105,19 +122,41 @@ class Superhero(Person):
         """Fight a villain"""
         if self._energy >= 25:
             self._energy -= 25
-            print(f"{self.__hero_name} fights {villain_name}! Energy remaining: {self._energy}")
+            emit("fight", self.__hero_name, villain_name, self._energy)
             # Check if weakness is exploited
-            if self.__weakness and self.__weakness.lower() in villain_name.lower():
-                print(f"Oh no! {villain_name} exploited {self.__hero_name}'s weakness: {self.__weakness}!")
+            if weakness_exploited(self.__weakness, villain_name):
+                emit("weakness_exploited", self.__hero_name, villain_name, self.__weakness)
                 self.take_damage(30)
                 return False
             else:
-                print(f"{self.__hero_name} defeats {villain_name}!")
+                emit("villain_defeated", self.__hero_name, villain_name)
                 return True
         else:
-            print(f"{self.__hero_name} is too tired to fight!")
+            emit("too_tired_to_fight", self.__hero_name)
             return False
     
+    # Extend state export/import with superhero attributes
+    def _export_state(self):
+        """Return every attribute, private ones included, as a dict"""
+        state = super()._export_state()
+        state.update({
+            "hero_name": self.__hero_name,
+            "powers": list(self.__powers),
+            "weakness": self.__weakness,
+            "energy": self._energy,
+            "identity_revealed": self.__secret_identity_revealed,
+        })
+        return state
+    
+    def _import_state(self, state):
+        """Restore the attributes saved by _export_state()"""
+        super()._import_state(state)
+        self.__hero_name = state["hero_name"]
+        self.__powers, self.__power_mask = POWERS.share(state["powers"])
+        self.__weakness = state["weakness"]
+        self._energy = state["energy"]
+        self.__secret_identity_revealed = state["identity_revealed"]
+    
     # Override string methods
     def __str__(self):
         """String representation of the superhero"""
@@ -126,4 +165,4 @@ class Superhero(Person):
     
     def __repr__(self):
         """Developer-friendly representation"""
-        return f"Superhero('{self.get_name()}', {self.get_age()}, '{self.get_gender()}', '{self.__hero_name}', {self.__powers})"
+        return f"Superhero('{self.get_name()}', {self.get_age()}, '{self.get_gender()}', '{self.__hero_name}', {list(self.__powers)})"
@@ -5,26 +5,35 @@ TechHero class demonstrating polymorphism and specialized superhero abilities
 - Demonstrates different implementation of similar methods
 """
 
+from abilities import GADGETS
+from city_map import DEFAULT_SCAN_RADIUS
+from events import emit
 from superhero import Superhero
+from weakness_matcher import is_tech_name
 
 class TechHero(Superhero):
+    __slots__ = ("__intelligence_level", "__gadgets", "__gadget_mask", "__suit_power", "__hacking_tools_active",
+                 "__position")
+    
     def __init__(self, name, age, gender, hero_name, powers, weakness=None, intelligence_level=85):
         """Constructor for tech-based superhero"""
         # Ensure technology powers are included
         tech_powers = ["technology", "gadgets", "hacking"]
         if isinstance(powers, list):
-            powers.extend([p for p in tech_powers if p not in powers])
+            present = set(powers)
+            powers.extend([p for p in tech_powers if p not in present])
         else:
             powers = [powers] + tech_powers
         
         super().__init__(name, age, gender, hero_name, powers, weakness)
         self.__intelligence_level = intelligence_level  # Private intelligence stat
-        self.__gadgets = []  # Private list of gadgets
+        self.__gadgets, self.__gadget_mask = GADGETS.share([])  # Private (shared) gadget tuple and its bitmask
         self.__suit_power = 100  # Private suit power level
         self.__hacking_tools_active = False  # Private hacking status
+        self.__position = (0.0, 0.0)  # Private (x, y) position on a city map
         
         # Start with basic gadgets
-        self.__gadgets = ["Communication Device", "Scanner", "Emergency Beacon"]
+        self.__gadgets, self.__gadget_mask = GADGETS.share(["Communication Device", "Scanner", "Emergency Beacon"])
     
     # Getter methods for tech-specific attributes
     def get_intelligence_level(self):
@@ -33,7 +42,16 @@ class TechHero(Superhero):
     
     def get_gadgets(self):
         """Get list of available gadgets"""
-        return self.__gadgets.copy()
+        return list(self.__gadgets)
+    
+    def has_gadget(self, gadget_name):
+        """Check if a gadget is in the inventory"""
+        return bool(self.__gadget_mask & GADGETS.bit(gadget_name))
+    
+    def has_all_gadgets(self, gadget_names):
+        """Check if every one of the given gadgets is in the inventory"""
+        required = GADGETS.known_mask(gadget_names)
+        return required is not None and self.__gadget_mask & required == required
     
     def get_suit_power(self):
         """Get current suit power level"""
@@ -43,27 +61,35 @@ class TechHero(Superhero):
         """Check if hacking tools are active"""
         return self.__hacking_tools_active
     
+    def get_position(self):
+        """Get the (x, y) position on the city map"""
+        return self.__position
+    
+    def set_position(self, x, y):
+        """Move to a position on the city map"""
+        self.__position = (x, y)
+    
     # Tech-specific methods
     def add_gadget(self, gadget_name):
         """Add a new gadget to inventory"""
-        if gadget_name not in self.__gadgets:
-            self.__gadgets.append(gadget_name)
-            print(f"{self.get_hero_name()} acquires new gadget: {gadget_name}")
+        if not self.has_gadget(gadget_name):
+            self.__gadgets, self.__gadget_mask = GADGETS.share(self.__gadgets + (gadget_name,))
+            emit("add_gadget", self.get_hero_name(), gadget_name)
         else:
-            print(f"{self.get_hero_name()} already has: {gadget_name}")
+            emit("gadget_exists", self.get_hero_name(), gadget_name)
     
     def use_gadget(self, gadget_name, suit_power_cost=5):
         """Use a specific gadget"""
-        if gadget_name in self.__gadgets:
+        if self.__gadget_mask & GADGETS.bit(gadget_name):
             if self.__suit_power >= suit_power_cost:
                 self.__suit_power -= suit_power_cost
-                print(f"{self.get_hero_name()} uses {gadget_name}! Suit power: {self.__suit_power}%")
+                emit("use_gadget", self.get_hero_name(), gadget_name, self.__suit_power)
                 return True
             else:
-                print(f"{self.get_hero_name()}'s suit doesn't have enough power for {gadget_name}!")
+                emit("gadget_no_power", self.get_hero_name(), gadget_name)
                 return False
         else:
-            print(f"{self.get_hero_name()} doesn't have gadget: {gadget_name}")
+            emit("gadget_missing", self.get_hero_name(), gadget_name)
             return False
     
     def hack_system(self, system_name):
@@ -72,14 +98,14 @@ class TechHero(Superhero):
             self.activate_hacking_tools()
         
         hack_difficulty = 20  # Base difficulty
-        success_chance = self.__intelligence_level + (10 if "Hacking Device" in self.__gadgets else 0)
+        success_chance = self.__intelligence_level + (10 if self.has_gadget("Hacking Device") else 0)
         
         if self.use_power("hacking", 15):
             if success_chance >= hack_difficulty:
-                print(f"{self.get_hero_name()} successfully hacks into {system_name}!")
+                emit("hack_success", self.get_hero_name(), system_name)
                 return True
             else:
-                print(f"{self.get_hero_name()} failed to hack {system_name}. Need higher intelligence or better tools.")
+                emit("hack_failed", self.get_hero_name(), system_name)
                 return False
         return False
     
@@ -87,15 +113,25 @@ class TechHero(Superhero):
         """Activate advanced hacking tools"""
         if self.use_gadget("Scanner", 10):
             self.__hacking_tools_active = True
-            print(f"{self.get_hero_name()} activates advanced hacking tools!")
+            emit("hacking_tools_active", self.get_hero_name())
             return True
         return False
     
-    def scan_area(self, area_name):
-        """Scan an area for threats or information"""
+    def scan_area(self, area_name, city_map=None, radius=DEFAULT_SCAN_RADIUS):
+        """
+        Scan an area for threats or information
+        - Without a city map the scanner always finds the same three threats
+        - With one, a named area of the map is scanned (cached), or else everything
+          within radius of the hero's position
+        """
         if self.use_gadget("Scanner", 8):
-            threats_found = ["Security Camera", "Motion Sensor", "Hidden Door"]
-            print(f"{self.get_hero_name()} scans {area_name} and finds: {', '.join(threats_found)}")
+            if city_map is None:
+                threats_found = ["Security Camera", "Motion Sensor", "Hidden Door"]
+            elif area_name in city_map.areas:
+                threats_found = city_map.scan_area(area_name)
+            else:
+                threats_found = city_map.scan(*self.__position, radius)
+            emit("scan_area", self.get_hero_name(), area_name, threats_found)
             return threats_found
         return []
     
@@ -103,14 +139,14 @@ class TechHero(Superhero):
         """Perform a technology-assisted rescue"""
         if rescue_type == "building_collapse":
             gadgets_needed = ["Scanner", "Communication Device"]
-            if all(gadget in self.__gadgets for gadget in gadgets_needed):
+            if self.has_all_gadgets(gadgets_needed):
                 if self.use_gadget("Scanner", 15) and self.use_power("technology", 20):
-                    print(f"{self.get_hero_name()} uses thermal scanning to locate survivors!")
-                    print(f"Coordinating rescue with emergency services via communication device!")
+                    emit("thermal_scan", self.get_hero_name())
+                    emit("coordinate_rescue")
                     return True
         elif rescue_type == "cyber_attack":
             if self.hack_system("Emergency Systems"):
-                print(f"{self.get_hero_name()} stops the cyber attack and restores systems!")
+                emit("cyber_attack_stopped", self.get_hero_name())
                 return True
         else:
             # Standard rescue with tech assistance
@@ -121,35 +157,35 @@ class TechHero(Superhero):
     def recharge_suit(self, recharge_amount=30):
         """Recharge the tech suit"""
         self.__suit_power = min(100, self.__suit_power + recharge_amount)
-        print(f"{self.get_hero_name()}'s suit recharges. Power level: {self.__suit_power}%")
+        emit("recharge_suit", self.get_hero_name(), self.__suit_power)
     
     def upgrade_intelligence(self, upgrade_points=5):
         """Upgrade intelligence level"""
         if self.__intelligence_level < 100:
             old_level = self.__intelligence_level
             self.__intelligence_level = min(100, self.__intelligence_level + upgrade_points)
-            print(f"{self.get_hero_name()}'s intelligence increased from {old_level} to {self.__intelligence_level}!")
+            emit("upgrade_intelligence", self.get_hero_name(), old_level, self.__intelligence_level)
         else:
-            print(f"{self.get_hero_name()} has reached maximum intelligence level!")
+            emit("max_intelligence", self.get_hero_name())
     
     # Override fight_villain for tech-based combat
     def fight_villain(self, villain_name):
         """Fight a villain using technology"""
-        print(f"{self.get_hero_name()} analyzes {villain_name} with advanced scanners...")
+        emit("analyze_villain", self.get_hero_name(), villain_name)
         
         if self.scan_area(f"{villain_name}'s location"):
-            if "Cyber" in villain_name or "Tech" in villain_name:
+            if is_tech_name(villain_name):
                 # Tech vs Tech battle
-                print(f"Tech battle detected! {self.get_hero_name()} initiates cyber warfare!")
+                emit("tech_battle", self.get_hero_name())
                 if self.hack_system(f"{villain_name}'s systems"):
-                    print(f"{self.get_hero_name()} disables {villain_name}'s technology!")
+                    emit("tech_disabled", self.get_hero_name(), villain_name)
                     return True
                 else:
                     return super().fight_villain(villain_name)
             else:
                 # Use gadgets to assist in regular combat
                 if self.use_gadget("Scanner") and self.use_gadget("Communication Device"):
-                    print(f"{self.get_hero_name()} uses tactical analysis and coordination!")
+                    emit("tactical_analysis", self.get_hero_name())
                     return super().fight_villain(villain_name)
         
         return super().fight_villain(villain_name)
@@ -161,6 +197,28 @@ class TechHero(Superhero):
         self.recharge_suit(25)
         self.__hacking_tools_active = False  # Reset hacking tools
     
+    # Extend state export/import with tech attributes
+    def _export_state(self):
+        """Return every attribute, private ones included, as a dict"""
+        state = super()._export_state()
+        state.update({
+            "intelligence_level": self.__intelligence_level,
+            "gadgets": list(self.__gadgets),
+            "suit_power": self.__suit_power,
+            "hacking_tools_active": self.__hacking_tools_active,
+            "position": self.__position,
+        })
+        return state
+    
+    def _import_state(self, state):
+        """Restore the attributes saved by _export_state()"""
+        super()._import_state(state)
+        self.__intelligence_level = state["intelligence_level"]
+        self.__gadgets, self.__gadget_mask = GADGETS.share(state["gadgets"])
+        self.__suit_power = state["suit_power"]
+        self.__hacking_tools_active = state["hacking_tools_active"]
+        self.__position = tuple(state.get("position", (0.0, 0.0)))
+    
     # Override string representation
     def __str__(self):
         """String representation of the tech hero"""
@@ -0,0 +1,241 @@
+"""
+Monte Carlo tournament for the hero hierarchy
+- Runs many randomized encounters (fights, rescues, patrols and rests) with
+  Superhero, FlyingHero and TechHero objects
+- Encounters are split into fixed-size shards run on a ProcessPoolExecutor;
+  every shard has its own deterministic seed, so results reproduce exactly
+  whatever the number of workers
+- Hero events are silenced inside the workers, except that base fights are counted
+  so weakness hits only cover fights that actually happened
+- Shard results stream back as they finish and are merged into one aggregate:
+  win rates, energy curves and weakness hit rates per hero kind
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import events
+from flying_hero import FlyingHero
+from superhero import Superhero
+from tech_hero import TechHero
+from weakness_matcher import WeaknessMatcher
+
+ENCOUNTERS = ["fight", "rescue", "patrol", "rest"]
+DEFAULT_SHARD_SIZE = 50000  # Encounters per shard (and per seed)
+CURVE_STEP = 1000  # Encounters between two energy samples within a shard
+TECH_RESCUES = ["standard", "building_collapse", "cyber_attack"]
+
+VILLAINS = ["Lex Luthor", "Kryptonite Man", "Ares", "Cyber Skull", "Tech Titan", "Magic Mike", "The Joker",
+            "EMP Overlord", "Doctor Water", "Firestarter", "Mister Freeze", "Cyber EMPress"]
+
+def make_heroes():
+    """The tournament line-up: fresh hero objects for one shard"""
+    return [
+        Superhero("Diana Prince", 30, "Female", "Wonder Woman", ["Super Strength", "rescue", "Lasso"], "Magic"),
+        Superhero("Barry Allen", 28, "Male", "The Flash", ["Super Speed", "rescue"], "Cold"),
+        FlyingHero("Clark Kent", 32, "Male", "Superman", ["Super Strength", "rescue"], "Kryptonite"),
+        FlyingHero("Carol Danvers", 35, "Female", "Captain Marvel", ["Energy Blasts", "rescue"], "Water", 20000),
+        TechHero("Tony Stark", 45, "Male", "Iron Man", ["Genius Intellect", "rescue"], "EMP", intelligence_level=95),
+        TechHero("Shuri", 18, "Female", "Tech Princess", ["Engineering", "rescue"], "Fire", intelligence_level=99),
+    ]
+
+def kind_name(hero):
+    """Name of a hero's class, used as the aggregate key"""
+    return type(hero).__name__
+
+def new_stats():
+    """Empty aggregate (plain dicts and lists, so shards can send it between processes)"""
+    return {"encounters": 0, "outcomes": {}, "fights": {}, "energy": {}}
+
+def shard_seed(seed, shard_index):
+    """Deterministic seed of one shard"""
+    return f"{seed}:{shard_index}"
+
+class FightCounter:
+    """Quiet sink that only counts the "fight" events of Superhero.fight_villain (fights that really ran)"""
+    
+    def __init__(self):
+        self.fights = 0
+    
+    def emit(self, kind, args):
+        if kind == "fight":
+            self.fights += 1
+
+def encounter(hero, kind, rng, villains):
+    """Run one encounter, returning (success, villain fought or None)"""
+    if kind == "fight":
+        villain = rng.choice(villains)
+        if isinstance(hero, FlyingHero):
+            return hero.fight_villain(villain, aerial_combat=rng.random() < 0.5), villain
+        return hero.fight_villain(villain), villain
+    if kind == "rescue":
+        if isinstance(hero, FlyingHero):
+            return hero.aerial_rescue(rng.randrange(100, 2000, 100)), None
+        if isinstance(hero, TechHero):
+            return hero.tech_rescue(rng.choice(TECH_RESCUES)), None
+        return hero.save_citizen(), None
+    if kind == "patrol":
+        if isinstance(hero, FlyingHero):
+            return hero.sky_patrol(rng.randrange(500, 5000, 100)), None
+        if isinstance(hero, TechHero):
+            return bool(hero.scan_area("the city")), None
+        return hero.use_power(hero.get_powers()[0]), None
+    # Rest: regain energy and recover a little (tech heroes also recharge their suit)
+    hero.rest(rng.randint(10, 40))
+    hero.heal(10)
+    if isinstance(hero, TechHero):
+        hero.recharge_suit()
+    return True, None
+
+def run_shard(shard_index, encounters, seed):
+    """
+    Run one shard of encounters in a worker process
+    - Its own heroes, its own random generator, events silenced (only base fights are counted)
+    - A fight counts towards the weakness hit rate only if the base fight_villain ran; a failed
+      take-off or climb, a tired hero or a hacked villain isn't a fight the weakness could decide
+    - Returns the shard's statistics in the new_stats() layout
+    """
+    rng = random.Random(shard_seed(seed, shard_index))
+    heroes = make_heroes()
+    matcher = WeaknessMatcher.from_heroes(heroes)
+    villains = matcher.prepare_all(VILLAINS)  # Normalized once for every fight in the shard
+    stats = new_stats()
+    stats["encounters"] = encounters
+    
+    counter = FightCounter()
+    with events.use_sink(counter):
+        for step in range(encounters):
+            hero = rng.choice(heroes)
+            kind = rng.choice(ENCOUNTERS)
+            fights_before = counter.fights
+            success, villain = encounter(hero, kind, rng, villains)
+            
+            hero_kind = kind_name(hero)
+            outcome = stats["outcomes"].setdefault(hero_kind, {}).setdefault(kind, [0, 0])
+            outcome[0] += 1
+            outcome[1] += bool(success)  # Some actions return None when they give up early
+            if villain is not None and counter.fights > fights_before:
+                fights = stats["fights"].setdefault(hero_kind, [0, 0])
+                fights[0] += 1
+                fights[1] += villain.exploits(hero.get_weakness())
+            
+            if step % CURVE_STEP == 0:
+                for sampled in heroes:
+                    curve = stats["energy"].setdefault(kind_name(sampled), [])
+                    point = step // CURVE_STEP
+                    if len(curve) <= point:
+                        curve.append([0, 0])
+                    curve[point][0] += sampled.get_energy()
+                    curve[point][1] += 1
+    return stats
+
+def merge_stats(total, shard):
+    """Add one shard's statistics into the aggregate"""
+    total["encounters"] += shard["encounters"]
+    for hero_kind, outcomes in shard["outcomes"].items():
+        for kind, (attempts, successes) in outcomes.items():
+            outcome = total["outcomes"].setdefault(hero_kind, {}).setdefault(kind, [0, 0])
+            outcome[0] += attempts
+            outcome[1] += successes
+    for hero_kind, (fights, hits) in shard["fights"].items():
+        total_fights = total["fights"].setdefault(hero_kind, [0, 0])
+        total_fights[0] += fights
+        total_fights[1] += hits
+    for hero_kind, curve in shard["energy"].items():
+        total_curve = total["energy"].setdefault(hero_kind, [])
+        for point, (energy, samples) in enumerate(curve):
+            if len(total_curve) <= point:
+                total_curve.append([0, 0])
+            total_curve[point][0] += energy
+            total_curve[point][1] += samples
+    return total
+
+def shard_sizes(encounters, shard_size):
+    """Split the encounters into shards of shard_size (the last one may be smaller)"""
+    return [min(shard_size, encounters - start) for start in range(0, encounters, shard_size)]
+
+def run_tournament(encounters, workers=None, seed=42, shard_size=DEFAULT_SHARD_SIZE, on_shard=None):
+    """
+    Run the whole tournament and return the aggregate
+    - workers=1 runs the shards in this process
+    - on_shard(done, total) is called as each shard's results arrive
+    """
+    sizes = shard_sizes(encounters, shard_size)
+    total = new_stats()
+    if workers == 1:
+        for shard_index, size in enumerate(sizes):
+            merge_stats(total, run_shard(shard_index, size, seed))
+            if on_shard:
+                on_shard(shard_index + 1, len(sizes))
+        return total
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_shard, shard_index, size, seed) for shard_index, size in enumerate(sizes)]
+        for done, future in enumerate(as_completed(futures), 1):
+            merge_stats(total, future.result())  # Merging is order independent, so results reproduce
+            if on_shard:
+                on_shard(done, len(sizes))
+    return total
+
+def win_rates(stats):
+    """Success rate of each encounter kind per hero kind"""
+    return {hero_kind: {kind: successes / attempts for kind, (attempts, successes) in outcomes.items()}
+            for hero_kind, outcomes in stats["outcomes"].items()}
+
+def weakness_hit_rates(stats):
+    """Share of fights in which the villain exploited the hero's weakness, per hero kind"""
+    return {hero_kind: hits / fights for hero_kind, (fights, hits) in stats["fights"].items() if fights}
+
+def energy_curves(stats):
+    """Average energy every CURVE_STEP encounters into a shard, per hero kind"""
+    return {hero_kind: [energy / samples for energy, samples in curve]
+            for hero_kind, curve in stats["energy"].items()}
+
+def print_report(stats, seconds):
+    """Print the aggregate in a readable form"""
+    print(f"🏆 {stats['encounters']:,} encounters in {seconds:.2f}s "
+          f"({stats['encounters'] / max(seconds, 1e-9):,.0f} encounters/s)")
+    print("\n📊 Win rates:")
+    for hero_kind, rates in sorted(win_rates(stats).items()):
+        print(f"   {hero_kind:<11}" + "".join(f"  {kind} {rates.get(kind, 0):>6.1%}" for kind in ENCOUNTERS))
+    print("\n💥 Weakness hit rates:")
+    for hero_kind, rate in sorted(weakness_hit_rates(stats).items()):
+        print(f"   {hero_kind:<11}  {rate:.1%} of fights")
+    print("\n⚡ Energy curves (average energy every 1000 encounters):")
+    for hero_kind, curve in sorted(energy_curves(stats).items()):
+        print(f"   {hero_kind:<11}  " + " ".join(f"{energy:.0f}" for energy in curve[:12]))
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Run a Monte Carlo hero tournament on every core")
+    parser.add_argument("--encounters", type=int, default=1000000, help="total encounters to simulate")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--seed", type=int, default=42, help="tournament seed (same seed, same results)")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE, help="encounters per shard")
+    parser.add_argument("--scaling", action="store_true", help="also run with a single worker and report the speedup")
+    args = parser.parse_args()
+    
+    print("🦸 HERO TOURNAMENT")
+    print("=" * 60)
+    
+    def progress(done, total):
+        print(f"\r   ⏳ {done}/{total} shards", end="", flush=True)
+    
+    start = time.perf_counter()
+    stats = run_tournament(args.encounters, args.workers, args.seed, args.shard_size, progress)
+    seconds = time.perf_counter() - start
+    print()
+    print_report(stats, seconds)
+    
+    if args.scaling:
+        start = time.perf_counter()
+        single = run_tournament(args.encounters, 1, args.seed, args.shard_size)
+        single_seconds = time.perf_counter() - start
+        print(f"\n🚀 {args.workers} workers: {single_seconds / seconds:.2f}x faster than 1 worker "
+              f"({'same' if single == stats else 'DIFFERENT'} results)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Weakness matcher for fights at scale
+- Builds one Aho-Corasick automaton over every hero weakness (lowercased once)
+- Each villain name is lowercased and scanned once, whatever the number of heroes
+- prepare() returns a Villain: a str that remembers which weaknesses it exploits,
+  so fight_villain() only does a set lookup instead of lowercasing and searching
+"""
+
+def is_tech_name(villain_name):
+    """TechHero's tech-villain check ("Cyber" or "Tech" in the name, case-sensitive)"""
+    if isinstance(villain_name, Villain):
+        return villain_name.is_tech
+    return "Cyber" in villain_name or "Tech" in villain_name
+
+def weakness_exploited(weakness, villain_name):
+    """Superhero's weakness check: the weakness appears in the villain name, ignoring case"""
+    if not weakness:
+        return False
+    if isinstance(villain_name, Villain):
+        return villain_name.exploits(weakness)
+    return weakness.lower() in villain_name.lower()
+
+class Villain(str):
+    """
+    A villain name normalized once up front
+    - Behaves exactly like the plain name string (printing, formatting, comparing)
+    - lowered: the lowercased name
+    - is_tech: whether TechHero treats it as a tech villain
+    - weaknesses: the matcher's weaknesses found in the name
+    """
+    
+    def __new__(cls, name, matcher=None):
+        villain = super().__new__(cls, name)
+        villain.lowered = villain.lower()
+        villain.is_tech = "Cyber" in name or "Tech" in name
+        villain.matcher = matcher
+        villain.weaknesses = matcher.find(villain.lowered) if matcher else frozenset()
+        return villain
+    
+    def exploits(self, weakness):
+        """Check if a weakness appears in the name (a set lookup for weaknesses the matcher knows)"""
+        if self.matcher is not None and weakness in self.matcher.weaknesses:
+            return weakness in self.weaknesses
+        return weakness.lower() in self.lowered
+
+class WeaknessMatcher:
+    """Finds every known weakness inside a villain name in a single pass"""
+    
+    def __init__(self, weaknesses=()):
+        self.weaknesses = set()  # Original weakness strings
+        self._goto = [{}]  # Trie: node -> {character: next node}
+        self._fail = [0]  # Node -> longest proper suffix that is also in the trie
+        self._output = [()]  # Node -> weaknesses ending at this node
+        self._heroes = {}  # Weakness -> heroes with it (when built from heroes)
+        
+        patterns = {}  # Lowercased pattern -> original weaknesses
+        for weakness in weaknesses:
+            if weakness and weakness not in self.weaknesses:
+                self.weaknesses.add(weakness)
+                patterns.setdefault(weakness.lower(), []).append(weakness)
+        self._build(patterns)
+    
+    @classmethod
+    def from_heroes(cls, heroes):
+        """Matcher over the weaknesses of these heroes, able to list the heroes a villain exploits"""
+        heroes = list(heroes)
+        matcher = cls(hero.get_weakness() for hero in heroes)
+        for hero in heroes:
+            weakness = hero.get_weakness()
+            if weakness:
+                matcher._heroes.setdefault(weakness, []).append(hero)
+        return matcher
+    
+    def _build(self, patterns):
+        """Build the trie, then the failure links breadth first"""
+        outputs = [[]]
+        for pattern, originals in patterns.items():
+            node = 0
+            for character in pattern:
+                next_node = self._goto[node].get(character)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][character] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                node = next_node
+            outputs[node].extend(originals)
+        
+        queue = list(self._goto[0].values())
+        for node in queue:  # The list grows while it is walked: a breadth-first queue
+            for character, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and character not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(character, 0)
+                outputs[child].extend(outputs[self._fail[child]])  # Shorter matches ending here too
+                queue.append(child)
+        self._output = [tuple(found) for found in outputs]
+    
+    def find(self, lowered_name):
+        """Every known weakness that appears in an already lowercased name"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        node = 0
+        for character in lowered_name:
+            while node and character not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(character, 0)
+            if output[node]:
+                found.update(output[node])
+        return frozenset(found)
+    
+    def prepare(self, villain_name):
+        """Normalize a villain name once, ready to be fought by many heroes"""
+        return Villain(villain_name, self)
+    
+    def prepare_all(self, villain_names):
+        """Normalize many villain names"""
+        return [Villain(name, self) for name in villain_names]
+    
+    def heroes_exploited_by(self, villain):
+        """Heroes (from from_heroes()) whose weakness the villain exploits"""
+        if not isinstance(villain, Villain) or villain.matcher is not self:
+            villain = self.prepare(villain)
+        return [hero for weakness in villain.weaknesses for hero in self._heroes.get(weakness, ())]
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the discount rules engine (discount_rules.py)
+1. The default rules must price exactly like calculate_discount() (python-week3.py)
+2. Lookups on growing rule tables: the compiled lookup stays flat while a linear
+   scan of the rules (the reference it is checked against) grows with the table
+3. Date-heavy tables: every rule has its own promotion window, so compiling has to
+   stay close to linear in the number of date boundaries
+4. Hot reload: a changed rule file is picked up without creating a new RuleBook
+"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+from discount_rules import ANY_CATEGORY, DEFAULT_RULES, CompiledRules, RuleBook
+
+week3 = importlib.import_module("python-week3")  # The file name isn't a valid module name
+
+YEAR_START = date(2026, 1, 1)
+
+def make_rules(count, rng):
+    """count random rules over count // 10 categories, some limited to a promotion month"""
+    categories = [f"category {number}" for number in range(max(1, count // 10))] + [ANY_CATEGORY]
+    rules = []
+    for _ in range(count):
+        rule = {"category": rng.choice(categories), "threshold": rng.randrange(0, 60)}
+        roll = rng.random()
+        if roll < 0.3:
+            rule["percent"] = rng.randrange(5, 50)
+        elif roll < 0.5:
+            rule["max_percent"] = rng.randrange(20, 70)
+        if rng.random() < 0.3:
+            month = rng.randrange(1, 12)
+            rule["start"] = date(2026, month, 1).isoformat()
+            rule["end"] = date(2026, month + 1, 1).isoformat()
+        rules.append(rule)
+    return rules
+
+def make_windowed_rules(count, rng):
+    """count rules in one category, each valid for its own 30-day window"""
+    return [{"category": "promotions", "threshold": rng.randrange(0, 60),
+             "start": (YEAR_START + timedelta(days=30 * number)).isoformat(),
+             "end": (YEAR_START + timedelta(days=30 * number + 30)).isoformat()}
+            for number in range(count)]
+
+def linear_percent(rules, discount_percent, category, on):
+    """The rules' discount by scanning every rule (the reference for the compiled lookup)"""
+    if not any((rule.get("category") or ANY_CATEGORY) == category for rule in rules):
+        category = ANY_CATEGORY
+    best = None
+    for rule in rules:
+        if ((rule.get("category") or ANY_CATEGORY) == category and rule["threshold"] <= discount_percent
+                and ("start" not in rule or date.fromisoformat(rule["start"]) <= on)
+                and ("end" not in rule or on < date.fromisoformat(rule["end"]))
+                and (best is None or rule["threshold"] >= best["threshold"])):
+            best = rule
+    if best is None:
+        return 0
+    if "percent" in best:
+        return best["percent"]
+    return min(discount_percent, best["max_percent"]) if "max_percent" in best else discount_percent
+
+def make_items(count, categories, rng):
+    """(offered discount, category, date) items"""
+    return [(round(rng.uniform(0, 70), 2), rng.choice(categories), YEAR_START + timedelta(days=rng.randrange(365)))
+            for _ in range(count)]
+
+def main():
+    """Check the default policy, time lookups on growing tables and check hot reload"""
+    parser = argparse.ArgumentParser(description="Benchmark the discount rules engine")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100_000], help="rule table sizes")
+    parser.add_argument("--items", type=int, default=100_000, help="items priced per table")
+    parser.add_argument("--check", type=int, default=300, help="items checked against a linear scan")
+    parser.add_argument("--windows", type=int, nargs="+", default=[1000, 4000, 16_000],
+                        help="date-heavy table sizes (one promotion window per rule)")
+    args = parser.parse_args()
+    rng = random.Random(42)
+    
+    print("🏷️ DISCOUNT RULES BENCHMARK")
+    print("=" * 60)
+    default = CompiledRules(DEFAULT_RULES)
+    prices = [round(rng.uniform(0, 100_000), 2) for _ in range(args.items)]
+    discounts = [rng.choice([0, 19.99, 20, 20.01, 35, round(rng.uniform(0, 100), 2)]) for _ in range(args.items)]
+    ok = all(default.final_price(price, discount) == week3.calculate_discount(price, discount)
+             for price, discount in zip(prices, discounts))
+    print("default rules match calculate_discount()" if ok else "default rules DIFFER from calculate_discount()")
+    
+    print(f"\n{'rules':>8} {'compile':>10} {'lookup':>12} {'linear scan':>14}")
+    for size in args.sizes:
+        rules = make_rules(size, rng)
+        start = time.perf_counter()
+        compiled = CompiledRules(rules)
+        compile_seconds = time.perf_counter() - start
+        categories = list(compiled.table) + ["uncategorised"]
+        items = make_items(args.items, categories, rng)
+        
+        lookup = compiled.applied_percent
+        start = time.perf_counter()
+        results = [lookup(discount, category, on) for discount, category, on in items]
+        lookup_ns = (time.perf_counter() - start) / len(items) * 1e9
+        
+        sample = items[:args.check]
+        start = time.perf_counter()
+        expected = [linear_percent(rules, discount, category, on) for discount, category, on in sample]
+        linear_ns = (time.perf_counter() - start) / len(sample) * 1e9
+        ok &= results[:len(sample)] == expected
+        print(f"{size:>8,} {compile_seconds * 1e3:>8.1f}ms {lookup_ns:>9,.0f} ns {linear_ns:>11,.0f} ns")
+    
+    print(f"\n{'windows':>8} {'compile':>10} {'lookup':>12}")
+    for size in args.windows:
+        rules = make_windowed_rules(size, rng)
+        start = time.perf_counter()
+        compiled = CompiledRules(rules)
+        compile_seconds = time.perf_counter() - start
+        items = [(round(rng.uniform(0, 70), 2), "promotions", YEAR_START + timedelta(days=rng.randrange(30 * size)))
+                 for _ in range(args.items)]
+        lookup = compiled.applied_percent
+        start = time.perf_counter()
+        results = [lookup(discount, category, on) for discount, category, on in items]
+        lookup_ns = (time.perf_counter() - start) / len(items) * 1e9
+        ok &= results[:args.check] == [linear_percent(rules, discount, category, on)
+                                       for discount, category, on in items[:args.check]]
+        print(f"{size:>8,} {compile_seconds * 1e3:>8.1f}ms {lookup_ns:>9,.0f} ns")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rules.json")
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(DEFAULT_RULES, file)
+        book = RuleBook(path, check_interval=0)
+        before = book.applied_percent(15)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump([{"threshold": 10}], file)
+        mtime = os.stat(path).st_mtime_ns
+        os.utime(path, ns=(mtime + 1_000_000, mtime + 1_000_000))  # Coarse clocks: make the change visible
+        after = book.applied_percent(15)
+        reloaded = before == 0 and after == 15 and book.reloads == 1
+        print(f"\nhot reload: 15% offered gave {before}%, then {after}% after the file changed")
+        ok &= reloaded
+    
+    print("✅ Compiled rules match the reference everywhere" if ok else "❌ Results differ!")
+
+if __name__ == "__main__":
+    main()
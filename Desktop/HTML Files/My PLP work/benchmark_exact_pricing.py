@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the exact integer-cents pricing mode (python-week3.py)
+1. float: calculate_discount() on binary floats (fast, but not exact)
+2. decimal: calculate_discount_decimal() on decimal.Decimal (exact, slow)
+3. cents: calculate_discount_cents() on integer cents and basis points (exact)
+4. cents batch: calculate_discounts_cents() on int64 NumPy arrays (exact)
+Then the catalog totals: the float total against the exact, unrounded total (the float
+error alone), and the cents total against it (what rounding each discount to cents does).
+Exits with status 1 unless the exact modes match Decimal (see check_cents_exact()).
+"""
+
+import argparse
+import importlib
+import random
+import sys
+import time
+from decimal import Decimal
+
+week3 = importlib.import_module("python-week3")  # The file name isn't a valid module name
+
+def make_catalog(rows, seed=42):
+    """Prices and discounts as the text a catalog would hold (two decimals each)"""
+    rng = random.Random(seed)
+    prices = [f"{rng.randrange(1, 10_000_000) / 100:.2f}" for _ in range(rows)]
+    discounts = [f"{rng.choice([10, 20, 25, 33.33, 12.5, 50, 17.5]):.2f}" for _ in range(rows)]
+    return prices, discounts
+
+def timed(label, rows, function):
+    """Run function, print rows/s and return its result"""
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    print(f"{label:<12} {seconds:>8.3f}s  {rows / seconds:>14,.0f} rows/s")
+    return result
+
+def main():
+    """Time every mode and compare the catalog totals"""
+    parser = argparse.ArgumentParser(description="Benchmark exact integer-cents discount pricing")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="catalog rows")
+    parser.add_argument("--check", type=int, default=50_000, help="rows in the exactness check")
+    args = parser.parse_args()
+    
+    price_text, discount_text = make_catalog(args.rows)
+    floats = ([float(price) for price in price_text], [float(discount) for discount in discount_text])
+    decimals = ([Decimal(price) for price in price_text], [Decimal(discount) for discount in discount_text])
+    cents = ([week3.parse_cents(price) for price in price_text],
+             [week3.parse_basis_points(discount) for discount in discount_text])
+    
+    print("🏷️ EXACT PRICING BENCHMARK")
+    print("=" * 60)
+    float_prices = timed("float", args.rows, lambda: [
+        week3.calculate_discount(price, discount) for price, discount in zip(*floats)])
+    decimal_prices = timed("decimal", args.rows, lambda: [
+        week3.calculate_discount_decimal(price, discount) for price, discount in zip(*decimals)])
+    cent_prices = timed("cents", args.rows, lambda: [
+        week3.calculate_discount_cents(price, discount) for price, discount in zip(*cents)])
+    batch_prices = timed("cents batch", args.rows, lambda: week3.calculate_discounts_cents(*cents))
+    
+    # The same rule with nothing rounded: Decimal is exact here (no quantize, few digits)
+    unrounded_total = sum(price - price * discount / 100 if discount >= week3.DISCOUNT_THRESHOLD else price
+                          for price, discount in zip(*decimals))
+    exact_total = sum(cent_prices)
+    print(f"\nTotal (exact, unrounded) KES {unrounded_total:,}")
+    print(f"Total (float)            KES {sum(float_prices):,.6f}  "
+          f"(float error {Decimal(sum(float_prices)) - unrounded_total:+.6f})")
+    print(f"Total (cents, exact)     KES {week3.format_cents(exact_total)}  "
+          f"(rounding each discount to cents: {Decimal(exact_total) / 100 - unrounded_total:+.6f})")
+    print(f"Total (decimal)          KES {sum(decimal_prices):,}")
+    rounded = sum(1 for price, exact in zip(float_prices, cent_prices) if round(price * 100) != exact)
+    print(f"Items where rounding the float result to cents gives another price: {rounded:,}")
+    
+    ok = (all(int(price * 100) == exact for price, exact in zip(decimal_prices, cent_prices))
+          and list(batch_prices) == cent_prices
+          and week3.check_cents_exact(args.check) == 0)
+    print("✅ Integer cents match Decimal exactly, scalar and batch" if ok else "❌ Results differ!")
+    if not ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
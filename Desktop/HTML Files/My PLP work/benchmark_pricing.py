@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark of batch discount pricing (python-week3.py)
+1. scalar: calculate_discount() called once per row (the reference)
+2. vectorized: calculate_discounts() on whole NumPy arrays
+3. csv: price_csv_file() streaming a CSV catalog in chunks
+4. columns: price_column_files() on memory-mapped .npy columns
+Every path is checked against the scalar reference, with NumPy and with the fallback
+used when NumPy isn't installed; the benchmark exits with status 1 if any differ.
+"""
+
+import argparse
+import importlib
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+week3 = importlib.import_module("python-week3")  # The file name isn't a valid module name
+
+def make_catalog(rows, seed=42):
+    """Random prices (two decimals) and discounts, a third of them below the threshold"""
+    rng = np.random.default_rng(seed)
+    prices = np.round(rng.uniform(0, 100_000, rows), 2)
+    discounts = np.round(rng.uniform(0, 60, rows), 2)
+    return prices, discounts
+
+def report(label, seconds, rows):
+    """Print one timing line"""
+    print(f"{label:<12} {seconds:>8.3f}s  {rows / seconds:>14,.0f} rows/s")
+
+def main():
+    """Time every pricing path and check them against the scalar function"""
+    parser = argparse.ArgumentParser(description="Benchmark batch discount pricing")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="catalog rows")
+    parser.add_argument("--chunk-rows", type=int, default=week3.DEFAULT_CHUNK_ROWS, help="rows per chunk")
+    parser.add_argument("--check", type=int, default=10_000, help="rows checked against the scalar function")
+    args = parser.parse_args()
+    
+    prices, discounts = make_catalog(args.rows)
+    price_list, discount_list = prices.tolist(), discounts.tolist()
+    
+    print("🏷️ BATCH PRICING BENCHMARK")
+    print("=" * 60)
+    start = time.perf_counter()
+    expected = [week3.calculate_discount(price, discount) for price, discount in zip(price_list, discount_list)]
+    report("scalar", time.perf_counter() - start, args.rows)
+    
+    start = time.perf_counter()
+    vectorized = week3.calculate_discounts(prices, discounts)
+    report("vectorized", time.perf_counter() - start, args.rows)
+    ok = vectorized.tolist() == expected
+    
+    with tempfile.TemporaryDirectory() as directory:
+        csv_in, csv_out = os.path.join(directory, "catalog.csv"), os.path.join(directory, "priced.csv")
+        with open(csv_in, 'w', encoding='utf-8') as file:
+            file.write("sku,price,discount_percent\n")
+            file.writelines(f"SKU{row},{price!r},{discount!r}\n"
+                            for row, (price, discount) in enumerate(zip(price_list, discount_list)))
+        start = time.perf_counter()
+        week3.price_csv_file(csv_in, csv_out, args.chunk_rows)
+        report("csv", time.perf_counter() - start, args.rows)
+        with open(csv_out, encoding='utf-8') as file:
+            next(file)
+            sample = [line.rstrip("\n").rsplit(",", 1)[1] for line in file][:args.check]
+        ok &= sample == [f"{price:.2f}" for price in expected[:args.check]]
+        
+        np.save(os.path.join(directory, "price.npy"), prices)
+        np.save(os.path.join(directory, "discount_percent.npy"), discounts)
+        start = time.perf_counter()
+        week3.price_column_files(directory, args.chunk_rows)
+        report("columns", time.perf_counter() - start, args.rows)
+        ok &= np.load(os.path.join(directory, "final_price.npy")).tolist() == expected
+    
+    seed = random.randrange(1000)
+    ok &= week3.check_batch_pricing(args.check, seed) == 0
+    week3.NUMPY_AVAILABLE = False  # The pure-Python fallback must price the same
+    try:
+        ok &= week3.check_batch_pricing(args.check, seed) == 0
+    finally:
+        week3.NUMPY_AVAILABLE = True
+    print("✅ Every path matches calculate_discount(), with and without NumPy" if ok else "❌ Results differ!")
+    if not ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Discount rules engine
+- Rule tables live in a JSON or CSV file instead of being hardcoded
+- Each rule: an offered-discount threshold, optionally scoped to a category and dates,
+  and what to apply from that threshold up (the offered discount, a fixed percentage,
+  or the offered discount capped at a maximum)
+- Rules are compiled into a dict per category, date segments per category and sorted
+  threshold lists per segment, so one lookup is a dict access plus two bisects:
+  the cost grows with the log of the rules that can apply, not with the whole table
+- RuleBook reloads its file when it changes, without a restart
+
+Rule fields (JSON objects or CSV columns):
+    category    "*" (default) for every category without rules of its own
+    threshold   smallest offered discount percentage the rule covers
+    percent     fixed discount to give instead of the offered one (empty: the offered one)
+    max_percent cap on the offered discount (empty: no cap)
+    start, end  ISO dates the rule is valid from (inclusive) and until (exclusive)
+Within a category and date, the rule with the highest threshold at or below the
+offered discount applies; below every threshold no discount is given. A category with
+rules of its own doesn't use the "*" rules.
+"""
+
+import csv
+import json
+import os
+import time
+from bisect import bisect_right
+from datetime import date
+
+ANY_CATEGORY = "*"
+DEFAULT_CHECK_INTERVAL = 1.0  # Seconds between checks of the rule file's modification time
+# calculate_discount()'s policy: a discount of 20% or more is applied as offered
+DEFAULT_RULES = [{"category": ANY_CATEGORY, "threshold": 20}]
+
+class RuleError(ValueError):
+    """Raised for rule tables that can't be compiled"""
+
+def _optional_number(rule, field):
+    value = rule.get(field)
+    return None if value in (None, "") else float(value)
+
+def _optional_date(rule, field):
+    value = rule.get(field)
+    return None if value in (None, "") else date.fromisoformat(str(value))
+
+def _segment(active):
+    """(thresholds, actions) of the rules active in one date segment"""
+    tiers = {}
+    for number in sorted(active):
+        threshold, percent, max_percent, _, _ = active[number]
+        tiers[threshold] = (percent, max_percent)  # A later rule with the same threshold wins
+    thresholds = sorted(tiers)
+    return thresholds, [tiers[threshold] for threshold in thresholds]
+
+def compile_rules(rules):
+    """
+    Compile rule dicts into {category: (date boundaries, [(thresholds, actions)] per segment)}
+    - Segment i covers the dates from boundary i-1 (inclusive) to boundary i (exclusive)
+    - An action is (fixed percent or None, cap or None)
+    - Segments are built in one sweep over the sorted starts and ends, so compiling
+      costs the size of its output rather than boundaries x rules
+    """
+    by_category = {}
+    for number, rule in enumerate(rules, 1):
+        try:
+            entry = (float(rule["threshold"]), _optional_number(rule, "percent"),
+                     _optional_number(rule, "max_percent"),
+                     _optional_date(rule, "start"), _optional_date(rule, "end"))
+        except (KeyError, TypeError, ValueError) as e:
+            raise RuleError(f"Rule {number} is invalid: {e!r}") from None
+        if entry[3] and entry[4] and entry[3] >= entry[4]:
+            raise RuleError(f"Rule {number} ends before it starts")
+        by_category.setdefault(str(rule.get("category") or ANY_CATEGORY), []).append(entry)
+    
+    compiled = {}
+    for category, entries in by_category.items():
+        # Sweep the starts and ends in date order, keeping the rules active in between
+        starts, ends = {}, {}
+        active = {}  # Rule number -> entry
+        for number, entry in enumerate(entries):
+            if entry[3] is None:
+                active[number] = entry
+            else:
+                starts.setdefault(entry[3], []).append(number)
+            if entry[4] is not None:
+                ends.setdefault(entry[4], []).append(number)
+        boundaries = sorted(starts.keys() | ends.keys())
+        segments = [_segment(active)]
+        for day in boundaries:
+            for number in ends.get(day, ()):
+                del active[number]
+            for number in starts.get(day, ()):
+                active[number] = entries[number]
+            segments.append(_segment(active))
+        compiled[category] = (boundaries, segments)
+    return compiled
+
+def load_rules(path):
+    """Rule dicts from a .json file (a list of objects) or a .csv file (a header row of fields)"""
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        if path.lower().endswith(".csv"):
+            return list(csv.DictReader(file))
+        rules = json.load(file)
+    if not isinstance(rules, list):
+        raise RuleError(f"{path} should hold a list of rules")
+    return rules
+
+class CompiledRules:
+    """A compiled rule table; applied_percent() is the lookup"""
+    
+    def __init__(self, rules=DEFAULT_RULES):
+        self.rule_count = len(rules)
+        self.table = compile_rules(rules)
+        self.fallback = self.table.get(ANY_CATEGORY)
+    
+    def applied_percent(self, discount_percent, category=ANY_CATEGORY, on=None):
+        """The discount percentage the rules give for an offered discount (0 if none applies)"""
+        compiled = self.table.get(category, self.fallback)
+        if compiled is None:
+            return 0
+        boundaries, segments = compiled
+        if boundaries:
+            thresholds, actions = segments[bisect_right(boundaries, on or date.today())]
+        else:
+            thresholds, actions = segments[0]
+        tier = bisect_right(thresholds, discount_percent) - 1
+        if tier < 0:
+            return 0
+        percent, max_percent = actions[tier]
+        if percent is None:
+            percent = discount_percent if max_percent is None else min(discount_percent, max_percent)
+        return percent
+    
+    def final_price(self, price, discount_percent, category=ANY_CATEGORY, on=None):
+        """The price after the discount the rules give (same arithmetic as calculate_discount())"""
+        percent = self.applied_percent(discount_percent, category, on)
+        if percent:
+            return price - price * (percent / 100)
+        return price
+
+class RuleBook:
+    """
+    Rules loaded from a file and reloaded when the file changes
+    - The file's modification time is checked at most every check_interval seconds
+    - A file that fails to load keeps the previous rules (the error is kept in last_error)
+    """
+    
+    def __init__(self, path, check_interval=DEFAULT_CHECK_INTERVAL):
+        self.path = path
+        self.check_interval = check_interval
+        self.last_error = None
+        self.reloads = 0
+        self._mtime = os.stat(path).st_mtime_ns
+        self.rules = CompiledRules(load_rules(path))
+        self._next_check = time.monotonic() + check_interval
+    
+    def reload_if_changed(self):
+        """Reload the rules if the file changed; returns True if they were replaced"""
+        self._next_check = time.monotonic() + self.check_interval
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime == self._mtime:
+                return False
+            rules = CompiledRules(load_rules(self.path))
+        except (OSError, ValueError) as e:  # RuleError and JSON errors are ValueErrors
+            self.last_error = e
+            return False
+        self._mtime = mtime
+        self.rules = rules  # One assignment: lookups see the old table or the new one
+        self.last_error = None
+        self.reloads += 1
+        return True
+    
+    def _current(self):
+        if time.monotonic() >= self._next_check:
+            self.reload_if_changed()
+        return self.rules
+    
+    def applied_percent(self, discount_percent, category=ANY_CATEGORY, on=None):
+        """CompiledRules.applied_percent() with the current rules"""
+        return self._current().applied_percent(discount_percent, category, on)
+    
+    def final_price(self, price, discount_percent, category=ANY_CATEGORY, on=None):
+        """CompiledRules.final_price() with the current rules"""
+        return self._current().final_price(price, discount_percent, category, on)
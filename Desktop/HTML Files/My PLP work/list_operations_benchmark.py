@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the python-week2.py list workload at scale, across container types
+- The same operations as the exercise: append, insert at index 1, extend, pop from
+  the end, sort, index of a value - replayed at growing sizes in several mixes
+- Backends: list, array.array, collections.deque, a list kept sorted with bisect,
+  sorted_sequence.SortedSequence, and a NumPy array (skipped if NumPy isn't installed)
+- Every backend must end with the same contents and find the same indexes; the
+  fastest one at the largest size is recommended for each mix
+"""
+
+import argparse
+import random
+import time
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+
+from sorted_sequence import SortedSequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False  # The NumPy backend is left out
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+# The exercise itself, for the small-size check
+EXERCISE = [("append", 10), ("append", 20), ("append", 30), ("append", 40), ("insert", 15),
+            ("extend", [50, 60, 70]), ("pop", None), ("sort", None), ("index", 30)]
+EXERCISE_RESULT = ([10, 15, 20, 30, 40, 50, 60], [3])
+
+class ListBackend:
+    """Plain list: what the exercise uses"""
+    name = "list"
+    
+    def __init__(self):
+        self.items = []
+    
+    def append(self, value):
+        self.items.append(value)
+    
+    def insert(self, value):
+        self.items.insert(1, value)
+    
+    def extend(self, values):
+        self.items.extend(values)
+    
+    def pop(self):
+        return self.items.pop()
+    
+    def sort(self):
+        self.items.sort()
+    
+    def index(self, value):
+        return self.items.index(value)
+    
+    def to_list(self):
+        return list(self.items)
+
+class ArrayBackend(ListBackend):
+    """array.array of 64-bit integers: compact, but every operation is still a list's"""
+    name = "array"
+    
+    def __init__(self):
+        self.items = array("q")
+    
+    def sort(self):
+        self.items = array("q", sorted(self.items))
+
+class DequeBackend(ListBackend):
+    """collections.deque: inserting near either end is cheap, sorting means rebuilding"""
+    name = "deque"
+    
+    def __init__(self):
+        self.items = deque()
+    
+    def sort(self):
+        self.items = deque(sorted(self.items))
+
+class SortedBackend(ListBackend):
+    """
+    A list kept sorted with bisect
+    - Every insert goes where it belongs, so sort() has nothing to do and index() is a bisect
+    - Positions from insert(1, ...) aren't kept; the exercise sorts afterwards anyway
+    """
+    name = "sorted"
+    
+    def append(self, value):
+        insort(self.items, value)
+    
+    def insert(self, value):
+        insort(self.items, value)
+    
+    def extend(self, values):
+        self.items.extend(values)
+        self.items.sort()  # Timsort keeps the sorted run: only the new values are sorted, then merged
+    
+    def sort(self):
+        pass
+    
+    def index(self, value):
+        position = bisect_left(self.items, value)
+        if position == len(self.items) or self.items[position] != value:
+            raise ValueError(f"{value} is not in list")
+        return position
+
+class ChunkedBackend(SortedBackend):
+    """SortedSequence: sorted chunks, so an insert shifts one chunk instead of the whole list"""
+    name = "chunked"
+    
+    def __init__(self):
+        self.items = SortedSequence()
+    
+    def append(self, value):
+        self.items.add(value)
+    
+    def insert(self, value):
+        self.items.add(value)
+    
+    def extend(self, values):
+        self.items.extend(values)
+    
+    def index(self, value):
+        return self.items.index(value)
+
+class NumpyBackend:
+    """NumPy int64 array with spare capacity, so appends are amortised O(1)"""
+    name = "numpy"
+    
+    def __init__(self):
+        self.data = np.empty(16, dtype=np.int64)
+        self.size = 0
+    
+    def _reserve(self, extra):
+        if self.size + extra > len(self.data):
+            grown = np.empty(max(2 * len(self.data), self.size + extra), dtype=np.int64)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+    
+    def append(self, value):
+        self._reserve(1)
+        self.data[self.size] = value
+        self.size += 1
+    
+    def insert(self, value):
+        self._reserve(1)
+        self.data[2:self.size + 1] = self.data[1:self.size].copy()
+        self.data[1] = value
+        self.size += 1
+    
+    def extend(self, values):
+        values = np.asarray(values, dtype=np.int64)
+        self._reserve(len(values))
+        self.data[self.size:self.size + len(values)] = values
+        self.size += len(values)
+    
+    def pop(self):
+        self.size -= 1
+        return int(self.data[self.size])
+    
+    def sort(self):
+        self.data[:self.size].sort()
+    
+    def index(self, value):
+        matches = np.flatnonzero(self.data[:self.size] == value)
+        if not len(matches):
+            raise ValueError(f"{value} is not in list")
+        return int(matches[0])
+    
+    def to_list(self):
+        return self.data[:self.size].tolist()
+
+BACKENDS = [ListBackend, ArrayBackend, DequeBackend, SortedBackend, ChunkedBackend] + ([NumpyBackend] if NUMPY_AVAILABLE else [])
+
+def make_workload(mix, size, rng):
+    """The (operation, argument) sequence of a mix at a size"""
+    values = [rng.randrange(10 * size) for _ in range(2 * size)]
+    operations = [("append", value) for value in values[:size]]
+    if mix == "exercise":
+        # The exercise's shape: appends, a few middle inserts, one extend, pops, sort, lookups
+        operations += [("insert", value) for value in values[size:size + size // 100]]
+        # Like [50, 60, 70]: the extension is larger than everything else and in order,
+        # so popping the last element also pops the largest (which keeps the sorted backend comparable)
+        operations.append(("extend", list(range(10 * size, 10 * size + size // 2))))
+        operations += [("pop", None)] * (size // 100)
+        operations.append(("sort", None))
+        operations += [("index", value) for value in rng.sample(values[:size], size // 100)]
+    elif mix == "insert-heavy":
+        operations += [("insert", value) for value in values[size:size + size // 10]]
+        operations.append(("sort", None))
+        operations += [("index", value) for value in rng.sample(values[:size], 10)]
+    elif mix == "lookup-heavy":
+        operations.append(("sort", None))
+        operations += [("index", value) for value in rng.sample(values[:size], size // 10)]
+    elif mix == "batched":
+        # New data arrives in batches, and the list is sorted and searched after each one
+        batch = size // 10
+        for start in range(size, 2 * size, batch):
+            operations.append(("extend", values[start:start + batch]))
+            operations.append(("sort", None))
+            operations += [("index", value) for value in rng.sample(values[:start], 10)]
+    return operations
+
+MIXES = ["exercise", "insert-heavy", "lookup-heavy", "batched"]
+
+def replay(backend_class, operations):
+    """Run the operations on a new backend: (seconds, final contents, indexes found)"""
+    backend = backend_class()
+    indexes = []
+    start = time.perf_counter()
+    for operation, argument in operations:
+        if operation == "index":
+            indexes.append(backend.index(argument))
+        elif operation in ("pop", "sort"):
+            getattr(backend, operation)()
+        else:
+            getattr(backend, operation)(argument)
+    seconds = time.perf_counter() - start
+    return seconds, backend.to_list(), indexes
+
+def main():
+    """Replay every mix at every size on every backend"""
+    parser = argparse.ArgumentParser(description="Benchmark the list-operations workload across container types")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="elements per run")
+    parser.add_argument("--mixes", nargs="+", choices=MIXES, default=MIXES, help="operation mixes")
+    args = parser.parse_args()
+    rng = random.Random(42)
+    
+    print("📋 LIST OPERATIONS BENCHMARK")
+    print("=" * 60)
+    ok = all(replay(backend, EXERCISE)[1:] == EXERCISE_RESULT for backend in BACKENDS)
+    print("exercise from python-week2.py: " + ("same result on every backend" if ok else "backends DIFFER"))
+    
+    recommendations = {}
+    for mix in args.mixes:
+        print(f"\n{mix}")
+        print(f"{'size':>10}" + "".join(f"{backend.name:>11}" for backend in BACKENDS))
+        for size in args.sizes:
+            operations = make_workload(mix, size, rng)
+            results = [replay(backend, operations) for backend in BACKENDS]
+            ok &= all(result[1:] == results[0][1:] for result in results)
+            print(f"{size:>10,}" + "".join(f"{seconds * 1e3:>9.1f}ms" for seconds, _, _ in results))
+        best = min(range(len(BACKENDS)), key=lambda index: results[index][0])
+        recommendations[mix] = BACKENDS[best].name
+    
+    print("\nRecommended backend (fastest at the largest size):")
+    for mix, name in recommendations.items():
+        print(f"  {mix:<14} {name}")
+    print("✅ Every backend gave the same contents and indexes" if ok else "❌ Results differ!")
+
+if __name__ == "__main__":
+    main()
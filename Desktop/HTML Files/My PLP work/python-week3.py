@@ -1,3 +1,56 @@
+"""
+Discount calculator
+- calculate_discount() prices one item; it is the reference every other path must match
+- calculate_discounts() prices whole NumPy arrays at once with the same rule
+- price_csv_file() and price_column_files() stream catalogs of millions of rows
+  through calculate_discounts() chunk by chunk, writing results as they go
+- calculate_discount_cents() and calculate_discounts_cents() are the exact mode:
+  integer cents and basis points (1/100 of a percent) with an explicit rounding rule,
+  so totals over millions of items don't drift the way binary floats do
+- stream_prices() prices line-delimited "price,discount" records from a stream,
+  sending invalid rows to a reject stream instead of stopping
+- main() is the interactive one-item calculator; cli() adds the --stream mode:
+    python python-week3.py --stream < items.csv > priced.csv 2> rejects.tsv
+  The run's summary goes to stderr too, as a last line starting with "#" (reject
+  lines start with their line number, so readers of rejects.tsv can skip it)
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from decimal import ROUND_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP, Decimal
+from itertools import islice
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False  # Batch pricing falls back to calculate_discount() row by row
+
+DISCOUNT_THRESHOLD = 20  # Discounts below this percentage are not applied
+DEFAULT_CHUNK_ROWS = 250_000  # Rows priced per chunk when streaming a file
+PRICE_COLUMN = "price"
+DISCOUNT_COLUMN = "discount_percent"
+
+# Exact mode: prices in integer cents, discounts in integer basis points (2000 = 20%)
+CENTS_PER_UNIT = 100
+BASIS_POINTS_PER_PERCENT = 100
+BASIS_POINTS_PER_WHOLE = 100 * BASIS_POINTS_PER_PERCENT
+DISCOUNT_THRESHOLD_BP = DISCOUNT_THRESHOLD * BASIS_POINTS_PER_PERCENT
+# Rounding of the discount amount to whole cents (the same names as the decimal module's)
+ROUNDING_MODES = (ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_DOWN, ROUND_UP)
+DEFAULT_ROUNDING = ROUND_HALF_EVEN  # Banker's rounding: no bias up or down over many items
+MAX_EXACT_CENTS = (2 ** 63 - 1) // BASIS_POINTS_PER_WHOLE  # Largest price the int64 batch path can take
+
+DEFAULT_STREAM_CHUNK = 10_000  # Lines read, priced and written at a time in --stream mode
+OUTPUT_BUFFER = 1024 * 1024  # Bytes buffered before streamed output is written
+DISCOUNT_OVER_100 = "discount cannot be more than 100%"  # Invalid in every --stream mode
+
+
 def calculate_discount(price, discount_percent):
     """
     Calculate the final price after applying a discount.
@@ -9,7 +62,7 @@ def calculate_discount(price, discount_percent):
     Returns:
         float: The final price after discount (if applicable) or original price
     """
-    if discount_percent >= 20:
+    if discount_percent >= DISCOUNT_THRESHOLD:
         # Apply discount if it's 20% or higher
         discount_amount = price * (discount_percent / 100)
         final_price = price - discount_amount
@@ -19,6 +72,337 @@ def calculate_discount(price, discount_percent):
         return price
 
 
+def calculate_discounts(prices, discount_percents):
+    """
+    Calculate the final prices of many items at once.
+    
+    Same rule and the same float arithmetic as calculate_discount(), applied with a
+    vectorized mask, so every result is identical to the scalar function's.
+    
+    Args:
+        prices (array-like): The original prices
+        discount_percents (array-like): The discount percentage for each price
+    
+    Returns:
+        numpy.ndarray: The final prices (a list if NumPy isn't installed)
+    """
+    if not NUMPY_AVAILABLE:
+        return [calculate_discount(price, discount) for price, discount in zip(prices, discount_percents)]
+    prices = np.asarray(prices, dtype=np.float64)
+    discount_percents = np.asarray(discount_percents, dtype=np.float64)
+    if prices.shape != discount_percents.shape:
+        raise ValueError(f"Got {prices.shape} prices but {discount_percents.shape} discounts")
+    
+    final_prices = prices.copy()
+    discounted = discount_percents >= DISCOUNT_THRESHOLD
+    discounted_prices = prices[discounted]
+    final_prices[discounted] = discounted_prices - discounted_prices * (discount_percents[discounted] / 100)
+    return final_prices
+
+
+def _format_prices(final_prices):
+    """Final prices as text with two decimals (the way main() shows them, without separators)"""
+    if NUMPY_AVAILABLE:
+        final_prices = final_prices.tolist()  # Formatting Python floats beats np.char.mod()
+    return ["%.2f" % price for price in final_prices]
+
+
+def price_csv_file(input_path, output_path, chunk_rows=DEFAULT_CHUNK_ROWS,
+                   price_column=PRICE_COLUMN, discount_column=DISCOUNT_COLUMN):
+    """
+    Price every row of a CSV file, streaming it in chunks.
+    
+    The output is the input with a final_price column added. Only one chunk is in
+    memory at a time, so the file can be far bigger than memory. Values are split on
+    commas (no quoted fields).
+    
+    Args:
+        input_path (str): CSV file with a header row naming the price and discount columns
+        output_path (str): Where to write the priced CSV
+        chunk_rows (int): Rows read, priced and written at a time
+    
+    Returns:
+        int: The number of rows priced
+    """
+    rows = 0
+    with open(input_path, 'r', encoding='utf-8', newline='') as source, \
+         open(output_path, 'w', encoding='utf-8', newline='') as target:
+        header = source.readline().rstrip("\r\n")
+        columns = header.split(",")
+        try:
+            price_index, discount_index = columns.index(price_column), columns.index(discount_column)
+        except ValueError:
+            raise ValueError(f"{input_path} needs {price_column!r} and {discount_column!r} columns") from None
+        target.write(header + ",final_price\n")
+        
+        while True:
+            lines = [line.rstrip("\r\n") for line in islice(source, chunk_rows)]
+            if not lines:
+                break
+            # One split for the whole chunk; column k is then every len(columns)-th field from k
+            commas = len(columns) - 1
+            for number, line in enumerate(lines, rows + 2):
+                if line.count(",") != commas:
+                    raise ValueError(f"{input_path} line {number} doesn't have {len(columns)} columns")
+            fields = ",".join(lines).split(",")
+            final_prices = calculate_discounts([float(value) for value in fields[price_index::len(columns)]],
+                                               [float(value) for value in fields[discount_index::len(columns)]])
+            target.write("".join(f"{line},{price}\n" for line, price in zip(lines, _format_prices(final_prices))))
+            rows += len(lines)
+    return rows
+
+
+def price_column_files(directory, chunk_rows=DEFAULT_CHUNK_ROWS,
+                       price_column=PRICE_COLUMN, discount_column=DISCOUNT_COLUMN):
+    """
+    Price a columnar catalog: one .npy file per column, memory-mapped and priced in chunks.
+    
+    Reads <price_column>.npy and <discount_column>.npy from the directory and writes
+    final_price.npy next to them, one chunk at a time.
+    
+    Returns:
+        int: The number of rows priced
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("Columnar files need NumPy: pip install numpy")
+    prices = np.load(f"{directory}/{price_column}.npy", mmap_mode="r")
+    discount_percents = np.load(f"{directory}/{discount_column}.npy", mmap_mode="r")
+    if prices.shape != discount_percents.shape:
+        raise ValueError(f"{directory} has {len(prices)} prices but {len(discount_percents)} discounts")
+    
+    final_prices = np.lib.format.open_memmap(f"{directory}/final_price.npy", mode="w+",
+                                             dtype=np.float64, shape=prices.shape)
+    for start in range(0, len(prices), chunk_rows):
+        stop = start + chunk_rows
+        final_prices[start:stop] = calculate_discounts(prices[start:stop], discount_percents[start:stop])
+    final_prices.flush()
+    return len(prices)
+
+
+def check_batch_pricing(rows=100_000, seed=42):
+    """
+    Check that the batch paths match calculate_discount() exactly.
+    
+    Prices random items plus the edge cases around the 20% threshold with
+    calculate_discounts(), price_csv_file() and (with NumPy) price_column_files(), in
+    chunks that don't divide the rows evenly. Returns the number of rows whose results
+    differ (0 means every batch path is exact). Without NumPy this checks the fallback.
+    """
+    rng = random.Random(seed)
+    prices = [round(rng.uniform(0, 100_000), 2) for _ in range(rows)]
+    discounts = [rng.choice([0, 10, 19.99, 20, 20.01, 25, 50, 100, round(rng.uniform(0, 100), 2)])
+                 for _ in range(rows)]
+    expected = [calculate_discount(price, discount) for price, discount in zip(prices, discounts)]
+    batch = list(calculate_discounts(prices, discounts))
+    mismatches = sum(1 for final, reference in zip(batch, expected) if final != reference)
+    mismatches += abs(len(batch) - rows)
+    
+    chunk_rows = max(1, rows // 7)
+    with tempfile.TemporaryDirectory() as directory:
+        csv_in, csv_out = os.path.join(directory, "catalog.csv"), os.path.join(directory, "priced.csv")
+        with open(csv_in, 'w', encoding='utf-8') as file:
+            file.write(f"sku,{PRICE_COLUMN},{DISCOUNT_COLUMN}\n")
+            file.writelines(f"SKU{row},{price!r},{discount!r}\n"
+                            for row, (price, discount) in enumerate(zip(prices, discounts)))
+        price_csv_file(csv_in, csv_out, chunk_rows)
+        with open(csv_out, 'r', encoding='utf-8') as file:
+            next(file)
+            priced = [line.rstrip("\n").rsplit(",", 1)[1] for line in file]
+        mismatches += sum(1 for final, reference in zip(priced, expected) if final != "%.2f" % reference)
+        mismatches += abs(len(priced) - rows)
+        
+        if NUMPY_AVAILABLE:
+            np.save(os.path.join(directory, f"{PRICE_COLUMN}.npy"), np.array(prices, dtype=np.float64))
+            np.save(os.path.join(directory, f"{DISCOUNT_COLUMN}.npy"), np.array(discounts, dtype=np.float64))
+            price_column_files(directory, chunk_rows)
+            columns = np.load(os.path.join(directory, "final_price.npy")).tolist()
+            mismatches += sum(1 for final, reference in zip(columns, expected) if final != reference)
+            mismatches += abs(len(columns) - rows)
+    return mismatches
+
+
+def parse_fixed(text, places):
+    """
+    Parse a decimal number written as text into an integer with the given decimal places.
+    
+    parse_fixed("1234.5", 2) == 123450. No floats are involved, so nothing is lost; more
+    decimals than places is an error rather than a silent rounding.
+    """
+    text = text.strip()
+    sign = -1 if text.startswith("-") else 1
+    digits = text[1:] if text[:1] in ("+", "-") else text  # At most one sign
+    whole, _, fraction = digits.partition(".")
+    if not (whole or fraction) or not (whole or "0").isdigit() or not (fraction or "0").isdigit():
+        raise ValueError(f"{text!r} is not a number")
+    if len(fraction) > places:
+        if fraction[places:].strip("0"):
+            raise ValueError(f"{text!r} has more than {places} decimal places")
+        fraction = fraction[:places]
+    return sign * int((whole or "0") + fraction.ljust(places, "0"))
+
+
+def parse_cents(text):
+    """A price like "1,234.50" as integer cents (123450)"""
+    return parse_fixed(text.replace(",", ""), 2)
+
+
+def parse_basis_points(text):
+    """A discount percentage like "12.5" as integer basis points (1250)"""
+    return parse_fixed(text, 2)
+
+
+def format_cents(cents):
+    """Integer cents as text with thousands separators ("1,234.50"), like main() shows prices"""
+    sign = "-" if cents < 0 else ""
+    units, cents = divmod(abs(cents), CENTS_PER_UNIT)
+    return f"{sign}{units:,}.{cents:02d}"
+
+
+def _divide_rounded(numerator, denominator, rounding):
+    """numerator / denominator rounded to an integer (both non-negative)"""
+    quotient, remainder = divmod(numerator, denominator)
+    if rounding == ROUND_HALF_EVEN:
+        twice = 2 * remainder
+        return quotient + (twice > denominator or (twice == denominator and quotient % 2 == 1))
+    if rounding == ROUND_HALF_UP:
+        return quotient + (2 * remainder >= denominator)
+    if rounding == ROUND_DOWN:
+        return quotient
+    if rounding == ROUND_UP:
+        return quotient + (remainder > 0)
+    raise ValueError(f"Unknown rounding {rounding!r}; use one of {', '.join(ROUNDING_MODES)}")
+
+
+def _check_exact_options(rounding):
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Unknown rounding {rounding!r}; use one of {', '.join(ROUNDING_MODES)}")
+
+
+def calculate_discount_cents(price_cents, discount_bp, rounding=DEFAULT_ROUNDING):
+    """
+    Calculate the final price exactly, in integer cents.
+    
+    Same rule as calculate_discount(): the discount is applied if it's 20% (2000 basis
+    points) or higher. The discount amount is rounded to whole cents with the given
+    rounding rule, then taken off the price, so the result is always exact.
+    
+    Args:
+        price_cents (int): The original price in cents (not negative)
+        discount_bp (int): The discount in basis points (0 to 10000)
+        rounding (str): How the discount amount is rounded (decimal.ROUND_* names)
+    
+    Returns:
+        int: The final price in cents
+    """
+    _check_exact_options(rounding)
+    if price_cents < 0 or discount_bp < 0:
+        raise ValueError("Prices and discounts can't be negative")
+    if discount_bp > BASIS_POINTS_PER_WHOLE:
+        raise ValueError("Discounts can't be more than 100%")
+    if discount_bp >= DISCOUNT_THRESHOLD_BP:
+        discount_cents = _divide_rounded(price_cents * discount_bp, BASIS_POINTS_PER_WHOLE, rounding)
+        return price_cents - discount_cents
+    return price_cents
+
+
+def calculate_discounts_cents(prices_cents, discounts_bp, rounding=DEFAULT_ROUNDING):
+    """
+    calculate_discount_cents() for whole arrays, with integer NumPy arithmetic.
+    
+    Gives exactly the scalar function's results, and refuses the same inputs with the
+    same ValueErrors. Prices above MAX_EXACT_CENTS are also refused (OverflowError),
+    because price * basis points would overflow 64-bit integers.
+    
+    Returns:
+        numpy.ndarray: int64 final prices in cents (a list if NumPy isn't installed)
+    """
+    if not NUMPY_AVAILABLE:
+        return [calculate_discount_cents(price, discount, rounding)
+                for price, discount in zip(prices_cents, discounts_bp)]
+    _check_exact_options(rounding)
+    prices = np.asarray(prices_cents, dtype=np.int64)
+    discounts = np.asarray(discounts_bp, dtype=np.int64)
+    if prices.shape != discounts.shape:
+        raise ValueError(f"Got {prices.shape} prices but {discounts.shape} discounts")
+    if prices.size and (prices.min() < 0 or discounts.min() < 0):
+        raise ValueError("Prices and discounts can't be negative")
+    if prices.size and discounts.max() > BASIS_POINTS_PER_WHOLE:
+        raise ValueError("Discounts can't be more than 100%")
+    if prices.size and prices.max() > MAX_EXACT_CENTS:
+        raise OverflowError(f"Prices above {MAX_EXACT_CENTS} cents are too large for exact 64-bit arithmetic")
+    
+    final_prices = prices.copy()
+    discounted = discounts >= DISCOUNT_THRESHOLD_BP
+    discounted_prices = prices[discounted]
+    quotient, remainder = np.divmod(discounted_prices * discounts[discounted], BASIS_POINTS_PER_WHOLE)
+    if rounding == ROUND_HALF_EVEN:
+        twice = 2 * remainder
+        quotient += (twice > BASIS_POINTS_PER_WHOLE) | ((twice == BASIS_POINTS_PER_WHOLE) & (quotient % 2 == 1))
+    elif rounding == ROUND_HALF_UP:
+        quotient += 2 * remainder >= BASIS_POINTS_PER_WHOLE
+    elif rounding == ROUND_UP:
+        quotient += remainder > 0
+    final_prices[discounted] = discounted_prices - quotient
+    return final_prices
+
+
+def calculate_discount_decimal(price, discount_percent, rounding=DEFAULT_ROUNDING):
+    """The exact mode's rule with decimal.Decimal (slow; the reference for check_cents_exact())"""
+    if discount_percent >= DISCOUNT_THRESHOLD:
+        discount_amount = (price * discount_percent / 100).quantize(Decimal("0.01"), rounding=rounding)
+        return price - discount_amount
+    return price
+
+
+def _refuses(function, error, *args):
+    """Whether a call raises the given error"""
+    try:
+        function(*args)
+    except error:
+        return True
+    return False
+
+
+def check_cents_exact(rows=100_000, seed=42):
+    """
+    Check the exact mode against decimal.Decimal, for every rounding rule.
+    
+    Decimal is exact but slow; integer cents must give the very same final prices,
+    scalar and batch. Besides random rows this covers half-cent ties, the 100% boundary
+    and the largest price the batch path takes, and checks that both paths refuse the
+    same invalid inputs. Returns the number of mismatches (0 means exact).
+    """
+    rng = random.Random(seed)
+    prices = [rng.randrange(0, 10_000_000) for _ in range(rows)]
+    discounts = [rng.choice([0, 1999, 2000, 2001, 2500, 3333, 5000, 10000, rng.randrange(0, 10000)])
+                 for _ in range(rows)]
+    # Discount amounts of exactly half a cent (odd prices at 50%, 1.5 and 5.5 cents), whole prices
+    # given away, and the int64 limit of the batch path
+    edges = [(1, 5000), (3, 5000), (5, 3000), (25, 2200), (0, 10000), (12345, 10000), (12345, 9999),
+             (MAX_EXACT_CENTS, 10000), (MAX_EXACT_CENTS, 9999), (MAX_EXACT_CENTS, 2000), (MAX_EXACT_CENTS, 1999)]
+    edges += [(2 * rng.randrange(0, 5_000_000) + 1, 5000) for _ in range(max(1, rows // 10))]
+    prices += [price for price, _ in edges]
+    discounts += [discount for _, discount in edges]
+    
+    mismatches = 0
+    for rounding in ROUNDING_MODES:
+        batch = calculate_discounts_cents(prices, discounts, rounding)
+        for price, discount, final in zip(prices, discounts, batch):
+            expected = calculate_discount_decimal(Decimal(price) / 100, Decimal(discount) / 100, rounding)
+            scalar = calculate_discount_cents(price, discount, rounding)
+            if not scalar == final == int(expected * 100):
+                mismatches += 1
+    
+    # Both paths refuse the same inputs the same way
+    for price, discount, rounding in ((100, 10001, DEFAULT_ROUNDING), (-1, 2000, DEFAULT_ROUNDING),
+                                      (100, -1, DEFAULT_ROUNDING), (100, 0, "ROUND_SIDEWAYS")):
+        mismatches += not _refuses(calculate_discount_cents, ValueError, price, discount, rounding)
+        mismatches += not _refuses(calculate_discounts_cents, ValueError, [price], [discount], rounding)
+    if NUMPY_AVAILABLE:
+        mismatches += not _refuses(calculate_discounts_cents, OverflowError, [MAX_EXACT_CENTS + 1], [2000])
+    return mismatches
+
+
 def main():
     """Main function to handle user interaction"""
     try:
@@ -39,7 +423,7 @@ def main():
         final_price = calculate_discount(original_price, discount_percentage)
         
         # Display results
-        if discount_percentage >= 20:
+        if discount_percentage >= DISCOUNT_THRESHOLD:
             print(f"\nDiscount applied: {discount_percentage}%")
             print(f"Original price: KES {original_price:,.2f}")
             print(f"Final price after discount: KES {final_price:,.2f}")
@@ -48,12 +432,149 @@ def main():
             print(f"\nNo discount applied (discount must be 20% or higher)")
             print(f"Original price: KES {original_price:,.2f}")
             print(f"Final price: KES {final_price:,.2f}")
-    
+            
     except ValueError:
         print("Error: Please enter valid numbers for price and discount percentage!")
     except Exception as e:
         print(f"An error occurred: {e}")
 
 
+def _number(text, what):
+    """A finite, non-negative float from a field (ValueError with the reason otherwise)"""
+    try:
+        value = float(text)
+    except ValueError:
+        raise ValueError(f"{what} is not a number") from None
+    if not math.isfinite(value):
+        raise ValueError(f"{what} is not a finite number")
+    if value < 0:
+        raise ValueError(f"{what} cannot be negative")
+    return value
+
+
+def _discount(text):
+    """A discount percentage field: a _number() from 0 to 100, like the exact mode allows"""
+    discount = _number(text, "discount")
+    if discount > 100:
+        raise ValueError(DISCOUNT_OVER_100)
+    return discount
+
+
+def _row_pricer(exact=False, rounding=DEFAULT_ROUNDING, rules=None):
+    """A function turning a row's fields into its final price as text (ValueError for invalid rows)"""
+    if exact:
+        def price_row(fields):
+            if len(fields) != 2:
+                raise ValueError("expected price,discount")
+            try:
+                price, discount = parse_cents(fields[0]), parse_basis_points(fields[1])
+            except ValueError as e:
+                raise ValueError(str(e).replace("'", "")) from None
+            if price < 0 or discount < 0:
+                raise ValueError("price and discount cannot be negative")
+            if discount > BASIS_POINTS_PER_WHOLE:
+                raise ValueError(DISCOUNT_OVER_100)
+            final = calculate_discount_cents(price, discount, rounding)
+            return f"{final // CENTS_PER_UNIT}.{final % CENTS_PER_UNIT:02d}"
+    elif rules is not None:
+        def price_row(fields):
+            if len(fields) not in (2, 3):
+                raise ValueError("expected price,discount[,category]")
+            price, discount = _number(fields[0], "price"), _discount(fields[1])
+            return "%.2f" % rules.final_price(price, discount, *fields[2:])
+    else:
+        def price_row(fields):
+            if len(fields) != 2:
+                raise ValueError("expected price,discount")
+            return "%.2f" % calculate_discount(_number(fields[0], "price"), _discount(fields[1]))
+    return price_row
+
+
+def stream_prices(source, target, rejects, exact=False, rounding=DEFAULT_ROUNDING, rules=None,
+                  chunk_rows=DEFAULT_STREAM_CHUNK):
+    """
+    Price line-delimited records from one stream to another.
+    
+    Each input line is "price,discount" (plus ",category" with a rules engine); each
+    output line is the input line with the final price added. Invalid rows don't stop
+    the run: they go to the reject stream as "line number<TAB>reason<TAB>line".
+    Blank lines are skipped. Output is written a chunk at a time.
+    
+    Args:
+        source, target, rejects: Text streams to read from and write to
+        exact (bool): Use integer cents (calculate_discount_cents()) instead of floats
+        rules: A discount_rules.CompiledRules or RuleBook to use instead of the 20% rule
+    
+    Returns:
+        tuple: (rows priced, rows rejected)
+    """
+    price_row = _row_pricer(exact, rounding, rules)
+    priced = rejected = 0
+    number = 0
+    while True:
+        lines = list(islice(source, chunk_rows))
+        if not lines:
+            break
+        output = []
+        for line in lines:
+            number += 1
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                output.append(f"{text},{price_row([field.strip() for field in text.split(',')])}\n")
+            except ValueError as e:
+                rejected += 1
+                rejects.write(f"{number}\t{e}\t{text}\n")
+        priced += len(output)
+        target.write("".join(output))
+    return priced, rejected
+
+
+def cli(argv=None):
+    """Command line: the interactive calculator, or --stream for pipelines"""
+    parser = argparse.ArgumentParser(description="Discount calculator (interactive unless --stream is given)")
+    parser.add_argument("--stream", action="store_true",
+                        help="price 'price,discount' lines from stdin to stdout; invalid rows go to stderr")
+    parser.add_argument("--exact", action="store_true", help="exact integer-cents arithmetic")
+    parser.add_argument("--rounding", choices=ROUNDING_MODES, default=DEFAULT_ROUNDING,
+                        help="how --exact rounds discount amounts to cents")
+    parser.add_argument("--rules", help="discount rules file (see discount_rules.py), hot-reloaded")
+    parser.add_argument("--rejects", help="write rejected rows to this file instead of stderr")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_STREAM_CHUNK, help="lines per chunk")
+    args = parser.parse_args(argv)
+    
+    if not args.stream:
+        main()
+        return
+    if args.exact and args.rules:
+        parser.error("--exact and --rules can't be combined")
+    rules = None
+    if args.rules:
+        from discount_rules import RuleBook
+        rules = RuleBook(args.rules)
+    
+    target = open(sys.stdout.fileno(), 'w', encoding='utf-8', buffering=OUTPUT_BUFFER, closefd=False)
+    rejects = open(args.rejects, 'w', encoding='utf-8') if args.rejects else sys.stderr
+    start = time.perf_counter()
+    try:
+        try:
+            priced, rejected = stream_prices(sys.stdin, target, rejects, args.exact, args.rounding, rules,
+                                             args.chunk_rows)
+        finally:
+            if args.rejects:
+                rejects.close()
+        target.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. "| head"): stop quietly like other filters. Unwritten
+        # output goes to devnull so flushing it at exit can't raise the same error again.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
+    seconds = time.perf_counter() - start
+    rate = (priced + rejected) / seconds if seconds > 0 else 0
+    print(f"# Priced {priced:,} rows, rejected {rejected:,} in {seconds:.2f}s ({rate:,.0f} rows/s)",
+          file=sys.stderr)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    cli()
\ No newline at end of file
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+SortedSequence: a list that is always sorted
+- For the python-week2.py pattern (insert, sort, then index) at scale: values go
+  straight to their place, so there is never a full sort, and index() is a search
+  instead of a linear scan
+- Values live in chunks of about DEFAULT_LOAD sorted values; a list of each chunk's
+  largest value finds the chunk with one bisect, and a second bisect finds the place
+  in the chunk (an insert shifts at most one chunk, not the whole sequence)
+- A Fenwick tree over the chunk lengths turns positions into (chunk, offset) and back
+  in O(log n), for index(), rank and seq[i]
+- extend() merges sorted runs instead of sorting everything again
+- The list methods still work: append() and insert() add the value where it belongs
+  (the position given to insert() is ignored), sort() has nothing left to do
+
+Run this file to check it against a plain list and the exercise's expected output;
+it exits with status 1 if anything differs.
+"""
+
+import argparse
+import random
+import sys
+import time
+from bisect import bisect_left, bisect_right, insort
+from heapq import merge
+from itertools import chain
+
+DEFAULT_LOAD = 1000  # Values per chunk; chunks split at twice this
+
+class SortedSequence:
+    """A sorted sequence of comparable values with list-like access"""
+    
+    def __init__(self, iterable=(), load=DEFAULT_LOAD):
+        self._load = load
+        self._chunks = []  # Sorted lists of values, in order
+        self._maxes = []  # Largest value of each chunk
+        self._len = 0
+        self._tree = None  # Fenwick tree of chunk lengths (None when it has to be rebuilt)
+        self.extend(iterable)
+    
+    # Fenwick tree over chunk lengths
+    def _build_tree(self):
+        tree = [0] + [len(chunk) for chunk in self._chunks]
+        for node in range(1, len(tree)):
+            parent = node + (node & -node)
+            if parent < len(tree):
+                tree[parent] += tree[node]
+        self._tree = tree
+        return tree
+    
+    def _tree_add(self, chunk, delta):
+        tree = self._tree
+        if tree is None:
+            return  # Rebuilt from the chunks when next needed
+        node = chunk + 1
+        while node < len(tree):
+            tree[node] += delta
+            node += node & -node
+    
+    def _offset_of(self, chunk):
+        """Number of values in the chunks before a chunk"""
+        tree = self._tree or self._build_tree()
+        total = 0
+        node = chunk
+        while node:
+            total += tree[node]
+            node -= node & -node
+        return total
+    
+    def _locate(self, index):
+        """(chunk, offset in the chunk) of a position (0 <= index < len)"""
+        tree = self._tree or self._build_tree()
+        node = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            child = node + step
+            if child < len(tree) and tree[child] <= index:
+                node = child
+                index -= tree[child]
+            step >>= 1
+        return node, index
+    
+    def _position(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedSequence index out of range")
+        return index
+    
+    # Adding values
+    def add(self, value):
+        """Add a value where it belongs"""
+        chunks, maxes = self._chunks, self._maxes
+        if not chunks:
+            chunks.append([value])
+            maxes.append(value)
+            self._tree = None
+        else:
+            chunk = bisect_right(maxes, value)
+            if chunk == len(maxes):
+                chunk -= 1
+                chunks[chunk].append(value)
+                maxes[chunk] = value
+            else:
+                insort(chunks[chunk], value)
+            self._tree_add(chunk, 1)
+            if len(chunks[chunk]) > 2 * self._load:
+                self._split(chunk)
+        self._len += 1
+    
+    def _split(self, chunk):
+        values = self._chunks[chunk]
+        half = len(values) // 2
+        self._chunks[chunk:chunk + 1] = [values[:half], values[half:]]
+        self._maxes[chunk:chunk + 1] = [values[half - 1], values[-1]]
+        self._tree = None
+    
+    def append(self, value):
+        """list.append(): the value goes where it belongs, not at the end"""
+        self.add(value)
+    
+    def insert(self, index, value):
+        """list.insert(): the value goes where it belongs; the index is ignored"""
+        self.add(value)
+    
+    def extend(self, values):
+        """Add many values, merging them in as one sorted run"""
+        values = sorted(values)
+        if not values:
+            return
+        if self._len and len(values) * 16 < self._len:
+            for value in values:  # A few values: cheaper to place them one by one
+                self.add(value)
+            return
+        merged = list(merge(chain.from_iterable(self._chunks), values)) if self._len else values
+        load = self._load
+        self._chunks = [merged[start:start + load] for start in range(0, len(merged), load)]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        self._len = len(merged)
+        self._tree = None
+    
+    def sort(self, key=None, reverse=False):
+        """list.sort(): already sorted, so there is nothing to do"""
+        if key is not None or reverse:
+            raise ValueError("A SortedSequence is always in ascending order")
+    
+    # Removing values
+    def _delete(self, chunk, offset):
+        values = self._chunks[chunk]
+        value = values.pop(offset)
+        self._len -= 1
+        if not values:
+            del self._chunks[chunk]
+            del self._maxes[chunk]
+            self._tree = None
+        else:
+            self._maxes[chunk] = values[-1]
+            self._tree_add(chunk, -1)
+        return value
+    
+    def pop(self, index=-1):
+        """Remove and return the value at a position (the largest by default; pop(0) is the smallest)"""
+        if not self._len:
+            raise IndexError("pop from empty SortedSequence")
+        if index == -1:
+            return self._delete(len(self._chunks) - 1, len(self._chunks[-1]) - 1)
+        if index == 0:
+            return self._delete(0, 0)
+        return self._delete(*self._locate(self._position(index)))
+    
+    def remove(self, value):
+        """Remove one occurrence of a value (ValueError if it isn't there)"""
+        chunk = bisect_left(self._maxes, value)
+        if chunk < len(self._maxes):
+            offset = bisect_left(self._chunks[chunk], value)
+            if self._chunks[chunk][offset] == value:
+                self._delete(chunk, offset)
+                return
+        raise ValueError(f"{value!r} is not in SortedSequence")
+    
+    def discard(self, value):
+        """Remove one occurrence of a value if there is one"""
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+    
+    def clear(self):
+        """Remove every value"""
+        self._chunks, self._maxes, self._len, self._tree = [], [], 0, None
+    
+    # Ranks and lookups
+    def bisect_left(self, value):
+        """Number of values smaller than value (its leftmost insertion position)"""
+        chunk = bisect_left(self._maxes, value)
+        if chunk == len(self._maxes):
+            return self._len
+        return self._offset_of(chunk) + bisect_left(self._chunks[chunk], value)
+    
+    def bisect_right(self, value):
+        """Number of values not larger than value (its rightmost insertion position)"""
+        chunk = bisect_right(self._maxes, value)
+        if chunk == len(self._maxes):
+            return self._len
+        return self._offset_of(chunk) + bisect_right(self._chunks[chunk], value)
+    
+    rank = bisect_left
+    
+    def index(self, value, start=0, stop=None):
+        """Position of the first occurrence of value at or after start (ValueError if none)"""
+        stop = self._len if stop is None else stop
+        if start < 0:
+            start = max(0, start + self._len)
+        if stop < 0:
+            stop += self._len
+        position = self.bisect_left(value)
+        if position < start:
+            position = start  # Sorted: if the value is at start, every position in between holds it too
+        if position < min(stop, self._len) and self[position] == value:
+            return position
+        raise ValueError(f"{value!r} is not in SortedSequence")
+    
+    def count(self, value):
+        """Number of occurrences of a value"""
+        return self.bisect_right(value) - self.bisect_left(value)
+    
+    def __contains__(self, value):
+        chunk = bisect_left(self._maxes, value)
+        if chunk == len(self._maxes):
+            return False
+        values = self._chunks[chunk]
+        return values[bisect_left(values, value)] == value
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index == 0 and self._len:
+            return self._chunks[0][0]
+        if index == -1 and self._len:
+            return self._chunks[-1][-1]
+        chunk, offset = self._locate(self._position(index))
+        return self._chunks[chunk][offset]
+    
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            kept = list(self)
+            del kept[index]
+            self.clear()
+            self.extend(kept)
+        else:
+            self.pop(index)
+    
+    # The rest of the sequence protocol
+    def __len__(self):
+        return self._len
+    
+    def __iter__(self):
+        return chain.from_iterable(self._chunks)
+    
+    def __reversed__(self):
+        return chain.from_iterable(reversed(chunk) for chunk in reversed(self._chunks))
+    
+    def __eq__(self, other):
+        if isinstance(other, (SortedSequence, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"SortedSequence({list(self)!r})"
+
+def run_exercise():
+    """The python-week2.py steps on a SortedSequence: (final values, index of 30)"""
+    my_list = SortedSequence()
+    for value in (10, 20, 30, 40):
+        my_list.append(value)
+    my_list.insert(1, 15)
+    my_list.extend([50, 60, 70])
+    my_list.pop()
+    my_list.sort()
+    return list(my_list), my_list.index(30)
+
+def check_against_list(operations=20_000, seed=42, load=8):
+    """
+    Run random operations on a SortedSequence and on a list kept sorted the plain way
+    - A small load makes chunks split and empty all the time
+    - Returns the number of operations whose results differ (0 means equivalent)
+    """
+    rng = random.Random(seed)
+    sequence, reference = SortedSequence(load=load), []
+    mismatches = 0
+    for _ in range(operations):
+        roll = rng.random()
+        value = rng.randrange(500)
+        if roll < 0.35:
+            sequence.add(value)
+            reference.append(value)
+            reference.sort()
+            results = None, None
+        elif roll < 0.4:
+            values = [rng.randrange(500) for _ in range(rng.randrange(0, 60))]
+            sequence.extend(values)
+            reference = sorted(reference + values)
+            results = None, None
+        elif roll < 0.55 and reference:
+            index = rng.choice([0, -1, rng.randrange(len(reference))])
+            results = sequence.pop(index), reference.pop(index)
+        elif roll < 0.65:
+            results = value in sequence, value in reference
+            if value in reference:
+                sequence.remove(value)
+                reference.remove(value)
+        elif roll < 0.8:
+            found = value in reference
+            results = (sequence.index(value) if found else None), (reference.index(value) if found else None)
+        elif roll < 0.9 and reference:
+            index = rng.randrange(-len(reference), len(reference))
+            results = sequence[index], reference[index]
+        else:
+            results = (sequence.count(value), sequence.bisect_right(value)), \
+                      (reference.count(value), bisect_right(reference, value))
+        if results[0] != results[1]:
+            mismatches += 1
+    if list(sequence) != reference or len(sequence) != len(reference):
+        mismatches += 1
+    return mismatches
+
+def main():
+    """Check the exercise and the random equivalence, then time the insert/sort/index pattern"""
+    parser = argparse.ArgumentParser(description="Check and time SortedSequence")
+    parser.add_argument("--size", type=int, default=200_000, help="values added in the timing run")
+    args = parser.parse_args()
+    
+    print("📋 SORTED SEQUENCE")
+    print("=" * 60)
+    final, index_of_30 = run_exercise()
+    print(f"python-week2.py steps: {final}, index of 30: {index_of_30}")
+    ok = final == [10, 15, 20, 30, 40, 50, 60] and index_of_30 == 3
+    for load in (1, 2, 8):  # Tiny chunks split and empty on almost every operation
+        ok &= check_against_list(load=load) == 0
+    
+    rng = random.Random(7)
+    values = [rng.randrange(10 * args.size) for _ in range(args.size)]
+    lookups = rng.sample(values, 1000)
+    start = time.perf_counter()
+    plain = []
+    for value in values:
+        plain.insert(1, value)
+    plain.sort()
+    expected = [plain.index(value) for value in lookups]
+    plain_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    sequence = SortedSequence()
+    for value in values:
+        sequence.insert(1, value)
+    found = [sequence.index(value) for value in lookups]
+    sequence_seconds = time.perf_counter() - start
+    print(f"insert {args.size:,} values, then 1,000 index() lookups:")
+    print(f"  list            {plain_seconds:>8.3f}s")
+    print(f"  SortedSequence  {sequence_seconds:>8.3f}s  ({plain_seconds / sequence_seconds:.1f}x faster)")
+    ok &= found == expected and sequence == plain
+    print("✅ Same results as a plain list" if ok else "❌ Results differ!")
+    if not ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()